@@ -0,0 +1,141 @@
+"""
+arXiv Atom 파싱 벤치마크: 전체 트리 파싱(기존) vs 항목 단위 스트리밍 파싱
+
+사용법:
+    python benchmarks/bench_arxiv_parse.py                   # 합성 피드 (5000건)
+    python benchmarks/bench_arxiv_parse.py --entries 20000
+    python benchmarks/bench_arxiv_parse.py --feed saved_arxiv_response.xml
+"""
+import argparse
+import sys
+import time
+import tracemalloc
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from collectors.paper_researcher import ARXIV_CHUNK_SIZE, ArxivFeedParser
+
+
+ENTRY_TEMPLATE = """  <entry>
+    <id>http://arxiv.org/abs/2401.{n:05d}v1</id>
+    <updated>2024-01-15T12:00:00Z</updated>
+    <published>2024-01-15T12:00:00Z</published>
+    <title>Seismic Safety Assessment of Public Facilities, Part {n}</title>
+    <summary>{summary}</summary>
+    <author><name>Author {n} A</name></author>
+    <author><name>Author {n} B</name></author>
+    <author><name>Author {n} C</name></author>
+    <link href="http://arxiv.org/abs/2401.{n:05d}v1" rel="alternate" type="text/html"/>
+    <category term="physics.geo-ph" scheme="http://arxiv.org/schemas/atom"/>
+  </entry>
+"""
+
+SUMMARY = (
+    "We study structural inspection procedures for disaster preparedness "
+    "in public facilities and propose a checklist-driven assessment method. "
+) * 8
+
+
+def build_feed(entries: int) -> bytes:
+    """합성 arXiv Atom 피드 생성"""
+    parts = [
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<feed xmlns="http://www.w3.org/2005/Atom">\n'
+        '  <title type="html">ArXiv Query: all:safety</title>\n'
+        '  <id>http://arxiv.org/api/benchmark</id>\n'
+    ]
+    parts.extend(ENTRY_TEMPLATE.format(n=n, summary=SUMMARY) for n in range(entries))
+    parts.append('</feed>\n')
+
+    return ''.join(parts).encode('utf-8')
+
+
+def parse_tree(content: bytes):
+    """기존 구현: 전체 응답으로 트리를 만든 뒤 항목 순회"""
+    root = ET.fromstring(content)
+    ns = {'atom': 'http://www.w3.org/2005/Atom'}
+    results = []
+
+    for entry in root.findall('atom:entry', ns):
+        title = entry.find('atom:title', ns)
+        authors = [
+            name.text
+            for author in entry.findall('atom:author', ns)
+            for name in [author.find('atom:name', ns)]
+            if name is not None
+        ]
+        published = entry.find('atom:published', ns)
+        summary = entry.find('atom:summary', ns)
+        link = entry.find('atom:id', ns)
+
+        results.append({
+            'title': title.text.strip() if title is not None else '',
+            'authors': authors,
+            'year': int(published.text[:4]) if published is not None else None,
+            'abstract': summary.text[:500] if summary is not None else '',
+            'url': link.text if link is not None else ''
+        })
+
+    return results, None
+
+
+def parse_streaming(content: bytes):
+    """스트리밍 구현: 청크 단위로 넣으면서 완성된 항목부터 반환"""
+    started = time.perf_counter()
+    first = None
+    parser = ArxivFeedParser()
+    results = []
+
+    for offset in range(0, len(content), ARXIV_CHUNK_SIZE):
+        results.extend(parser.feed(content[offset:offset + ARXIV_CHUNK_SIZE]))
+        if first is None and results:
+            first = time.perf_counter() - started
+    results.extend(parser.close())
+
+    return results, first
+
+
+def measure(fn, content: bytes, repeat: int):
+    """최소 실행 시간, 첫 결과까지 시간, 최대 메모리 측정"""
+    best = float('inf')
+    first = None
+
+    for _ in range(repeat):
+        started = time.perf_counter()
+        results, first_at = fn(content)
+        elapsed = time.perf_counter() - started
+        if elapsed < best:
+            best = elapsed
+            first = first_at if first_at is not None else elapsed
+
+    tracemalloc.start()
+    fn(content)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return len(results), best, first, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description='arXiv Atom 파싱 벤치마크')
+    parser.add_argument('--entries', type=int, default=5000, help='합성 피드 항목 수')
+    parser.add_argument('--feed', help='저장해 둔 arXiv 응답 파일 (지정 시 합성 피드 대신 사용)')
+    parser.add_argument('--repeat', type=int, default=3, help='반복 횟수 (최소 시간 사용)')
+    args = parser.parse_args()
+
+    content = Path(args.feed).read_bytes() if args.feed else build_feed(args.entries)
+    print(f"피드 크기: {len(content) / 1024 / 1024:.1f} MB\n")
+
+    print(f"{'구현':<12}{'항목':>8}{'전체(ms)':>12}{'첫 결과(ms)':>14}{'최대 메모리(MB)':>18}")
+    for label, fn in (('tree', parse_tree), ('streaming', parse_streaming)):
+        count, total, first, peak = measure(fn, content, args.repeat)
+        print(
+            f"{label:<12}{count:>8}{total * 1000:>12.1f}"
+            f"{first * 1000:>14.1f}{peak / 1024 / 1024:>18.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
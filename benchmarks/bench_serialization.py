@@ -0,0 +1,115 @@
+"""
+JSON 직렬화 벤치마크: 표준 json vs orjson (체크리스트 결과 페이로드 기준)
+
+실제 생성 경로와 같은 방식으로 템플릿 × 합성 리서치 자료로 체크리스트를 만든 뒤,
+내보내기(pretty), DB 저장(compact), 목록 조회(loads) 시간을 비교합니다.
+
+사용법:
+    python benchmarks/bench_serialization.py                 # 자료 200건, 정기 점검
+    python benchmarks/bench_serialization.py --items 1000 --repeat 20
+"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from checklist.generator import ChecklistGenerator
+from checklist.models import json_default
+from utils import serialization
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+WORDS = ['재난', '안전', '점검', '대피', '소방', '시설', '위험', '구조', '설비', '훈련']
+
+
+def build_research(items: int):
+    """합성 리서치 자료 (web, papers, tech, apis)"""
+    def words(n):
+        return ' '.join(WORDS[(n + i) % len(WORDS)] for i in range(6))
+
+    return {
+        'web': [
+            {
+                'title': f'{words(n)} 가이드 {n}', 'url': f'https://example.go.kr/{n}',
+                'source': 'example.go.kr', 'summary': words(n) * 8,
+                'credibility_score': 0.5 + (n % 5) / 10
+            }
+            for n in range(items)
+        ],
+        'papers': [
+            {
+                'title': f'Seismic safety {words(n)} {n}', 'url': f'https://arxiv.org/abs/2401.{n:05d}',
+                'authors': ['A Kim', 'B Lee', 'C Park'], 'year': 2024, 'citations': n,
+                'source': 'arxiv', 'abstract': words(n) * 10
+            }
+            for n in range(items // 2)
+        ],
+        'tech': [
+            {
+                'name': f'safety-tool-{n}', 'url': f'https://github.com/example/tool-{n}',
+                'description': words(n), 'stars': n * 3, 'language': 'Python', 'source': 'github'
+            }
+            for n in range(items // 4)
+        ],
+        'apis': []
+    }
+
+
+def time_best(fn, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='JSON 직렬화 벤치마크')
+    parser.add_argument('--items', type=int, default=200, help='웹 자료 수 (논문·기술 자료는 비례)')
+    parser.add_argument('--phase', default='정기 점검', help='점검 단계')
+    parser.add_argument('--repeat', type=int, default=10, help='반복 횟수 (최소 시간 사용)')
+    args = parser.parse_args()
+
+    generator = ChecklistGenerator(config={
+        'cache_enabled': False,
+        'relevance_ranking': {'method': 'credibility'}
+    })
+    result = generator._build_result('안전', '지자체', args.phase, None, build_research(args.items))
+    checklist = result['checklist']
+
+    stored = json.dumps(checklist, ensure_ascii=False, default=json_default)
+    print(f"체크리스트 JSON 크기: {len(stored.encode('utf-8')) / 1024:.1f} KB")
+    print(f"설치된 백엔드: {serialization.BACKEND}\n")
+
+    cases = {
+        'json': {
+            'export (pretty)': lambda: json.dumps(
+                result, indent=2, ensure_ascii=False, default=json_default
+            ).encode('utf-8'),
+            'store (compact)': lambda: json.dumps(checklist, ensure_ascii=False, default=json_default),
+            'load': lambda: json.loads(stored)
+        }
+    }
+    if orjson is not None:
+        cases['orjson'] = {
+            'export (pretty)': lambda: serialization.dumps_bytes(result, pretty=True, default=json_default),
+            'store (compact)': lambda: serialization.dumps(checklist, default=json_default),
+            'load': lambda: serialization.loads(stored)
+        }
+
+    print(f"{'백엔드':<10}{'작업':<18}{'시간(ms)':>12}")
+    for backend, operations in cases.items():
+        for label, fn in operations.items():
+            print(f"{backend:<10}{label:<18}{time_best(fn, args.repeat) * 1000:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
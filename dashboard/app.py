@@ -1,50 +1,265 @@
 """
 재난·안전 체크리스트 대시보드 - FastAPI 앱
 """
+import asyncio
+import hashlib
+import logging
+import os
 import sys
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 # src 디렉토리를 Python 경로에 추가
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
 from fastapi import FastAPI, Request, Form, HTTPException
-from fastapi.responses import HTMLResponse, JSONResponse, FileResponse
+from fastapi.responses import HTMLResponse, JSONResponse, FileResponse, Response, StreamingResponse
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from typing import Optional
+from typing import Optional, Tuple
+from urllib.parse import quote
 import uvicorn
 
 from utils.config import config
 from checklist.generator import ChecklistGenerator
+from checklist.exporter import ExportPipeline
 from checklist.templates import ChecklistTemplates, FacilityType, CheckPhase, FocusArea
+from collectors.async_http import aclose_async_client
+from collectors.http_session import get_connection_stats
+from collectors.ratelimit import RATE_LIMIT_PROCESSES_ENV
+from collectors.singleflight import research_flights
+from utils import compression, serialization
+from utils.events import LogSubscriber, event_bus, setup_queued_logging
 from database import Database
+from generation import GenerationExecutor, GenerationQueueFull
+from jobs import JobStatus, JobWorkerPool
 
-# FastAPI 앱 생성
+
+logger = logging.getLogger('checklist.dashboard')
+
+# SSE 스트림의 이벤트 조회 간격과 연결 유지 주석 간격(초)
+SSE_POLL_INTERVAL = 0.5
+SSE_KEEPALIVE_INTERVAL = 15.0
+
+# 다운로드 본문은 바뀌지 않으므로 오래 캐시하고, 페이지·API는 삭제와 내보내기 경로
+# 기록을 반영하도록 매번 재검증 (ETag가 같으면 304)
+DOWNLOAD_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+PROJECT_CACHE_CONTROL = 'no-cache'
+
+# 설정되어 있으면 작업 워커를 웹 워커가 아닌 감독 프로세스(serve)에서 실행
+EXTERNAL_JOB_WORKERS_ENV = 'CHECKLIST_EXTERNAL_JOB_WORKERS'
+
+dashboard_dir = Path(__file__).parent
+
+
+def collector_processes(web_workers: int = 1) -> int:
+    """리서치를 수집하는 프로세스 수 (작업 워커가 있으면 작업 워커, 없으면 웹 워커)"""
+    return config.get('jobs.workers', 2) or web_workers
+
+
+def create_job_pool(db_path, external: bool = False) -> JobWorkerPool:
+    """설정에 따른 작업 워커 풀 (workers=0이면 리서치 수집도 요청 안에서 실행)"""
+    jobs_config = config.get('jobs', {})
+    return JobWorkerPool(
+        db_path,
+        config.settings,
+        workers=jobs_config.get('workers', 2),
+        poll_interval=jobs_config.get('poll_interval', 1.0),
+        lease_seconds=jobs_config.get('lease_seconds', 300),
+        max_attempts=jobs_config.get('max_attempts', 3),
+        external=external
+    )
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    프로세스별 상태 생성·정리
+
+    웹 워커 프로세스마다 한 번 실행되며, 요청 처리기는 request.app.state로
+    접근합니다. 프로세스 사이에 공유되는 것은 SQLite(WAL)와 출력 디렉토리뿐이고
+    생성기 캐시, 실행기, HTTP 클라이언트는 프로세스마다 따로 만듭니다.
+    """
+    state = app.state
+
+    # serve() 없이 실행된 경우 이 프로세스의 작업 워커 수로 속도 제한을 나눔
+    # (생성기와 작업 워커가 시작할 때 읽음)
+    os.environ.setdefault(RATE_LIMIT_PROCESSES_ENV, str(collector_processes()))
+
+    # 생성 이벤트를 큐 기반 로그로 출력 (요청 처리 중에는 큐에 넣기만 함)
+    state.log_listener = setup_queued_logging()
+    unsubscribe_events = event_bus.subscribe(LogSubscriber())
+
+    # 데이터베이스 및 생성기 초기화
+    state.db = Database()
+    state.generator = ChecklistGenerator(config.settings)
+    state.template_manager = ChecklistTemplates()
+
+    # 생성 동시 실행 수와 대기열 제한 (가득 차면 429, 웹 워커별 제한)
+    generation_config = config.get('generation', {})
+    state.generation_executor = GenerationExecutor(
+        max_concurrent=generation_config.get('max_concurrent', 4),
+        max_queue=generation_config.get('max_queue', 16),
+        retry_after=generation_config.get('retry_after', 10)
+    )
+
+    # 파일 내보내기는 응답 후 백그라운드 I/O 스레드에서 기록
+    state.exporter = ExportPipeline(
+        state.generator,
+        background=config.get('export.background', True)
+    )
+
+    # 리서치 수집이 포함된 생성은 작업 큐에 등록하고 워커 프로세스에서 실행
+    # (재시작 전 실행 중이던 작업은 lease 만료 후 다시 실행)
+    state.job_pool = create_job_pool(
+        state.db.db_path,
+        external=bool(os.environ.get(EXTERNAL_JOB_WORKERS_ENV))
+    )
+    state.job_pool.start()
+
+    try:
+        yield
+    finally:
+        state.job_pool.stop()
+        await aclose_async_client()
+
+        # 대기 중인 파일 내보내기 완료
+        state.exporter.shutdown(wait=True)
+        state.generation_executor.shutdown(wait=True)
+
+        # 이벤트 로그 구독 해제 및 남은 로그 출력
+        unsubscribe_events()
+        state.log_listener.stop()
+
+
+# FastAPI 앱 생성 (상태는 lifespan에서 프로세스마다 생성)
 app = FastAPI(
     title="재난·안전 체크리스트 대시보드",
     description="재난·안전 체크리스트 자동 생성 시스템",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
+# API·HTML 응답 압축 (미리 압축한 다운로드처럼 Content-Encoding이 있는 응답은 그대로 전송)
+app.add_middleware(GZipMiddleware, minimum_size=config.get('dashboard.gzip_minimum_size', 1000))
+
 # 정적 파일 및 템플릿 설정
-dashboard_dir = Path(__file__).parent
 app.mount("/static", StaticFiles(directory=dashboard_dir / "static"), name="static")
 templates = Jinja2Templates(directory=dashboard_dir / "templates")
 
-# 데이터베이스 및 생성기 초기화
-db = Database()
-generator = ChecklistGenerator(config.settings)
-template_manager = ChecklistTemplates()
+
+def _stored_checklist_data(project: dict) -> dict:
+    """저장된 프로젝트 행에서 내보내기 형식의 체크리스트 데이터 구성"""
+    return {
+        'metadata': project.get('metadata') or {},
+        'checklist': project['checklist_data'],
+        'research_summary': project.get('research_summary') or {},
+        'recommendations': project.get('recommendations') or []
+    }
+
+
+def _project_etag(project_id: int, version: dict, representation: str, encoding: str = 'identity') -> str:
+    """
+    프로젝트 응답의 강한 ETag
+
+    체크리스트 내용은 저장 후 바뀌지 않지만, 내보내기가 끝나면 파일 경로
+    (output_path_md, output_path_json)가 기록되므로 (id, 생성 시각, 파일 경로)로
+    본문이 정해집니다. 같은 프로젝트라도 표현(HTML, API JSON, 다운로드 형식)과 본문
+    인코딩마다, 그리고 앱 버전마다 본문 바이트가 다르므로 함께 넣습니다.
+    """
+    raw = (
+        f"{project_id}:{version['created_at']}:{version['output_path_md']}:"
+        f"{version['output_path_json']}:{representation}:{encoding}:{app.version}"
+    )
+    return f'"{project_id}-{hashlib.sha256(raw.encode()).hexdigest()[:16]}"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """If-None-Match가 ETag와 일치하는지 (약한 비교, '*' 포함)"""
+    header = request.headers.get('if-none-match')
+    if not header:
+        return False
+
+    for candidate in header.split(','):
+        candidate = candidate.strip()
+        if candidate == '*' or candidate.removeprefix('W/') == etag:
+            return True
+    return False
+
+
+def _cache_headers(etag: str, cache_control: str) -> dict:
+    return {'ETag': etag, 'Cache-Control': cache_control}
+
+
+def _negotiate_encoding(request: Request, file_path: str = None) -> Tuple[Optional[str], str]:
+    """
+    응답 본문 인코딩 결정
+
+    Args:
+        request: 요청 (Accept-Encoding)
+        file_path: 내보낸 파일 경로 (있으면 미리 압축한 사본을 찾음)
+
+    Returns:
+        (보낼 압축 사본의 인코딩 또는 None, ETag에 넣을 인코딩)
+        사본이 없으면 GZip 미들웨어가 압축할 수 있으므로 gzip 수락 여부를 ETag에 반영
+        (미들웨어와 같은 부분 문자열 검사를 써야 'gzip;q=0'처럼 q값으로 거부한 요청도
+        실제로 보낸 본문과 같은 ETag를 받음)
+    """
+    accept_encoding = request.headers.get('accept-encoding', '')
+
+    if file_path:
+        available = [
+            encoding for encoding in compression.ENCODINGS
+            if compression.sibling_path(file_path, encoding).exists()
+        ]
+        precompressed = compression.choose_encoding(accept_encoding, available)
+        if precompressed:
+            return precompressed, precompressed
+
+    dynamic = 'gzip' in accept_encoding
+    return None, 'gzip-dynamic' if dynamic else 'identity'
+
+
+def _precompressed_response(file_path: str, encoding: str, media_type: str, filename: str, headers: dict) -> FileResponse:
+    """미리 압축한 사본을 그대로 전송 (요청마다 압축하지 않음)"""
+    return FileResponse(
+        compression.sibling_path(file_path, encoding),
+        media_type=media_type,
+        headers={
+            **headers,
+            'Content-Encoding': encoding,
+            'Vary': 'Accept-Encoding',
+            'Content-Disposition': f"attachment; filename*=UTF-8''{quote(filename)}"
+        }
+    )
+
+
+def _schedule_export(state, project_id: int, result: dict) -> None:
+    """파일 내보내기 등록 (파일이 모두 기록된 뒤에 DB에 경로 기록)"""
+    db = state.db
+
+    def record_paths(md_path: str, json_path: str) -> None:
+        db.update_output_paths(project_id, md_path, json_path)
+
+    def report_failure(future) -> None:
+        error = future.exception()
+        if error is not None:
+            logger.warning("프로젝트 %s 파일 내보내기 실패: %s", project_id, error)
+
+    state.exporter.submit(result, on_complete=record_paths).add_done_callback(report_failure)
 
 
 @app.get("/", response_class=HTMLResponse)
 async def index(request: Request):
     """메인 페이지"""
+    state = request.app.state
+
     # 통계 정보
-    stats = db.get_stats()
+    stats = state.db.get_stats()
 
     # 최근 프로젝트 (최대 5개)
-    recent_projects = db.get_all_projects(limit=5, offset=0)
+    recent_projects = state.db.get_all_projects(limit=5, offset=0)
 
     # 템플릿 정보
     facility_types = [ft.value for ft in FacilityType]
@@ -63,28 +278,45 @@ async def index(request: Request):
 
 @app.post("/api/generate")
 async def generate_checklist(
+    request: Request,
     keyword: str = Form(...),
     facility_type: str = Form(...),
     check_phase: str = Form(...),
     focus_area: Optional[str] = Form(None),
     collect_data: bool = Form(False)
 ):
-    """체크리스트 생성 API"""
+    """체크리스트 생성 API (리서치 수집 포함 시 작업 id를 바로 반환)"""
+    state = request.app.state
+
+    if collect_data and state.job_pool.enabled:
+        job_id = state.db.create_job({
+            'keyword': keyword,
+            'facility_type': facility_type,
+            'check_phase': check_phase,
+            'focus_area': focus_area,
+            'collect_data': collect_data
+        })
+
+        return JSONResponse({
+            "success": True,
+            "job_id": job_id,
+            "status": JobStatus.QUEUED.value,
+            "status_url": f"/api/jobs/{job_id}",
+            "message": "체크리스트 생성 작업이 등록되었습니다."
+        }, status_code=202)
+
     try:
-        # 체크리스트 생성
-        result = generator.generate(
+        # 체크리스트 생성 (리서치 수집은 이벤트 루프에서 비동기로, 결과 구성은 생성 스레드 풀에서 실행)
+        result = await state.generation_executor.run(lambda: state.generator.agenerate(
             keyword=keyword,
             facility_type=facility_type,
             check_phase=check_phase,
             focus_area=focus_area,
-            collect_data=collect_data
-        )
+            collect_data=collect_data,
+            executor=state.generation_executor.threads
+        ))
 
-        # Markdown 파일 저장
-        md_path = generator.export_to_markdown(result)
-        json_path = generator.export_to_json(result)
-
-        # 데이터베이스에 저장
+        # 데이터베이스에 저장 (파일 경로는 내보내기가 끝난 뒤 기록)
         project_data = {
             'keyword': keyword,
             'facility_type': facility_type,
@@ -94,11 +326,11 @@ async def generate_checklist(
             'metadata': result.get('metadata'),
             'checklist': result.get('checklist'),
             'research_summary': result.get('research_summary'),
-            'output_path_md': md_path,
-            'output_path_json': json_path
+            'recommendations': result.get('recommendations')
         }
 
-        project_id = db.save_project(project_data)
+        project_id = state.db.save_project(project_data)
+        _schedule_export(state, project_id, result)
 
         return JSONResponse({
             "success": True,
@@ -106,6 +338,12 @@ async def generate_checklist(
             "message": "체크리스트가 생성되었습니다."
         })
 
+    except GenerationQueueFull as e:
+        return JSONResponse({
+            "success": False,
+            "error": str(e)
+        }, status_code=429, headers={"Retry-After": str(e.retry_after)})
+
     except Exception as e:
         return JSONResponse({
             "success": False,
@@ -115,8 +353,19 @@ async def generate_checklist(
 
 @app.get("/result/{project_id}", response_class=HTMLResponse)
 async def show_result(request: Request, project_id: int):
-    """결과 페이지"""
-    project = db.get_project(project_id)
+    """결과 페이지 (ETag가 같으면 304)"""
+    state = request.app.state
+
+    version = state.db.get_project_version(project_id)
+    if not version:
+        raise HTTPException(status_code=404, detail="프로젝트를 찾을 수 없습니다.")
+
+    _, encoding = _negotiate_encoding(request)
+    headers = _cache_headers(_project_etag(project_id, version, 'html', encoding), PROJECT_CACHE_CONTROL)
+    if _etag_matches(request, headers['ETag']):
+        return Response(status_code=304, headers=headers)
+
+    project = state.db.get_project(project_id)
 
     if not project:
         raise HTTPException(status_code=404, detail="프로젝트를 찾을 수 없습니다.")
@@ -136,7 +385,7 @@ async def show_result(request: Request, project_id: int):
         "research_summary": research_summary,
         "metadata": metadata,
         "total_questions": total_questions
-    })
+    }, headers=headers)
 
 
 @app.get("/projects", response_class=HTMLResponse)
@@ -146,20 +395,22 @@ async def list_projects(
     keyword: Optional[str] = None
 ):
     """프로젝트 목록 페이지"""
+    state = request.app.state
+
     limit = 20
     offset = (page - 1) * limit
 
-    projects = db.get_all_projects(
+    projects = state.db.get_all_projects(
         limit=limit,
         offset=offset,
         keyword_filter=keyword
     )
 
-    total_count = db.get_project_count(keyword_filter=keyword)
+    total_count = state.db.get_project_count(keyword_filter=keyword)
     total_pages = (total_count + limit - 1) // limit
 
     # 통계 정보 (필터링용)
-    stats = db.get_stats()
+    stats = state.db.get_stats()
 
     return templates.TemplateResponse("list.html", {
         "request": request,
@@ -172,9 +423,11 @@ async def list_projects(
 
 
 @app.delete("/api/projects/{project_id}")
-async def delete_project(project_id: int):
+async def delete_project(request: Request, project_id: int):
     """프로젝트 삭제 API"""
-    success = db.delete_project(project_id)
+    state = request.app.state
+
+    success = state.db.delete_project(project_id)
 
     if success:
         return JSONResponse({"success": True, "message": "삭제되었습니다."})
@@ -183,70 +436,285 @@ async def delete_project(project_id: int):
 
 
 @app.get("/api/projects/{project_id}")
-async def get_project_api(project_id: int):
-    """프로젝트 조회 API (JSON)"""
-    project = db.get_project(project_id)
+async def get_project_api(request: Request, project_id: int):
+    """프로젝트 조회 API (JSON, ETag가 같으면 304)"""
+    state = request.app.state
+
+    version = state.db.get_project_version(project_id)
+    if not version:
+        raise HTTPException(status_code=404, detail="프로젝트를 찾을 수 없습니다.")
+
+    _, encoding = _negotiate_encoding(request)
+    headers = _cache_headers(_project_etag(project_id, version, 'api', encoding), PROJECT_CACHE_CONTROL)
+    if _etag_matches(request, headers['ETag']):
+        return Response(status_code=304, headers=headers)
+
+    project = state.db.get_project(project_id)
 
     if not project:
         raise HTTPException(status_code=404, detail="프로젝트를 찾을 수 없습니다.")
 
-    return JSONResponse(project)
+    return JSONResponse(project, headers=headers)
+
+
+@app.get("/api/jobs/{job_id}")
+async def get_job_api(request: Request, job_id: int):
+    """생성 작업 상태 API (완료 시 프로젝트 링크 포함)"""
+    state = request.app.state
+
+    job = state.db.get_job(job_id)
+
+    if not job:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+
+    if job['status'] == JobStatus.COMPLETED and job.get('project_id'):
+        job['project_url'] = f"/result/{job['project_id']}"
+        job['project_api_url'] = f"/api/projects/{job['project_id']}"
+
+    return JSONResponse(job)
+
+
+def _sse_message(event_id: int, event_type: str, data: dict) -> str:
+    """Server-Sent Events 메시지 한 건"""
+    return f"id: {event_id}\nevent: {event_type}\ndata: {serialization.dumps(data)}\n\n"
+
+
+@app.get("/api/jobs/{job_id}/events")
+async def stream_job_events(request: Request, job_id: int):
+    """
+    생성 작업 진행 이벤트 스트림 (Server-Sent Events)
+
+    워커가 기록한 단계 시작·종료, 소스별 수집 결과, 파일 기록 이벤트를 순서대로
+    보냅니다. Last-Event-ID로 재연결하면 그 이후부터 이어서 보내고, 작업이 끝나면
+    최종 작업 상태를 담은 end 이벤트를 보낸 뒤 스트림을 닫습니다.
+    """
+    state = request.app.state
+
+    if not state.db.get_job(job_id):
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+
+    try:
+        last_id = int(request.headers.get('last-event-id', 0))
+    except ValueError:
+        last_id = 0
+
+    async def stream():
+        nonlocal last_id
+        batch_size = 500
+        idle = 0.0
+
+        while not await request.is_disconnected():
+            # 상태를 먼저 읽어야 완료 전에 기록된 이벤트를 빠짐없이 보냄
+            job = await asyncio.to_thread(state.db.get_job, job_id)
+            events = await asyncio.to_thread(state.db.get_job_events, job_id, last_id, batch_size)
+
+            for event in events:
+                last_id = event.pop('id')
+                yield _sse_message(last_id, event['type'], event)
+
+            finished = job is None or job['status'] in (JobStatus.COMPLETED, JobStatus.FAILED)
+            if finished and len(events) < batch_size:
+                yield _sse_message(last_id, 'end', job or {'id': job_id, 'status': 'deleted'})
+                return
+
+            if events:
+                idle = 0.0
+                continue
+
+            await asyncio.sleep(SSE_POLL_INTERVAL)
+            idle += SSE_POLL_INTERVAL
+            if idle >= SSE_KEEPALIVE_INTERVAL:
+                idle = 0.0
+                yield ": keep-alive\n\n"
+
+    return StreamingResponse(
+        stream(),
+        media_type='text/event-stream',
+        headers={
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no'
+        }
+    )
 
 
 @app.get("/download/{project_id}/markdown")
-async def download_markdown(project_id: int):
-    """Markdown 파일 다운로드"""
-    project = db.get_project(project_id)
+async def download_markdown(request: Request, project_id: int):
+    """
+    Markdown 다운로드 (재검증 시 304)
 
-    if not project or not project.get('output_path_md'):
-        raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다.")
+    내보낸 파일의 압축 사본이 있고 클라이언트가 받으면 그 사본을 보내고, 아니면
+    저장된 프로젝트 데이터에서 바로 렌더링해 스트리밍합니다.
+    """
+    state = request.app.state
 
-    file_path = project['output_path_md']
-    if not Path(file_path).exists():
-        raise HTTPException(status_code=404, detail="파일이 존재하지 않습니다.")
+    version = state.db.get_project_version(project_id)
+    if not version:
+        raise HTTPException(status_code=404, detail="프로젝트를 찾을 수 없습니다.")
 
-    return FileResponse(
-        file_path,
-        media_type='text/markdown',
-        filename=Path(file_path).name
+    precompressed, encoding = _negotiate_encoding(request, version['output_path_md'])
+    representation = 'markdown-file' if precompressed else 'markdown'
+    headers = _cache_headers(_project_etag(project_id, version, representation, encoding), DOWNLOAD_CACHE_CONTROL)
+    if _etag_matches(request, headers['ETag']):
+        return Response(status_code=304, headers=headers)
+
+    filename = f"checklist_{version['keyword']}_{project_id}.md"
+
+    if precompressed:
+        return _precompressed_response(
+            version['output_path_md'], precompressed,
+            'text/markdown; charset=utf-8', filename, headers
+        )
+
+    project = state.db.get_project(project_id)
+
+    if not project or not project.get('checklist_data'):
+        raise HTTPException(status_code=404, detail="프로젝트를 찾을 수 없습니다.")
+
+    return StreamingResponse(
+        state.generator.iter_markdown(_stored_checklist_data(project)),
+        media_type='text/markdown; charset=utf-8',
+        headers={
+            **headers,
+            'Content-Disposition': f"attachment; filename*=UTF-8''{quote(filename)}"
+        }
     )
 
 
 @app.get("/download/{project_id}/json")
-async def download_json(project_id: int):
-    """JSON 파일 다운로드"""
-    project = db.get_project(project_id)
+async def download_json(request: Request, project_id: int):
+    """
+    JSON 파일 다운로드 (재검증 시 304)
+
+    내보낸 파일이 있으면 클라이언트가 받는 압축 사본(br, gzip) 또는 원본을 보내고,
+    내보내기가 아직 끝나지 않았으면 저장된 데이터로 응답합니다.
+    """
+    state = request.app.state
 
-    if not project or not project.get('output_path_json'):
+    version = state.db.get_project_version(project_id)
+    if not version:
         raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다.")
 
-    file_path = project['output_path_json']
+    file_path = version['output_path_json']
+
+    # 내보낸 파일과 저장된 데이터로 만든 본문은 바이트가 다를 수 있으므로 ETag를 구분
+    precompressed, encoding = _negotiate_encoding(request, file_path)
+    representation = 'json-file' if file_path else 'json'
+    headers = _cache_headers(_project_etag(project_id, version, representation, encoding), DOWNLOAD_CACHE_CONTROL)
+    if _etag_matches(request, headers['ETag']):
+        return Response(status_code=304, headers=headers)
+
+    if not file_path:
+        project = state.db.get_project(project_id)
+
+        if not project or not project.get('checklist_data'):
+            raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다.")
+
+        filename = f"checklist_{project['keyword']}_{project_id}.json"
+        return Response(
+            serialization.dumps_bytes(_stored_checklist_data(project), pretty=True),
+            media_type='application/json',
+            headers={
+                **headers,
+                'Content-Disposition': f"attachment; filename*=UTF-8''{quote(filename)}"
+            }
+        )
+
+    if precompressed:
+        return _precompressed_response(
+            file_path, precompressed, 'application/json', Path(file_path).name, headers
+        )
+
     if not Path(file_path).exists():
         raise HTTPException(status_code=404, detail="파일이 존재하지 않습니다.")
 
     return FileResponse(
         file_path,
         media_type='application/json',
-        filename=Path(file_path).name
+        filename=Path(file_path).name,
+        headers=headers
     )
 
 
 @app.get("/api/stats")
-async def get_stats():
+async def get_stats(request: Request):
     """통계 API"""
-    stats = db.get_stats()
+    state = request.app.state
+
+    stats = state.db.get_stats()
     return JSONResponse(stats)
 
 
+@app.get("/api/metrics")
+async def get_metrics(request: Request):
+    """리서치 수집 지표 API (HTTP 연결 재사용 등)"""
+    state = request.app.state
+
+    cache = state.generator.research_cache
+
+    return JSONResponse({
+        "http": get_connection_stats(),
+        "cache": cache.get_stats() if cache else None,
+        "coalescing": research_flights.get_stats(),
+        "generation": state.generation_executor.get_stats(),
+        "jobs": {
+            **state.job_pool.get_stats(),
+            "counts": state.db.get_job_counts()
+        }
+    })
+
+
 @app.get("/health")
 async def health_check():
     """헬스 체크"""
     return {"status": "healthy", "version": "1.0.0"}
 
 
+def resolve_workers(workers: int = None) -> int:
+    """웹 워커 프로세스 수 (인자 > WEB_CONCURRENCY 환경변수 > dashboard.workers 설정)"""
+    if workers is None:
+        workers = os.environ.get("WEB_CONCURRENCY") or config.get('dashboard.workers', 1)
+    return max(1, int(workers))
+
+
+def serve(host: str, port: int, workers: int = None, log_level: str = "info") -> None:
+    """
+    대시보드 서버 실행
+
+    웹 워커가 1개면 이 프로세스에서 바로 실행합니다. 여러 개면 uvicorn이 워커
+    프로세스를 띄우고(각자 lifespan으로 상태 생성), 작업 워커 풀은 웹 워커마다
+    만들지 않도록 이 감독 프로세스에서 한 번만 실행합니다.
+
+    속도 제한 버킷과 요청 병합(single-flight)은 프로세스마다 따로 있으므로,
+    설정된 rate_limits를 수집 프로세스 수(collector_processes)로 나눠 각 프로세스에
+    적용합니다. 그래서 한 프로세스만 바쁠 때는 설정보다 느리게 요청하고, 같은
+    키워드를 여러 프로세스가 동시에 수집하면 요청이 합쳐지지 않습니다.
+    """
+    workers = resolve_workers(workers)
+    os.environ[RATE_LIMIT_PROCESSES_ENV] = str(collector_processes(workers))
+
+    if workers == 1:
+        uvicorn.run(app, host=host, port=port, log_level=log_level)
+        return
+
+    job_pool = create_job_pool(Database().db_path)
+    os.environ[EXTERNAL_JOB_WORKERS_ENV] = "1"
+    job_pool.start()
+
+    try:
+        uvicorn.run(
+            "app:app",
+            app_dir=str(dashboard_dir),
+            host=host,
+            port=port,
+            workers=workers,
+            log_level=log_level
+        )
+    finally:
+        job_pool.stop()
+
+
 if __name__ == "__main__":
     import socket
-    import os
 
     # 포트는 환경변수에서 가져오기 (클라우드 배포 대응)
     port = int(os.environ.get("PORT", 8000))
@@ -264,8 +732,9 @@ if __name__ == "__main__":
     print(f"\n  🌐 로컬 접속: http://localhost:{port}")
     print(f"  🌍 네트워크 접속: http://{local_ip}:{port}")
     print(f"  📚 API 문서: http://localhost:{port}/docs")
+    print(f"  ⚙️  웹 워커: {resolve_workers()}개")
     print("\n  💡 외부 접속을 위해 방화벽 포트를 열어주세요.")
     print("  🛑 종료하려면 Ctrl+C를 누르세요.\n")
 
     # 0.0.0.0으로 변경하여 외부 접속 허용
-    uvicorn.run(app, host="0.0.0.0", port=port, log_level="info")
+    serve(host="0.0.0.0", port=port)
@@ -2,15 +2,23 @@
 대시보드용 SQLite 데이터베이스 관리
 """
 import sqlite3
-import json
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 
+from utils import serialization
+
 
 class Database:
     """프로젝트 관리용 데이터베이스"""
 
+    # JSON으로 저장하는 컬럼
+    JSON_FIELDS = ('metadata', 'checklist_data', 'research_summary', 'recommendations')
+
+    # 잠금 대기 시간(초)
+    BUSY_TIMEOUT = 10
+
     def __init__(self, db_path: str = None):
         if db_path is None:
             db_path = Path(__file__).parent.parent / "data" / "projects.db"
@@ -20,9 +28,15 @@ class Database:
 
         self._init_db()
 
+    def _connect(self, **kwargs) -> sqlite3.Connection:
+        """연결 생성 (다른 프로세스가 쓰는 중이면 잠금이 풀릴 때까지 대기)"""
+        return sqlite3.connect(self.db_path, timeout=self.BUSY_TIMEOUT, **kwargs)
+
     def _init_db(self):
         """데이터베이스 초기화"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
+            # 여러 대시보드 워커·작업 워커 프로세스가 함께 쓰므로 WAL (읽기가 쓰기를 막지 않음)
+            conn.execute("PRAGMA journal_mode=WAL")
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS projects (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -53,41 +67,100 @@ class Database:
             except sqlite3.OperationalError:
                 pass  # 컬럼이 이미 존재
 
+            try:
+                conn.execute("ALTER TABLE projects ADD COLUMN recommendations TEXT")
+            except sqlite3.OperationalError:
+                pass  # 컬럼이 이미 존재
+
+            # 생성 작업 큐 (워커 프로세스가 lease를 잡고 실행)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    status TEXT NOT NULL DEFAULT 'queued',
+                    params TEXT NOT NULL,
+                    stage TEXT,
+                    progress TEXT,
+                    project_id INTEGER,
+                    error TEXT,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    worker TEXT,
+                    lease_expires REAL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    started_at TIMESTAMP,
+                    finished_at TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status, id)"
+            )
+
+            # 작업별 진행 이벤트 (SSE로 전달)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS job_events (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    job_id INTEGER NOT NULL,
+                    type TEXT NOT NULL,
+                    stage TEXT,
+                    data TEXT,
+                    created_at REAL NOT NULL
+                )
+            """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_job_events_job ON job_events (job_id, id)"
+            )
+
             conn.commit()
 
     def save_project(self, project_data: Dict[str, Any]) -> int:
         """프로젝트 저장"""
-        with sqlite3.connect(self.db_path) as conn:
-            # 새 필드와 구 필드 모두 지원
-            facility_type = project_data.get('facility_type') or project_data.get('content_type')
-            check_phase = project_data.get('check_phase') or project_data.get('business_stage')
+        with self._connect() as conn:
+            project_id = self._insert_project(conn, project_data)
+            conn.commit()
+            return project_id
 
-            cursor = conn.execute("""
-                INSERT INTO projects (
-                    keyword, facility_type, check_phase, content_type, business_stage,
-                    focus_area, data_collected, metadata, checklist_data, research_summary,
-                    output_path_md, output_path_json
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                project_data.get('keyword'),
-                facility_type,
-                check_phase,
-                facility_type,  # 하위 호환성을 위해 content_type에도 저장
-                check_phase,    # 하위 호환성을 위해 business_stage에도 저장
-                project_data.get('focus_area'),
-                project_data.get('data_collected', False),
-                json.dumps(project_data.get('metadata', {}), ensure_ascii=False),
-                json.dumps(project_data.get('checklist', {}), ensure_ascii=False),
-                json.dumps(project_data.get('research_summary', {}), ensure_ascii=False),
-                project_data.get('output_path_md'),
-                project_data.get('output_path_json')
-            ))
+    def _insert_project(self, conn: sqlite3.Connection, project_data: Dict[str, Any]) -> int:
+        """프로젝트 행 추가 (커밋은 호출한 쪽에서)"""
+        # 새 필드와 구 필드 모두 지원
+        facility_type = project_data.get('facility_type') or project_data.get('content_type')
+        check_phase = project_data.get('check_phase') or project_data.get('business_stage')
+
+        cursor = conn.execute("""
+            INSERT INTO projects (
+                keyword, facility_type, check_phase, content_type, business_stage,
+                focus_area, data_collected, metadata, checklist_data, research_summary,
+                recommendations, output_path_md, output_path_json
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (
+            project_data.get('keyword'),
+            facility_type,
+            check_phase,
+            facility_type,  # 하위 호환성을 위해 content_type에도 저장
+            check_phase,    # 하위 호환성을 위해 business_stage에도 저장
+            project_data.get('focus_area'),
+            project_data.get('data_collected', False),
+            serialization.dumps(project_data.get('metadata', {})),
+            serialization.dumps(project_data.get('checklist', {})),
+            serialization.dumps(project_data.get('research_summary', {})),
+            serialization.dumps(project_data.get('recommendations', [])),
+            project_data.get('output_path_md'),
+            project_data.get('output_path_json')
+        ))
+        return cursor.lastrowid
+
+    def update_output_paths(self, project_id: int, md_path: str, json_path: str) -> bool:
+        """내보내기 파일 경로 기록 (파일이 모두 기록된 뒤 호출)"""
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE projects SET output_path_md = ?, output_path_json = ? WHERE id = ?",
+                (md_path, json_path, project_id)
+            )
             conn.commit()
-            return cursor.lastrowid
+            return cursor.rowcount > 0
 
     def get_project(self, project_id: int) -> Optional[Dict[str, Any]]:
         """프로젝트 조회"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.execute(
                 "SELECT * FROM projects WHERE id = ?",
@@ -99,6 +172,28 @@ class Database:
                 return self._row_to_dict(row)
             return None
 
+    def get_project_version(self, project_id: int) -> Optional[Dict[str, Any]]:
+        """
+        프로젝트 버전 정보 조회 (JSON 컬럼을 읽지 않는 가벼운 조회, ETag 계산용)
+
+        Returns:
+            {'created_at', 'keyword', 'output_path_md', 'output_path_json'} (없으면 None)
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT created_at, keyword, output_path_md, output_path_json FROM projects WHERE id = ?",
+                (project_id,)
+            ).fetchone()
+
+            if row:
+                return {
+                    'created_at': row[0],
+                    'keyword': row[1],
+                    'output_path_md': row[2],
+                    'output_path_json': row[3]
+                }
+            return None
+
     def get_all_projects(
         self,
         limit: int = 50,
@@ -106,7 +201,7 @@ class Database:
         keyword_filter: str = None
     ) -> List[Dict[str, Any]]:
         """모든 프로젝트 목록 조회"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.row_factory = sqlite3.Row
 
             query = "SELECT * FROM projects"
@@ -126,7 +221,7 @@ class Database:
 
     def delete_project(self, project_id: int) -> bool:
         """프로젝트 삭제"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.execute(
                 "DELETE FROM projects WHERE id = ?",
                 (project_id,)
@@ -136,7 +231,7 @@ class Database:
 
     def get_project_count(self, keyword_filter: str = None) -> int:
         """전체 프로젝트 수"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             query = "SELECT COUNT(*) FROM projects"
             params = []
 
@@ -149,7 +244,7 @@ class Database:
 
     def get_stats(self) -> Dict[str, Any]:
         """통계 정보"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             # 전체 프로젝트 수
             total = conn.execute("SELECT COUNT(*) FROM projects").fetchone()[0]
 
@@ -185,16 +280,233 @@ class Database:
                 'recent_7days': recent
             }
 
+    def create_job(self, params: Dict[str, Any]) -> int:
+        """생성 작업 등록 (queued)"""
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "INSERT INTO jobs (status, params) VALUES ('queued', ?)",
+                (serialization.dumps(params),)
+            )
+            conn.commit()
+            return cursor.lastrowid
+
+    def claim_job(
+        self,
+        worker: str,
+        lease_seconds: float,
+        max_attempts: int = 3
+    ) -> Optional[Dict[str, Any]]:
+        """
+        실행할 작업 하나를 lease로 확보
+
+        대기 중인 작업이나, 실행 중이지만 lease가 만료된 작업(워커 종료, 재시작)을
+        등록 순서대로 가져옵니다. 시도 횟수를 다 쓴 만료 작업은 실패로 기록합니다.
+
+        Returns:
+            확보한 작업 (없으면 None)
+        """
+        now = time.time()
+
+        with self._connect(isolation_level=None) as conn:
+            conn.row_factory = sqlite3.Row
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute("""
+                    UPDATE jobs
+                    SET status = 'failed', error = ?, worker = NULL, lease_expires = NULL,
+                        finished_at = CURRENT_TIMESTAMP, updated_at = CURRENT_TIMESTAMP
+                    WHERE status = 'running' AND lease_expires < ? AND attempts >= ?
+                """, ("작업 시도 횟수를 초과했습니다.", now, max_attempts))
+
+                row = conn.execute("""
+                    SELECT id FROM jobs
+                    WHERE status = 'queued' OR (status = 'running' AND lease_expires < ?)
+                    ORDER BY id
+                    LIMIT 1
+                """, (now,)).fetchone()
+
+                if row is None:
+                    conn.execute("COMMIT")
+                    return None
+
+                conn.execute("""
+                    UPDATE jobs
+                    SET status = 'running', worker = ?, lease_expires = ?,
+                        attempts = attempts + 1, error = NULL,
+                        started_at = COALESCE(started_at, CURRENT_TIMESTAMP),
+                        updated_at = CURRENT_TIMESTAMP
+                    WHERE id = ?
+                """, (worker, now + lease_seconds, row['id']))
+
+                job = conn.execute("SELECT * FROM jobs WHERE id = ?", (row['id'],)).fetchone()
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+        return self._job_to_dict(job)
+
+    def record_job_event(
+        self,
+        job_id: int,
+        worker: str,
+        event: Dict[str, Any],
+        stage: Optional[str] = None,
+        progress: Optional[Dict[str, Any]] = None,
+        lease_seconds: float = 300.0
+    ) -> bool:
+        """
+        진행 이벤트 기록, 현재 단계 갱신(주어진 경우) 및 lease 연장
+
+        Args:
+            event: Event.to_dict() 형식 (type, stage, timestamp, 세부 정보)
+
+        Returns:
+            이 워커가 여전히 작업을 가지고 있으면 True
+        """
+        with self._connect() as conn:
+            conn.execute("""
+                INSERT INTO job_events (job_id, type, stage, data, created_at)
+                VALUES (?, ?, ?, ?, ?)
+            """, (
+                job_id,
+                event['type'],
+                event.get('stage'),
+                serialization.dumps(event),
+                event.get('timestamp', time.time())
+            ))
+
+            cursor = conn.execute("""
+                UPDATE jobs
+                SET stage = COALESCE(?, stage),
+                    progress = COALESCE(?, progress),
+                    lease_expires = ?, updated_at = CURRENT_TIMESTAMP
+                WHERE id = ? AND worker = ? AND status = 'running'
+            """, (
+                stage,
+                serialization.dumps(progress) if progress is not None else None,
+                time.time() + lease_seconds,
+                job_id,
+                worker
+            ))
+            conn.commit()
+            return cursor.rowcount > 0
+
+    def save_job_project(
+        self,
+        job_id: int,
+        worker: str,
+        project_data: Dict[str, Any]
+    ) -> Optional[int]:
+        """
+        작업 결과 프로젝트 저장 (이 워커가 lease를 가지고 있을 때만)
+
+        lease 확인과 저장을 한 트랜잭션에서 하므로, lease를 잃은 워커는 다시 실행 중인
+        워커와 같은 작업의 프로젝트를 중복으로 만들지 못합니다. 이전 시도가 이미
+        프로젝트를 저장했다면 새로 만들지 않고 그 id를 돌려줍니다.
+
+        Returns:
+            프로젝트 id (lease를 잃었으면 None)
+        """
+        with self._connect(isolation_level=None) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute("""
+                    SELECT project_id FROM jobs
+                    WHERE id = ? AND worker = ? AND status = 'running' AND lease_expires >= ?
+                """, (job_id, worker, time.time())).fetchone()
+
+                if row is None:
+                    conn.execute("ROLLBACK")
+                    return None
+
+                project_id = row[0]
+                if project_id is None:
+                    project_id = self._insert_project(conn, project_data)
+                    conn.execute(
+                        "UPDATE jobs SET project_id = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
+                        (project_id, job_id)
+                    )
+
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+        return project_id
+
+    def get_job_events(self, job_id: int, after_id: int = 0, limit: int = 500) -> List[Dict[str, Any]]:
+        """작업 이벤트 조회 (after_id 이후, 기록 순서)"""
+        with self._connect() as conn:
+            rows = conn.execute("""
+                SELECT id, data FROM job_events
+                WHERE job_id = ? AND id > ?
+                ORDER BY id
+                LIMIT ?
+            """, (job_id, after_id, limit)).fetchall()
+
+            return [{'id': row[0], **serialization.loads(row[1])} for row in rows]
+
+    def complete_job(self, job_id: int, worker: str, project_id: int) -> bool:
+        """작업 완료 기록"""
+        with self._connect() as conn:
+            cursor = conn.execute("""
+                UPDATE jobs
+                SET status = 'completed', stage = 'completed', project_id = ?,
+                    worker = NULL, lease_expires = NULL,
+                    finished_at = CURRENT_TIMESTAMP, updated_at = CURRENT_TIMESTAMP
+                WHERE id = ? AND worker = ?
+            """, (project_id, job_id, worker))
+            conn.commit()
+            return cursor.rowcount > 0
+
+    def fail_job(self, job_id: int, worker: str, error: str) -> bool:
+        """작업 실패 기록"""
+        with self._connect() as conn:
+            cursor = conn.execute("""
+                UPDATE jobs
+                SET status = 'failed', error = ?, worker = NULL, lease_expires = NULL,
+                    finished_at = CURRENT_TIMESTAMP, updated_at = CURRENT_TIMESTAMP
+                WHERE id = ? AND worker = ?
+            """, (error, job_id, worker))
+            conn.commit()
+            return cursor.rowcount > 0
+
+    def get_job(self, job_id: int) -> Optional[Dict[str, Any]]:
+        """작업 조회"""
+        with self._connect() as conn:
+            conn.row_factory = sqlite3.Row
+            row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+
+            if row:
+                return self._job_to_dict(row)
+            return None
+
+    def get_job_counts(self) -> Dict[str, int]:
+        """상태별 작업 수"""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT status, COUNT(*) FROM jobs GROUP BY status"
+            ).fetchall()
+            return dict(rows)
+
+    def _job_to_dict(self, row: sqlite3.Row) -> Dict[str, Any]:
+        """작업 Row를 딕셔너리로 변환"""
+        data = dict(row)
+
+        for field in ('params', 'progress'):
+            if data.get(field):
+                data[field] = serialization.loads(data[field])
+
+        return data
+
     def _row_to_dict(self, row: sqlite3.Row) -> Dict[str, Any]:
         """SQLite Row를 딕셔너리로 변환"""
         data = dict(row)
 
         # JSON 필드 파싱
-        if data.get('metadata'):
-            data['metadata'] = json.loads(data['metadata'])
-        if data.get('checklist_data'):
-            data['checklist_data'] = json.loads(data['checklist_data'])
-        if data.get('research_summary'):
-            data['research_summary'] = json.loads(data['research_summary'])
+        for field in self.JSON_FIELDS:
+            if data.get(field):
+                data[field] = serialization.loads(data[field])
 
         return data
@@ -0,0 +1,127 @@
+"""
+생성 작업 실행기: 동시 생성 수와 대기열 길이를 제한하고, 가득 차면 즉시 거절
+"""
+import asyncio
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict
+
+
+class GenerationQueueFull(Exception):
+    """동시 실행과 대기열이 모두 찬 상태"""
+
+    def __init__(self, retry_after: int):
+        super().__init__(f"생성 대기열이 가득 찼습니다. {retry_after}초 후 다시 시도하세요.")
+        self.retry_after = retry_after
+
+
+class GenerationExecutor:
+    """체크리스트 생성 실행기
+
+    최대 max_concurrent개의 생성을 동시에 실행하고, 최대 max_queue개까지 순서를
+    기다리게 합니다. 그 이상 들어온 요청은 기다리지 않고 GenerationQueueFull로
+    거절하므로, 느린 리서치 요청이 쌓여 서버 전체가 멈추지 않습니다.
+    결과 구성처럼 CPU를 쓰는 작업은 같은 크기의 스레드 풀(threads)에서 실행합니다.
+
+    이벤트 루프 하나에서만 사용합니다 (카운터는 루프 스레드에서만 변경).
+    """
+
+    # 완료 시간 이동 평균 가중치 (Retry-After 추정용)
+    DURATION_SMOOTHING = 0.2
+
+    def __init__(
+        self,
+        max_concurrent: int = 4,
+        max_queue: int = 16,
+        retry_after: int = 10
+    ):
+        self.max_concurrent = max(1, int(max_concurrent))
+        self.max_queue = max(0, int(max_queue))
+        self.retry_after = max(1, int(retry_after))
+
+        self.threads = ThreadPoolExecutor(
+            max_workers=self.max_concurrent,
+            thread_name_prefix='generate'
+        )
+
+        self._semaphore = None
+        self._pending = 0
+        self._running = 0
+        self._avg_duration = None
+        self._stats = {'accepted': 0, 'rejected': 0, 'completed': 0, 'failed': 0}
+
+    @property
+    def capacity(self) -> int:
+        """동시 실행 + 대기 가능한 최대 요청 수"""
+        return self.max_concurrent + self.max_queue
+
+    def _retry_after(self) -> int:
+        """대기열이 한 차례 비워질 때까지 걸릴 시간 추정(초)"""
+        if self._avg_duration is None:
+            return self.retry_after
+
+        rounds = self._pending / self.max_concurrent
+        return max(1, math.ceil(self._avg_duration * rounds))
+
+    async def run(self, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        생성 작업 실행 (자리가 날 때까지 대기)
+
+        Args:
+            fn: 인자 없는 코루틴 함수
+
+        Returns:
+            fn의 결과
+
+        Raises:
+            GenerationQueueFull: 동시 실행과 대기열이 모두 찬 경우
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent)
+
+        if self._pending >= self.capacity:
+            self._stats['rejected'] += 1
+            raise GenerationQueueFull(self._retry_after())
+
+        self._pending += 1
+        self._stats['accepted'] += 1
+        try:
+            async with self._semaphore:
+                self._running += 1
+                started = time.monotonic()
+                try:
+                    result = await fn()
+                except Exception:
+                    self._stats['failed'] += 1
+                    raise
+                finally:
+                    self._running -= 1
+
+                self._record_duration(time.monotonic() - started)
+                self._stats['completed'] += 1
+                return result
+        finally:
+            self._pending -= 1
+
+    def _record_duration(self, duration: float) -> None:
+        if self._avg_duration is None:
+            self._avg_duration = duration
+        else:
+            alpha = self.DURATION_SMOOTHING
+            self._avg_duration = alpha * duration + (1 - alpha) * self._avg_duration
+
+    def get_stats(self) -> Dict[str, Any]:
+        """실행 현황"""
+        return {
+            **self._stats,
+            'running': self._running,
+            'queued': self._pending - self._running,
+            'max_concurrent': self.max_concurrent,
+            'max_queue': self.max_queue,
+            'avg_duration': round(self._avg_duration, 3) if self._avg_duration is not None else None
+        }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """CPU 작업 스레드 풀 종료"""
+        self.threads.shutdown(wait=wait)
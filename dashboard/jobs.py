@@ -0,0 +1,265 @@
+"""
+생성 작업 워커: SQLite jobs 테이블의 작업을 별도 프로세스에서 실행
+
+대시보드는 작업을 등록하고 바로 응답하며, 워커 프로세스가 lease를 잡고 리서치
+수집 → 결과 구성 → 프로젝트 저장 → 파일 내보내기를 실행합니다. 생성 과정의 이벤트는
+job_events 테이블에 기록되어 대시보드 SSE로 전달됩니다. lease는 이벤트를
+기록할 때마다 연장되고, 워커가 죽거나 대시보드가 재시작되면 만료된 작업을 다른
+워커가 다시 가져갑니다.
+"""
+import logging
+import multiprocessing
+import os
+import socket
+from enum import Enum
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils.events import (
+    Event, EventType, LogSubscriber, bind, event_bus, setup_queued_logging
+)
+
+
+logger = logging.getLogger('checklist.jobs')
+
+
+class JobStatus(str, Enum):
+    """작업 상태"""
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+def _job_state(event: Event) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+    """이벤트에 따른 작업 단계와 진행 상황 (바뀌지 않으면 None)"""
+    if event.type is EventType.STAGE_STARTED and event.stage != 'generate':
+        return event.stage, dict(event.data)
+
+    if event.type is EventType.SOURCE_FINISHED:
+        data = event.data
+        return event.stage, {
+            'source': data.get('source'),
+            'status': data.get('status'),
+            'done': data.get('done'),
+            'total': data.get('total')
+        }
+
+    return None, None
+
+
+class LeaseLost(Exception):
+    """lease가 만료되어 다른 워커가 작업을 가져간 상태"""
+
+
+class JobEventRecorder:
+    """작업 워커 구독자: 작업 문맥(job_id)의 이벤트를 DB에 기록하고 lease 연장
+
+    lease 연장에 실패하면(만료 후 다른 워커가 가져감) lost를 설정합니다.
+    """
+
+    def __init__(self, db, job_id: int, worker: str, lease_seconds: float):
+        self.db = db
+        self.job_id = job_id
+        self.worker = worker
+        self.lease_seconds = lease_seconds
+        self.lost = False
+
+    def __call__(self, event: Event) -> None:
+        if event.context.get('job_id') != self.job_id:
+            return
+
+        stage, progress = _job_state(event)
+        if not self.db.record_job_event(
+            self.job_id, self.worker, event.to_dict(),
+            stage=stage, progress=progress, lease_seconds=self.lease_seconds
+        ):
+            self.lost = True
+
+    def check(self) -> None:
+        """lease를 잃었으면 LeaseLost"""
+        if self.lost:
+            raise LeaseLost(f"작업 {self.job_id}의 lease를 잃었습니다 ({self.worker})")
+
+
+def _run_job(db, generator, exporter, job: Dict[str, Any], worker: str, lease_seconds: float) -> None:
+    """작업 하나 실행 (완료·실패까지 jobs 테이블에 기록)"""
+    job_id = job['id']
+    params = job['params']
+
+    recorder = JobEventRecorder(db, job_id, worker, lease_seconds)
+    unsubscribe = event_bus.subscribe(recorder)
+    try:
+        with bind(job_id=job_id):
+            result = generator.generate(
+                keyword=params['keyword'],
+                facility_type=params['facility_type'],
+                check_phase=params['check_phase'],
+                focus_area=params.get('focus_area'),
+                collect_data=params.get('collect_data', True)
+            )
+
+            # lease를 잃었으면 결과를 저장하지 않음 (작업을 가져간 워커가 저장)
+            recorder.check()
+
+            with event_bus.stage('saving') as stage:
+                project_id = db.save_job_project(job_id, worker, {
+                    'keyword': params['keyword'],
+                    'facility_type': params['facility_type'],
+                    'check_phase': params['check_phase'],
+                    'focus_area': params.get('focus_area'),
+                    'data_collected': params.get('collect_data', True),
+                    'metadata': result.get('metadata'),
+                    'checklist': result.get('checklist'),
+                    'research_summary': result.get('research_summary'),
+                    'recommendations': result.get('recommendations')
+                })
+                stage['project_id'] = project_id
+
+            if project_id is None:
+                raise LeaseLost(f"작업 {job_id}의 lease를 잃었습니다 ({worker})")
+
+            # 워커 프로세스에서는 바로 기록 (파일이 모두 기록된 뒤 경로 저장)
+            with event_bus.stage('exporting', project_id=project_id):
+                exporter.submit(
+                    result,
+                    on_complete=lambda md_path, json_path: db.update_output_paths(project_id, md_path, json_path)
+                ).result()
+
+        db.complete_job(job_id, worker, project_id)
+
+    except LeaseLost as e:
+        # 작업은 이미 다른 워커가 실행 중이므로 실패로 기록하지 않음
+        logger.warning("%s", e)
+
+    except Exception as e:
+        logger.exception("작업 %s 실패 (%s)", job_id, worker)
+        db.fail_job(job_id, worker, str(e))
+
+    finally:
+        unsubscribe()
+
+
+def run_worker(
+    db_path: str,
+    settings: Dict[str, Any],
+    worker: str,
+    stop_event,
+    poll_interval: float = 1.0,
+    lease_seconds: float = 300.0,
+    max_attempts: int = 3
+) -> None:
+    """워커 프로세스 본체 (stop_event가 설정될 때까지 작업을 가져와 실행)"""
+    # 워커 프로세스 안에서만 생성기를 만들도록 지연 import
+    from checklist.exporter import ExportPipeline
+    from checklist.generator import ChecklistGenerator
+    from database import Database
+
+    # 워커 로그도 큐를 거쳐 별도 스레드에서 출력
+    listener = setup_queued_logging()
+    event_bus.subscribe(LogSubscriber())
+
+    db = Database(db_path)
+    generator = ChecklistGenerator(settings)
+    exporter = ExportPipeline(generator, background=False)
+
+    logger.info("작업 워커 시작: %s", worker)
+
+    try:
+        while not stop_event.is_set():
+            try:
+                job = db.claim_job(worker, lease_seconds, max_attempts)
+            except Exception as e:
+                logger.warning("작업 조회 실패 (%s): %s", worker, e)
+                job = None
+
+            if job is None:
+                stop_event.wait(poll_interval)
+                continue
+
+            logger.info("작업 %s 실행 (%s, 시도 %s)", job['id'], worker, job['attempts'])
+            _run_job(db, generator, exporter, job, worker, lease_seconds)
+    finally:
+        listener.stop()
+
+
+class JobWorkerPool:
+    """작업 워커 프로세스 풀
+
+    spawn 방식으로 프로세스를 만들어 대시보드의 스레드·이벤트 루프 상태를
+    물려받지 않습니다. 종료 시 실행 중인 작업은 끝나길 기다리지 않으며,
+    그 작업은 lease 만료 후 다음 워커가 다시 실행합니다.
+    external=True면 다른 프로세스(여러 웹 워커의 감독 프로세스)가 워커를 실행하므로
+    이 풀은 작업 등록 여부만 판단하고 프로세스를 띄우지 않습니다.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        settings: Dict[str, Any],
+        workers: int = 2,
+        poll_interval: float = 1.0,
+        lease_seconds: float = 300.0,
+        max_attempts: int = 3,
+        external: bool = False
+    ):
+        self.db_path = str(db_path)
+        self.settings = settings
+        self.workers = max(0, int(workers))
+        self.poll_interval = float(poll_interval)
+        self.lease_seconds = float(lease_seconds)
+        self.max_attempts = max(1, int(max_attempts))
+        self.external = external
+
+        self._context = multiprocessing.get_context('spawn')
+        self._stop_event = self._context.Event()
+        self._processes: List[multiprocessing.Process] = []
+
+    @property
+    def enabled(self) -> bool:
+        return self.workers > 0
+
+    def start(self) -> None:
+        """워커 프로세스 시작"""
+        if self.external or self._processes:
+            return
+
+        self._stop_event.clear()
+        prefix = f"{socket.gethostname()}:{os.getpid()}"
+
+        for index in range(self.workers):
+            process = self._context.Process(
+                target=run_worker,
+                args=(
+                    self.db_path,
+                    self.settings,
+                    f"{prefix}:{index}",
+                    self._stop_event,
+                    self.poll_interval,
+                    self.lease_seconds,
+                    self.max_attempts
+                ),
+                name=f"job-worker-{index}",
+                daemon=True
+            )
+            process.start()
+            self._processes.append(process)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """워커 종료 (제한 시간 안에 끝나지 않으면 강제 종료)"""
+        self._stop_event.set()
+
+        for process in self._processes:
+            process.join(timeout)
+            if process.is_alive():
+                process.terminate()
+                process.join()
+
+        self._processes = []
+
+    def get_stats(self) -> Dict[str, Any]:
+        """워커 상태"""
+        return {
+            'workers': self.workers,
+            'external': self.external,
+            'alive': sum(process.is_alive() for process in self._processes)
+        }
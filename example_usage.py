@@ -10,6 +10,7 @@ sys.path.insert(0, str(Path(__file__).parent / 'src'))
 from utils.config import config
 from checklist.generator import ChecklistGenerator
 from checklist.templates import FacilityType, CheckPhase, FocusArea
+from utils.events import CliPrinter, event_bus
 
 
 def example_1_basic():
@@ -49,9 +50,10 @@ def example_2_with_research():
         collect_data=True  # 데이터 수집 실행
     )
 
-    # Markdown과 JSON 모두 출력
-    generator.export_to_markdown(result)
-    generator.export_to_json(result)
+    # Markdown과 JSON 모두 출력 (같은 파일 이름)
+    output_stem = generator.new_output_stem(result)
+    generator.export_to_markdown(result, output_stem=output_stem)
+    generator.export_to_json(result, output_stem=output_stem)
 
     print("\n✅ 건설현장 정기 점검 체크리스트 생성 완료!")
 
@@ -108,6 +110,9 @@ def example_4_legal_compliance():
 
 def main():
     """메인 함수"""
+    # 생성 진행 상황을 콘솔에 출력
+    event_bus.subscribe(CliPrinter())
+
     print("\n" + "="*70)
     print("  재난·안전 체크리스트 시스템 - 사용 예시")
     print("="*70)
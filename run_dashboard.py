@@ -26,12 +26,10 @@ if __name__ == "__main__":
     # 브라우저 자동 열기 (백그라운드)
     threading.Thread(target=open_browser, daemon=True).start()
 
-    # FastAPI 앱 실행
-    from app import app
-    import uvicorn
+    # FastAPI 앱 실행 (웹 워커 수: WEB_CONCURRENCY 환경변수 또는 dashboard.workers 설정)
+    from app import serve
 
-    uvicorn.run(
-        app,
+    serve(
         host="127.0.0.1",
         port=8000,
         log_level="info"
@@ -0,0 +1,75 @@
+"""
+내보내기 파이프라인: Markdown·JSON 파일을 백그라운드 I/O 스레드에서 원자적으로 기록
+"""
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from checklist.generator import ChecklistGenerator
+
+
+# 파일이 모두 기록된 뒤 호출되는 콜백 (Markdown 경로, JSON 경로)
+ExportCallback = Callable[[str, str], None]
+
+
+class ExportPipeline:
+    """체크리스트 파일 내보내기 작업 큐
+
+    파일 쓰기는 요청 경로에서 빼내 단일 I/O 스레드에서 순서대로 실행합니다.
+    각 파일은 임시 파일 + rename으로 기록되므로(fsync 수준은 생성기 설정) 반쯤 쓴
+    파일이 남지 않고, on_complete는 두 파일이 모두 기록된 뒤에만 호출됩니다.
+    background=False면 submit 안에서 바로 기록합니다 (CLI, 테스트용).
+    """
+
+    def __init__(self, generator: ChecklistGenerator, background: bool = True):
+        self.generator = generator
+        self.background = background
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix='export'
+        ) if background else None
+
+    def _export(
+        self,
+        checklist_data: Dict[str, Any],
+        on_complete: Optional[ExportCallback]
+    ) -> Tuple[str, str]:
+        # 두 파일이 같은 이름(확장자만 다름)을 갖도록 경로를 한 번만 만듦
+        output_stem = self.generator.new_output_stem(checklist_data)
+        md_path = self.generator.export_to_markdown(checklist_data, output_stem=output_stem)
+        json_path = self.generator.export_to_json(checklist_data, output_stem=output_stem)
+
+        if on_complete is not None:
+            on_complete(md_path, json_path)
+
+        return md_path, json_path
+
+    def submit(
+        self,
+        checklist_data: Dict[str, Any],
+        on_complete: ExportCallback = None
+    ) -> 'Future[Tuple[str, str]]':
+        """
+        내보내기 작업 등록
+
+        Args:
+            checklist_data: 생성 결과 (등록 후 변경하지 않아야 함)
+            on_complete: 두 파일이 기록된 뒤 I/O 스레드에서 호출할 함수
+
+        Returns:
+            (Markdown 경로, JSON 경로)를 돌려주는 Future
+        """
+        if self._executor is not None:
+            return self._executor.submit(self._export, checklist_data, on_complete)
+
+        future: Future = Future()
+        try:
+            future.set_result(self._export(checklist_data, on_complete))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def shutdown(self, wait: bool = True) -> None:
+        """대기 중인 내보내기를 마친 뒤 I/O 스레드 종료"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
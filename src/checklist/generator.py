@@ -1,16 +1,48 @@
 """
 체크리스트 생성 엔진
 """
-import json
-from typing import Dict, List, Any
+import asyncio
+import contextvars
+import functools
+import time
+import uuid
+from concurrent.futures import Executor
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
 
-from checklist.templates import ChecklistTemplates
+from checklist.templates import ChecklistTemplates, TemplateKey
+from checklist.matcher import KeywordMatcher, get_matcher, template_keywords
+from checklist.models import Category, EnrichedQuestion, json_default
+from checklist.research_index import ResearchIndex
+from checklist import relevance
+from checklist.relevance import BM25Ranker
 from collectors.web_researcher import WebResearcher
 from collectors.paper_researcher import PaperResearcher
 from collectors.tech_researcher import TechResearcher
 from collectors.api_researcher import APIResearcher
+from collectors.parallel import ParallelCollector
+from collectors import async_http, http_session
+from collectors.cache import CacheMode, ResearchCache
+from collectors.page_store import PageStore
+from collectors.ratelimit import rate_limit_processes, research_rate_limiter
+from utils import compression, serialization
+from utils.atomic_io import FsyncPolicy, atomic_write
+from utils.events import EventType, event_bus
+
+
+def _source_events(total: int):
+    """병렬 수집의 소스 완료를 이벤트로 전달하는 콜백"""
+    done = [0]
+
+    def on_source_done(name: str, status: Dict[str, Any]) -> None:
+        done[0] += 1
+        event_bus.emit(
+            EventType.SOURCE_FINISHED, 'collecting',
+            source=name, done=done[0], total=total, **status
+        )
+
+    return on_source_done
 
 
 class ChecklistGenerator:
@@ -20,9 +52,24 @@ class ChecklistGenerator:
         self.config = config or {}
         self.templates = ChecklistTemplates()
 
+        # 공유 HTTP 연결 풀 설정
+        http_session.configure(self.config.get('http', {}))
+
+        # 소스별 요청 속도 제한 설정 (여러 프로세스가 수집하면 설정값을 나눠 씀)
+        research_rate_limiter.configure(
+            self.config.get('rate_limits', {}),
+            self.config.get('rate_limit_max_wait', 30),
+            processes=rate_limit_processes()
+        )
+
         # 데이터 수집기 초기화
+        web_config = self.config.get('web_search', {})
         self.web_researcher = WebResearcher(
-            max_results=self.config.get('max_results_per_source', 10)
+            max_results=self.config.get('max_results_per_source', 10),
+            timeout=web_config.get('timeout', 10),
+            max_content_bytes=web_config.get('max_content_bytes', 1048576),
+            fetch_workers=web_config.get('fetch_workers', 16),
+            fetch_per_domain=web_config.get('fetch_per_domain', 4)
         )
         self.paper_researcher = PaperResearcher(
             max_results=self.config.get('max_results_per_source', 10)
@@ -35,232 +82,335 @@ class ChecklistGenerator:
             public_data_api_key=self.config.get('api_keys', {}).get('public_data')
         )
 
+        # 리서치 결과 디스크 캐시
+        self.research_cache = None
+        if self.config.get('cache_enabled', True):
+            self.research_cache = ResearchCache(
+                Path(self.config.get('data_dir', 'data')) / 'research_cache.db',
+                ttl_hours=self.config.get('cache_duration_hours', 24),
+                negative_ttl_minutes=self.config.get('cache_negative_ttl_minutes', 10),
+                max_size_mb=self.config.get('cache_max_size_mb', 50)
+            )
+            for researcher in self._get_researchers().values():
+                researcher.cache = self.research_cache
+            self.web_researcher.page_store = PageStore(
+                Path(self.config.get('data_dir', 'data')) / 'page_store.db'
+            )
+
+        # 질문별 관련 자료 순위 (numpy가 없거나 "credibility"면 신뢰도 순)
+        ranking_config = self.config.get('relevance_ranking', {})
+        self.relevance_ranker = None
+        if ranking_config.get('method', 'bm25') == 'bm25' and relevance.is_available():
+            self.relevance_ranker = BM25Ranker(
+                k1=ranking_config.get('k1', 1.5),
+                b=ranking_config.get('b', 0.75)
+            )
+
+        # 병렬 수집기 (설정에서 비활성화하면 동기 생성 시 순차 수집)
+        parallel_config = self.config.get('parallel_collection', {})
+        self.parallel_enabled = parallel_config.get('enabled', True)
+        self.parallel_collector = ParallelCollector(
+            max_workers=parallel_config.get('max_workers', 8),
+            source_timeout=parallel_config.get('source_timeout', 15),
+            source_timeouts=parallel_config.get('source_timeouts', {})
+        )
+
+        # 내보내기 파일 디스크 동기화 수준 (none, file, full)
+        export_config = self.config.get('export', {})
+        self.export_fsync = FsyncPolicy(export_config.get('fsync', FsyncPolicy.FILE.value))
+
+        # 함께 저장할 압축 사본 (gzip, br; brotli가 없으면 br은 제외)
+        self.export_precompress = compression.normalize_encodings(
+            export_config.get('precompress', ['gzip', 'br'])
+        )
+
+        # (컴파일된 템플릿 키, 카테고리) → 정적 Markdown (헤더, 질문별 본문)
+        self._markdown_blocks: Dict[Tuple[TemplateKey, str], Tuple[str, Tuple[str, ...]]] = {}
+
     def generate(
         self,
         keyword: str,
         facility_type: str,
         check_phase: str,
         focus_area: str = None,
-        collect_data: bool = True
+        collect_data: bool = True,
+        cache_mode: str = CacheMode.USE
     ) -> Dict[str, Any]:
         """
         맞춤형 체크리스트 생성
 
+        진행 상황은 event_bus 이벤트(generate, collecting, building 단계)로 전달됩니다.
+
         Args:
             keyword: 시설/사업장 키워드
             facility_type: 시설 유형
             check_phase: 점검 단계
             focus_area: 관심 영역
             collect_data: 데이터 수집 실행 여부
+            cache_mode: 리서치 캐시 사용 방식 (use, refresh, off)
 
         Returns:
             생성된 체크리스트 및 참고자료
         """
-        print(f"\n{'='*60}")
-        print(f"체크리스트 생성 시작: {keyword}")
-        print(f"시설 유형: {facility_type}, 점검 단계: {check_phase}")
-        print(f"{'='*60}\n")
-
-        # 1. 템플릿 가져오기
-        template = self.templates.get_template_by_type_and_stage(
-            facility_type, check_phase, focus_area
-        )
+        with event_bus.stage(
+            'generate', keyword=keyword, facility_type=facility_type, check_phase=check_phase
+        ):
+            # 1. 데이터 수집 (선택)
+            research_data = {}
+            if collect_data:
+                research_data = self._collect_research_data(keyword, cache_mode)
+
+            return self._build_result(
+                keyword, facility_type, check_phase, focus_area, research_data
+            )
 
-        # 2. 데이터 수집 (선택)
-        research_data = {}
-        if collect_data:
-            print("📚 리서치 데이터 수집 중...\n")
-            research_data = self._collect_research_data(keyword)
+    async def agenerate(
+        self,
+        keyword: str,
+        facility_type: str,
+        check_phase: str,
+        focus_area: str = None,
+        collect_data: bool = True,
+        cache_mode: str = CacheMode.USE,
+        executor: Executor = None
+    ) -> Dict[str, Any]:
+        """
+        맞춤형 체크리스트 생성 (비동기)
 
-        # 3. 체크리스트와 리서치 매핑
-        enriched_checklist = self._enrich_checklist_with_research(
-            template, research_data, keyword
-        )
+        리서치 수집을 공유 AsyncClient 위에서 실행하므로
+        이벤트 루프를 막지 않고 스레드도 점유하지 않습니다.
+        executor가 주어지면 CPU 작업인 결과 구성(색인, 순위 계산)도 그 풀에서 실행합니다.
 
-        # 4. 메타데이터 추가
-        result = {
-            'metadata': {
-                'keyword': keyword,
-                'facility_type': facility_type,
-                'check_phase': check_phase,
-                'focus_area': focus_area,
-                'generated_at': datetime.now().isoformat(),
-                'version': '1.0'
-            },
-            'checklist': enriched_checklist,
-            'research_summary': self._create_research_summary(research_data),
-            'recommendations': self._generate_recommendations(research_data)
-        }
+        Args:
+            keyword: 시설/사업장 키워드
+            facility_type: 시설 유형
+            check_phase: 점검 단계
+            focus_area: 관심 영역
+            collect_data: 데이터 수집 실행 여부
+            cache_mode: 리서치 캐시 사용 방식 (use, refresh, off)
+            executor: 결과 구성을 실행할 풀 (없으면 이벤트 루프에서 바로 실행)
 
-        print("\n✅ 체크리스트 생성 완료!\n")
+        Returns:
+            생성된 체크리스트 및 참고자료
+        """
+        with event_bus.stage(
+            'generate', keyword=keyword, facility_type=facility_type, check_phase=check_phase
+        ):
+            research_data = {}
+            if collect_data:
+                research_data = await self._acollect_research_data(keyword, cache_mode)
+
+            if executor is not None:
+                # 이벤트 문맥(job_id 등)을 풀 스레드에서도 유지
+                build = functools.partial(
+                    contextvars.copy_context().run, self._build_result,
+                    keyword, facility_type, check_phase, focus_area, research_data
+                )
+                return await asyncio.get_running_loop().run_in_executor(executor, build)
+
+            return self._build_result(
+                keyword, facility_type, check_phase, focus_area, research_data
+            )
+
+    def _build_result(
+        self,
+        keyword: str,
+        facility_type: str,
+        check_phase: str,
+        focus_area: str,
+        research_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """템플릿과 수집된 리서치 데이터로 결과 구성"""
+        with event_bus.stage('building'):
+            # 2. 템플릿 가져오기
+            template = self.templates.get_template_by_type_and_stage(
+                facility_type, check_phase, focus_area
+            )
+
+            # 3. 체크리스트와 리서치 매핑
+            enriched_checklist = self._enrich_checklist_with_research(
+                template, research_data, keyword,
+                self.templates.get_keyword_matcher(check_phase, focus_area)
+            )
+
+            # 4. 메타데이터 추가
+            result = {
+                'metadata': {
+                    'keyword': keyword,
+                    'facility_type': facility_type,
+                    'check_phase': check_phase,
+                    'focus_area': focus_area,
+                    'generated_at': datetime.now().isoformat(),
+                    'version': '1.0'
+                },
+                'checklist': enriched_checklist,
+                'research_summary': self._create_research_summary(research_data),
+                'recommendations': self._generate_recommendations(research_data)
+            }
+
+            return result
 
-        return result
+    def _get_researchers(self) -> Dict[str, Any]:
+        """리서치 데이터 키 → 수집기"""
+        return {
+            'web': self.web_researcher,
+            'papers': self.paper_researcher,
+            'tech': self.tech_researcher,
+            'apis': self.api_researcher
+        }
 
-    def _collect_research_data(self, keyword: str) -> Dict[str, Any]:
+    def _collect_research_data(
+        self,
+        keyword: str,
+        cache_mode: str = CacheMode.USE
+    ) -> Dict[str, Any]:
         """리서치 데이터 수집"""
-        data = {
-            'web': [],
-            'papers': [],
-            'tech': [],
-            'apis': []
+        if self.parallel_enabled:
+            return self._collect_research_data_parallel(keyword, cache_mode)
+
+        collectors = {
+            'web': lambda: self.web_researcher.search(keyword, cache_mode=cache_mode),
+            'papers': lambda: self.paper_researcher.search(keyword, cache_mode=cache_mode),
+            'tech': lambda: self.tech_researcher.search(keyword, cache_mode=cache_mode),
+            'apis': lambda: self.api_researcher.search(keyword)
         }
+        data = {data_key: [] for data_key in collectors}
+
+        with event_bus.stage('collecting', mode='sequential', total=len(collectors)) as stage:
+            # 수집기 하나가 실패하면 이후 수집기는 건너뜀
+            for done, (data_key, collect) in enumerate(collectors.items(), 1):
+                started = time.monotonic()
+                try:
+                    data[data_key] = collect()
+                except Exception as e:
+                    event_bus.emit(
+                        EventType.SOURCE_FINISHED, 'collecting',
+                        source=data_key, status='error', error=str(e),
+                        elapsed=round(time.monotonic() - started, 3),
+                        done=done, total=len(collectors)
+                    )
+                    break
+
+                event_bus.emit(
+                    EventType.SOURCE_FINISHED, 'collecting',
+                    source=data_key, status='completed', count=len(data[data_key]),
+                    elapsed=round(time.monotonic() - started, 3),
+                    done=done, total=len(collectors)
+                )
 
-        try:
-            # 웹 리서치
-            print("  🌐 웹 리서치...")
-            data['web'] = self.web_researcher.search(keyword)
-            print(f"     ✓ {len(data['web'])} 건 수집")
+            stage['counts'] = {data_key: len(items) for data_key, items in data.items()}
 
-            # 논문 리서치
-            print("  📄 논문 리서치...")
-            data['papers'] = self.paper_researcher.search(keyword)
-            print(f"     ✓ {len(data['papers'])} 건 수집")
+        return data
 
-            # 기술 리서치
-            print("  💻 기술 트렌드...")
-            data['tech'] = self.tech_researcher.search(keyword)
-            print(f"     ✓ {len(data['tech'])} 건 수집")
+    def _collect_research_data_parallel(
+        self,
+        keyword: str,
+        cache_mode: str = CacheMode.USE
+    ) -> Dict[str, Any]:
+        """리서치 데이터 병렬 수집 (모든 수집기의 모든 소스를 동시에 실행)"""
+        researchers = self._get_researchers()
 
-            # API 리서치
-            print("  🔌 API 정보...")
-            data['apis'] = self.api_researcher.search(keyword)
-            print(f"     ✓ {len(data['apis'])} 건 수집")
+        tasks = {}
+        for data_key, researcher in researchers.items():
+            for source, task in researcher.source_tasks(keyword, cache_mode=cache_mode).items():
+                tasks[f"{data_key}.{source}"] = task
 
-        except Exception as e:
-            print(f"  ⚠️  데이터 수집 중 오류: {e}")
+        with event_bus.stage('collecting', mode='parallel', total=len(tasks)) as stage:
+            results, status = self.parallel_collector.run(
+                tasks, on_source_done=_source_events(len(tasks))
+            )
+            data = self._combine_source_results(researchers, list(tasks), results, status)
+            stage['counts'] = {data_key: len(data[data_key]) for data_key in researchers}
 
         return data
 
-    def _enrich_checklist_with_research(
+    async def _acollect_research_data(
         self,
-        template: Dict[str, Any],
-        research_data: Dict[str, Any],
-        keyword: str
+        keyword: str,
+        cache_mode: str = CacheMode.USE
     ) -> Dict[str, Any]:
-        """체크리스트에 리서치 데이터 매핑"""
-        enriched = {}
+        """리서치 데이터 비동기 수집 (모든 수집기의 모든 소스를 동시에 실행)"""
+        if not async_http.is_available():
+            return await asyncio.to_thread(self._collect_research_data, keyword, cache_mode)
 
-        for category_id, category_data in template.items():
-            questions = category_data['questions']
-
-            # 각 질문에 관련 리서치 자료 연결
-            enriched_questions = []
-            for question in questions:
-                question_keywords = question.get('research_keywords', [])
-
-                # 관련 자료 찾기
-                related_resources = self._find_related_resources(
-                    question_keywords,
-                    research_data,
-                    keyword
-                )
+        researchers = self._get_researchers()
 
-                enriched_question = {
-                    **question,
-                    'related_resources': related_resources,
-                    'resource_count': len(related_resources),
-                    'needs_more_research': len(related_resources) < 3
-                }
+        tasks = {}
+        for data_key, researcher in researchers.items():
+            for source, task in researcher.asource_tasks(keyword, cache_mode=cache_mode).items():
+                tasks[f"{data_key}.{source}"] = task
 
-                enriched_questions.append(enriched_question)
+        with event_bus.stage('collecting', mode='async', total=len(tasks)) as stage:
+            results, status = await self.parallel_collector.arun(
+                tasks, on_source_done=_source_events(len(tasks))
+            )
+            data = self._combine_source_results(researchers, list(tasks), results, status)
+            stage['counts'] = {data_key: len(data[data_key]) for data_key in researchers}
 
-            enriched[category_id] = {
-                'info': category_data['info'],
-                'questions': enriched_questions,
-                'total_resources': sum(q['resource_count'] for q in enriched_questions)
-            }
+        return data
 
-        return enriched
+    def _combine_source_results(
+        self,
+        researchers: Dict[str, Any],
+        task_names: List[str],
+        results: Dict[str, Any],
+        status: Dict[str, Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """소스별 결과를 수집기 단위로 병합하고 소스 상태 기록"""
+        data = {}
+        for data_key, researcher in researchers.items():
+            items = []
+            for name in task_names:
+                if name.startswith(f"{data_key}.") and name in results:
+                    items.extend(results[name])
+
+            data[data_key] = researcher.combine_results(items)
+
+        # 소스별 완료 여부 기록
+        data['sources'] = status
 
-    def _find_related_resources(
+        return data
+
+    def _enrich_checklist_with_research(
         self,
-        keywords: List[str],
+        template: Dict[str, Any],
         research_data: Dict[str, Any],
-        main_keyword: str
-    ) -> List[Dict[str, Any]]:
-        """키워드와 관련된 리서치 자료 찾기"""
-        resources = []
-
-        # 웹 자료
-        for item in research_data.get('web', []):
-            if self._is_relevant(item, keywords, main_keyword):
-                resources.append({
-                    'type': 'web',
-                    'title': item.get('title', ''),
-                    'url': item.get('url', ''),
-                    'source': item.get('source', ''),
-                    'summary': item.get('summary', ''),
-                    'credibility': item.get('credibility_score', 0.5)
-                })
-
-        # 논문
-        for item in research_data.get('papers', []):
-            if self._is_relevant(item, keywords, main_keyword):
-                resources.append({
-                    'type': 'paper',
-                    'title': item.get('title', ''),
-                    'url': item.get('url', ''),
-                    'authors': item.get('authors', []),
-                    'year': item.get('year'),
-                    'citations': item.get('citations', 0),
-                    'source': item.get('source', '')
-                })
-
-        # 기술 자료
-        for item in research_data.get('tech', []):
-            if self._is_relevant(item, keywords, main_keyword):
-                resources.append({
-                    'type': 'tech',
-                    'name': item.get('name', ''),
-                    'url': item.get('url', ''),
-                    'description': item.get('description', ''),
-                    'stars': item.get('stars', 0),
-                    'language': item.get('language', ''),
-                    'source': item.get('source', '')
-                })
-
-        # API 자료
-        for item in research_data.get('apis', []):
-            if self._is_relevant(item, keywords, main_keyword):
-                resources.append({
-                    'type': 'api',
-                    'name': item.get('name', ''),
-                    'url': item.get('url', ''),
-                    'description': item.get('description', ''),
-                    'provider': item.get('provider', ''),
-                    'usage_policy': item.get('usage_policy', '')
-                })
-
-        # 관련성 점수로 정렬
-        resources.sort(key=lambda x: x.get('credibility', 0.5), reverse=True)
-
-        return resources[:5]  # 상위 5개만
-
-    def _is_relevant(
-        self,
-        item: Dict[str, Any],
-        keywords: List[str],
-        main_keyword: str
-    ) -> bool:
-        """항목이 키워드와 관련있는지 확인"""
-        # 제목이나 설명에서 키워드 검색
-        text = (
-            item.get('title', '') + ' ' +
-            item.get('description', '') + ' ' +
-            item.get('summary', '') + ' ' +
-            item.get('name', '')
-        ).lower()
-
-        # 메인 키워드 포함 확인
-        if main_keyword.lower() in text:
-            return True
-
-        # 관련 키워드 확인
-        for keyword in keywords:
-            if keyword.lower() in text:
-                return True
-
-        return False
+        keyword: str,
+        matcher: KeywordMatcher = None
+    ) -> Dict[str, Category]:
+        """체크리스트에 리서치 데이터 매핑"""
+        enriched = {}
+
+        # 자료 텍스트를 한 번만 정규화하고, 템플릿 키워드를 한 번의 순회로 매칭
+        # (매처는 템플릿별로 컴파일된 것을 재사용하고, 메인 키워드는 색인이 따로 계산)
+        if matcher is None:
+            matcher = get_matcher(template_keywords(template))
+        index = ResearchIndex(research_data, keyword, matcher)
+
+        # 관련 자료 찾기 (BM25면 모든 질문을 한 번에 계산, 아니면 신뢰도 순)
+        queries = [
+            question.get('research_keywords', [])
+            for category_data in template.values()
+            for question in category_data['questions']
+        ]
+        if self.relevance_ranker is not None:
+            ranked_resources = self.relevance_ranker.rank(index, queries, keyword)
+        else:
+            ranked_resources = [index.find(question_keywords) for question_keywords in queries]
+        ranked_resources = iter(ranked_resources)
+
+        # 템플릿 질문은 복사하지 않고 참조 (dict 변환은 내보내기·저장 시점에만)
+        for category_id, category_data in template.items():
+            enriched[category_id] = Category(
+                category_data['info'],
+                (
+                    EnrichedQuestion(question, next(ranked_resources))
+                    for question in category_data['questions']
+                ),
+                template=category_data
+            )
+
+        return enriched
 
     def _create_research_summary(self, research_data: Dict[str, Any]) -> Dict[str, Any]:
         """리서치 요약 생성"""
@@ -282,7 +432,8 @@ class ChecklistGenerator:
                 'tech': self.tech_researcher.analyze_tech_maturity(
                     research_data.get('tech', [])
                 )
-            }
+            },
+            'sources': research_data.get('sources', {})
         }
 
     def _generate_recommendations(self, research_data: Dict[str, Any]) -> List[str]:
@@ -318,109 +469,217 @@ class ChecklistGenerator:
 
         return recommendations
 
-    def export_to_markdown(self, checklist_data: Dict[str, Any], output_path: str = None):
+    def new_output_stem(self, checklist_data: Dict[str, Any]) -> str:
+        """
+        기본 내보내기 경로 (확장자 제외)
+
+        같은 초에 여러 프로세스(대시보드 워커, 작업 워커)가 같은 키워드를 내보내도
+        서로 덮어쓰지 않도록 시각 뒤에 임의 접미사를 붙입니다. 한 결과의 Markdown과
+        JSON 파일이 같은 이름을 갖도록 한 번 만들어 두 내보내기에 함께 넘깁니다.
+        """
+        output_dir = Path(self.config.get('output_dir', 'output'))
+        output_dir.mkdir(exist_ok=True, parents=True)
+
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        return str(output_dir / f"checklist_{checklist_data['metadata']['keyword']}_{timestamp}_{uuid.uuid4().hex[:8]}")
+
+    def export_to_markdown(self, checklist_data: Dict[str, Any], output_path: str = None, output_stem: str = None):
         """체크리스트를 Markdown 파일로 내보내기"""
         if output_path is None:
-            output_dir = Path(self.config.get('output_dir', 'output'))
-            output_dir.mkdir(exist_ok=True, parents=True)
-            filename = f"checklist_{checklist_data['metadata']['keyword']}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
-            output_path = output_dir / filename
+            output_path = f"{output_stem or self.new_output_stem(checklist_data)}.md"
 
-        md_content = self._generate_markdown(checklist_data)
+        precompressor = compression.Precompressor(self.export_precompress)
+        atomic_write(output_path, precompressor.wrap(self.iter_markdown(checklist_data)), fsync=self.export_fsync)
+        self._write_precompressed(output_path, precompressor)
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(md_content)
-
-        print(f"📄 Markdown 파일 생성: {output_path}")
+        event_bus.emit(
+            EventType.ARTIFACT_WRITTEN, 'exporting',
+            format='markdown', path=str(output_path), compressed=precompressor.encodings
+        )
         return str(output_path)
 
-    def export_to_json(self, checklist_data: Dict[str, Any], output_path: str = None):
+    def export_to_json(self, checklist_data: Dict[str, Any], output_path: str = None, output_stem: str = None):
         """체크리스트를 JSON 파일로 내보내기"""
         if output_path is None:
-            output_dir = Path(self.config.get('output_dir', 'output'))
-            output_dir.mkdir(exist_ok=True, parents=True)
-            filename = f"checklist_{checklist_data['metadata']['keyword']}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            output_path = output_dir / filename
+            output_path = f"{output_stem or self.new_output_stem(checklist_data)}.json"
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(checklist_data, f, indent=2, ensure_ascii=False)
+        precompressor = compression.Precompressor(self.export_precompress)
+        atomic_write(
+            output_path,
+            precompressor.wrap([serialization.dumps_bytes(checklist_data, pretty=True, default=json_default)]),
+            fsync=self.export_fsync
+        )
+        self._write_precompressed(output_path, precompressor)
 
-        print(f"📄 JSON 파일 생성: {output_path}")
+        event_bus.emit(
+            EventType.ARTIFACT_WRITTEN, 'exporting',
+            format='json', path=str(output_path), compressed=precompressor.encodings
+        )
         return str(output_path)
 
+    def _write_precompressed(self, output_path, precompressor: compression.Precompressor) -> None:
+        """원본 옆에 압축 사본 기록 (다운로드 시 요청마다 압축하지 않도록)"""
+        for encoding, data in precompressor.finish().items():
+            atomic_write(compression.sibling_path(output_path, encoding), [data], fsync=self.export_fsync)
+
     def _generate_markdown(self, data: Dict[str, Any]) -> str:
         """Markdown 형식으로 변환"""
-        md = []
+        return ''.join(self.iter_markdown(data))
 
+    def iter_markdown(self, data: Dict[str, Any]) -> Iterator[str]:
+        """
+        Markdown 문서를 조각 단위로 생성 (헤더, 요약, 추천 사항, 질문 하나씩)
+
+        문서 전체를 메모리에 만들지 않으므로 파일 쓰기나 스트리밍 응답에 그대로 사용할 수 있습니다.
+
+        Args:
+            data: generate() 결과 또는 같은 구조의 저장된 프로젝트 데이터
+
+        Yields:
+            Markdown 문자열 조각
+        """
         # 헤더
         metadata = data['metadata']
-        md.append(f"# {metadata['keyword']} - 재난·안전 체크리스트\n")
-        md.append(f"**시설 유형**: {metadata.get('facility_type', metadata.get('content_type', 'N/A'))}\n")
-        md.append(f"**점검 단계**: {metadata.get('check_phase', metadata.get('business_stage', 'N/A'))}\n")
-        md.append(f"**생성일시**: {metadata['generated_at']}\n")
-        md.append("\n---\n")
+        yield (
+            f"# {metadata['keyword']} - 재난·안전 체크리스트\n"
+            f"**시설 유형**: {metadata.get('facility_type', metadata.get('content_type', 'N/A'))}\n"
+            f"**점검 단계**: {metadata.get('check_phase', metadata.get('business_stage', 'N/A'))}\n"
+            f"**생성일시**: {metadata['generated_at']}\n"
+            "\n---\n"
+        )
 
         # 리서치 요약
         summary = data['research_summary']
-        md.append("## 📊 리서치 요약\n")
-        md.append(f"- 웹 자료: {summary['web_sources']}건\n")
-        md.append(f"- 논문: {summary['papers']}건\n")
-        md.append(f"- 기술 프로젝트: {summary['tech_projects']}건\n")
-        md.append(f"- API: {summary['apis']}건\n")
-        md.append("\n")
+        yield (
+            "## 📊 리서치 요약\n"
+            f"- 웹 자료: {summary.get('web_sources', 0)}건\n"
+            f"- 논문: {summary.get('papers', 0)}건\n"
+            f"- 기술 프로젝트: {summary.get('tech_projects', 0)}건\n"
+            f"- API: {summary.get('apis', 0)}건\n"
+            "\n"
+        )
 
         # 추천 사항
         if data['recommendations']:
-            md.append("## 💡 추천 사항\n")
+            md = ["## 💡 추천 사항\n"]
             for rec in data['recommendations']:
                 md.append(f"{rec}\n")
             md.append("\n")
+            yield ''.join(md)
 
-        md.append("---\n\n")
+        yield "---\n\n"
 
-        # 체크리스트
+        # 체크리스트 (컴파일된 템플릿에서 바로 만든 카테고리는 헤더와 질문 본문을
+        # 캐시에서 가져오고 참고 자료만 렌더링, 저장된 프로젝트는 질문마다 렌더링)
+        template_key = self.templates.template_key(
+            metadata.get('check_phase'), metadata.get('focus_area')
+        )
         checklist = data['checklist']
         for category_id, category_data in checklist.items():
-            info = category_data['info']
-            md.append(f"## {info['icon']} {info['name']}\n")
-            md.append(f"*{info['description']}*\n\n")
-
-            for i, question in enumerate(category_data['questions'], 1):
-                importance_badge = {
-                    'high': '🔴',
-                    'medium': '🟡',
-                    'low': '🟢'
-                }.get(question['importance'], '')
-
-                md.append(f"### {i}. {question['question']} {importance_badge}\n")
-
-                if question['type'] == 'select':
-                    md.append("**선택지:**\n")
-                    for option in question.get('options', []):
-                        md.append(f"- [ ] {option}\n")
-                else:
-                    md.append("**답변:**\n\n")
-                    md.append("```\n\n```\n")
-
-                # 관련 자료
-                resources = question.get('related_resources', [])
-                if resources:
-                    md.append("\n**참고 자료:**\n")
-                    for res in resources[:3]:  # 상위 3개만
-                        if res['type'] == 'web':
-                            md.append(f"- [{res['title']}]({res['url']}) - {res['source']}\n")
-                        elif res['type'] == 'paper':
-                            md.append(f"- 📄 [{res['title']}]({res['url']}) ({res.get('year', 'N/A')})\n")
-                        elif res['type'] == 'tech':
-                            md.append(f"- 💻 [{res['name']}]({res['url']}) - ⭐ {res.get('stars', 0)}\n")
-                        elif res['type'] == 'api':
-                            md.append(f"- 🔌 [{res['name']}]({res['url']}) - {res.get('provider', '')}\n")
-
-                if question.get('needs_more_research'):
-                    md.append("\n⚠️ *추가 리서치가 필요합니다.*\n")
-
-                md.append("\n")
-
-            md.append("---\n\n")
+            static = self._cached_category_markdown(template_key, category_id, category_data)
+
+            if static is not None:
+                header, blocks = static
+                yield header
+                for block, question in zip(blocks, category_data['questions']):
+                    yield block + self._render_question_resources(question)
+            else:
+                yield self._render_category_header(category_data['info'])
+                for i, question in enumerate(category_data['questions'], 1):
+                    yield self._render_question_markdown(i, question)
+
+            yield "---\n\n"
+
+    def _cached_category_markdown(
+        self,
+        template_key: Optional[TemplateKey],
+        category_id: str,
+        category_data: Any
+    ) -> Optional[Tuple[str, Tuple[str, ...]]]:
+        """
+        컴파일된 템플릿 카테고리의 정적 Markdown (헤더, 질문별 본문)
+
+        카테고리가 현재 컴파일된 템플릿 객체를 그대로 참조할 때만 사용하므로 질문을
+        하나씩 비교하지 않습니다. 캐시 키는 알려진 (점검 단계, 관심 영역)과 카테고리뿐이라
+        크기가 정해져 있습니다.
+
+        Returns:
+            (헤더, 질문별 블록) 또는 캐시를 쓸 수 없으면 None
+        """
+        source = getattr(category_data, 'template', None)
+        if template_key is None or source is None:
+            return None
+
+        compiled = self.templates.get_template_by_type_and_stage(None, *template_key)
+        if compiled.get(category_id) is not source:
+            return None
+
+        key = (template_key, category_id)
+        static = self._markdown_blocks.get(key)
+        if static is None:
+            # 같은 값을 만들므로 동시에 채워도 결과는 같음
+            static = self._markdown_blocks[key] = (
+                self._render_category_header(source['info']),
+                tuple(
+                    self._render_question_static(number, question)
+                    for number, question in enumerate(source['questions'], 1)
+                )
+            )
+
+        return static
+
+    @staticmethod
+    def _render_category_header(info: Dict[str, Any]) -> str:
+        """카테고리 제목과 설명"""
+        return f"## {info['icon']} {info['name']}\n*{info['description']}*\n\n"
+
+    def _render_question_markdown(self, number: int, question: Dict[str, Any]) -> str:
+        """질문 하나의 Markdown 블록"""
+        return self._render_question_static(number, question) + self._render_question_resources(question)
+
+    def _render_question_static(self, number: int, question: Dict[str, Any]) -> str:
+        """질문 블록 중 템플릿에 따라 정해지는 부분 (제목, 중요도, 선택지)"""
+        md = []
+
+        importance_badge = {
+            'high': '🔴',
+            'medium': '🟡',
+            'low': '🟢'
+        }.get(question['importance'], '')
+
+        md.append(f"### {number}. {question['question']} {importance_badge}\n")
+
+        if question['type'] == 'select':
+            md.append("**선택지:**\n")
+            for option in question.get('options', []):
+                md.append(f"- [ ] {option}\n")
+        else:
+            md.append("**답변:**\n\n")
+            md.append("```\n\n```\n")
+
+        return ''.join(md)
+
+    def _render_question_resources(self, question: Dict[str, Any]) -> str:
+        """질문 블록 중 프로젝트마다 달라지는 부분 (참고 자료)"""
+        md = []
+
+        # 관련 자료
+        resources = question.get('related_resources', [])
+        if resources:
+            md.append("\n**참고 자료:**\n")
+            for res in resources[:3]:  # 상위 3개만
+                if res['type'] == 'web':
+                    md.append(f"- [{res['title']}]({res['url']}) - {res['source']}\n")
+                elif res['type'] == 'paper':
+                    md.append(f"- 📄 [{res['title']}]({res['url']}) ({res.get('year', 'N/A')})\n")
+                elif res['type'] == 'tech':
+                    md.append(f"- 💻 [{res['name']}]({res['url']}) - ⭐ {res.get('stars', 0)}\n")
+                elif res['type'] == 'api':
+                    md.append(f"- 🔌 [{res['name']}]({res['url']}) - {res.get('provider', '')}\n")
+
+        if question.get('needs_more_research'):
+            md.append("\n⚠️ *추가 리서치가 필요합니다.*\n")
+
+        md.append("\n")
 
         return ''.join(md)
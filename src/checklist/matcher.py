@@ -0,0 +1,126 @@
+"""
+키워드 매칭 모듈: 여러 키워드를 한 번의 텍스트 순회로 찾는 Aho–Corasick 자동자
+"""
+from collections import deque
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Tuple
+
+
+class KeywordMatcher:
+    """다중 키워드 매처 (Aho–Corasick)
+
+    키워드 수와 관계없이 텍스트를 한 번만 훑어 포함된 키워드를 모두 찾습니다.
+    "재난위험지도"처럼 다른 키워드("재난", "위험")를 품은 복합어도 같은 순회에서
+    함께 보고됩니다. 키워드와 텍스트는 소문자 기준으로 비교합니다.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords: Tuple[str, ...] = tuple(dict.fromkeys(
+            keyword.lower() for keyword in keywords if keyword
+        ))
+
+        # 상태별 전이, 실패 링크, 이 상태에서 끝나는 키워드 번호
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[FrozenSet[int]] = [frozenset()]
+
+        self._build()
+
+    def _build(self) -> None:
+        # 1. 트라이 구성
+        outputs: List[set] = [set()]
+        for index, keyword in enumerate(self.keywords):
+            state = 0
+            for char in keyword:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    outputs.append(set())
+                state = next_state
+            outputs[state].add(index)
+
+        # 2. 너비 우선으로 실패 링크를 잇고, 실패 상태의 출력을 합침
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fail = self._goto[fail].get(char, 0)
+
+                self._fail[next_state] = fail
+                outputs[next_state] |= outputs[fail]
+
+        self._output = [frozenset(output) for output in outputs]
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def find(self, text: str) -> FrozenSet[int]:
+        """
+        텍스트에 포함된 키워드 번호 (self.keywords 기준)
+
+        Args:
+            text: 소문자로 정규화한 텍스트
+
+        Returns:
+            포함된 키워드 번호 집합
+        """
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+
+        found = set()
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                found |= output[state]
+
+        return frozenset(found)
+
+    def count(self, text: str) -> Dict[int, int]:
+        """텍스트에 키워드가 나타난 횟수 (키워드 번호 → 횟수, 없는 키워드는 생략)"""
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+
+        counts: Dict[int, int] = {}
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for index in output[state]:
+                counts[index] = counts.get(index, 0) + 1
+
+        return counts
+
+    def find_keywords(self, text: str) -> List[str]:
+        """텍스트에 포함된 키워드 (등록 순서)"""
+        return [self.keywords[i] for i in sorted(self.find(text))]
+
+
+def template_keywords(template: Dict[str, Dict]) -> Tuple[str, ...]:
+    """템플릿의 모든 질문 research_keywords (등장 순서, 중복 제거)"""
+    keywords = dict.fromkeys(
+        keyword
+        for category in template.values()
+        for question in category['questions']
+        for keyword in question.get('research_keywords', [])
+    )
+    return tuple(keywords)
+
+
+@lru_cache(maxsize=64)
+def get_matcher(keywords: Tuple[str, ...]) -> KeywordMatcher:
+    """키워드 묶음별 컴파일된 매처 (같은 키워드 묶음이면 재사용)"""
+    return KeywordMatcher(keywords)
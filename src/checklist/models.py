@@ -0,0 +1,195 @@
+"""
+체크리스트 데이터 모델: 템플릿 질문·카테고리와 리서치 자료의 슬롯 기반 표현
+
+생성 과정에서는 이 객체를 그대로 공유하고, JSON 내보내기·DB 저장처럼 직렬화하는
+지점에서만 to_dict()(또는 json_default)로 dict로 바꿉니다. 기존 dict 기반 코드와
+템플릿(Jinja)이 그대로 동작하도록 ['key'], get(), 속성 접근을 모두 지원합니다.
+"""
+import sys
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    """반복되는 짧은 문자열(유형, 중요도, 출처 등)을 공유"""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class _Record:
+    """슬롯 필드를 dict처럼 읽을 수 있는 읽기 전용 기반 클래스
+
+    하위 클래스는 `_fields`(직렬화 순서)와 같은 이름의 `__slots__`를 정의합니다.
+    값이 None인 `_optional` 필드는 dict 변환 시 생략합니다.
+    """
+
+    __slots__ = ()
+    _fields: Tuple[str, ...] = ()
+    _optional: frozenset = frozenset()
+
+    def __init__(self, **values):
+        for field in self._fields:
+            object.__setattr__(self, field, values.get(field))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._fields:
+            value = getattr(self, key)
+            if value is not None or key not in self._optional:
+                return value
+        raise KeyError(key)
+
+    def __contains__(self, key: str) -> bool:
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self) -> Iterator[str]:
+        return (field for field in self._fields if field in self)
+
+    def __iter__(self) -> Iterator[str]:
+        return self.keys()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """직렬화용 dict (중첩 객체는 그대로 두므로 json_default와 함께 사용)"""
+        return {field: self[field] for field in self.keys()}
+
+    def __repr__(self) -> str:
+        fields = ', '.join(f'{field}={getattr(self, field)!r}' for field in self._fields)
+        return f"{type(self).__name__}({fields})"
+
+
+class CategoryInfo(_Record):
+    """카테고리 정보"""
+
+    __slots__ = ('name', 'description', 'priority', 'icon')
+    _fields = __slots__
+
+
+class Question(_Record):
+    """템플릿 질문 (컴파일된 템플릿에서 여러 요청이 공유)"""
+
+    __slots__ = ('id', 'question', 'type', 'options', 'importance', 'required', 'research_keywords')
+    _fields = __slots__
+    _optional = frozenset({'options'})
+
+    def __init__(self, **values):
+        super().__init__(**values)
+        object.__setattr__(self, 'id', _intern(self.id))
+        object.__setattr__(self, 'type', _intern(self.type))
+        object.__setattr__(self, 'importance', _intern(self.importance))
+        if self.options is not None:
+            object.__setattr__(self, 'options', tuple(_intern(o) for o in self.options))
+        object.__setattr__(
+            self, 'research_keywords',
+            tuple(_intern(k) for k in self.research_keywords or ())
+        )
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Question':
+        return cls(**data)
+
+    def with_importance(self, importance: str) -> 'Question':
+        """중요도만 바꾼 새 질문"""
+        return Question(**{**self.to_dict(), 'importance': importance})
+
+
+class Resource(_Record):
+    """질문에 연결되는 리서치 자료 (유형별로 사용하는 필드가 다름)"""
+
+    __slots__ = (
+        'type', 'title', 'name', 'url', 'source', 'summary', 'credibility',
+        'authors', 'year', 'citations', 'description', 'stars', 'language',
+        'provider', 'usage_policy'
+    )
+    _fields = __slots__
+
+    # 유형별 직렬화 필드 (기존 dict 형식과 같은 키·순서)
+    _type_fields = {
+        'web': ('type', 'title', 'url', 'source', 'summary', 'credibility'),
+        'paper': ('type', 'title', 'url', 'authors', 'year', 'citations', 'source'),
+        'tech': ('type', 'name', 'url', 'description', 'stars', 'language', 'source'),
+        'api': ('type', 'name', 'url', 'description', 'provider', 'usage_policy')
+    }
+
+    def __init__(self, **values):
+        super().__init__(**values)
+        for field in ('type', 'source', 'language', 'provider', 'usage_policy'):
+            object.__setattr__(self, field, _intern(getattr(self, field)))
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._type_fields.get(self.type, self._fields):
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def keys(self) -> Iterator[str]:
+        return iter(self._type_fields.get(self.type, self._fields))
+
+
+class EnrichedQuestion(_Record):
+    """리서치 자료가 연결된 질문 (템플릿 질문은 복사하지 않고 참조)"""
+
+    __slots__ = ('base', 'related_resources')
+    _fields = Question._fields + ('related_resources', 'resource_count', 'needs_more_research')
+
+    def __init__(self, base: Question, related_resources: Iterable[Resource]):
+        object.__setattr__(self, 'base', base)
+        object.__setattr__(self, 'related_resources', tuple(related_resources))
+
+    @property
+    def resource_count(self) -> int:
+        return len(self.related_resources)
+
+    @property
+    def needs_more_research(self) -> bool:
+        return self.resource_count < 3
+
+    def __getattr__(self, name: str) -> Any:
+        # 슬롯에 없는 필드는 템플릿 질문에서 읽음
+        if name in Question._fields:
+            return getattr(self.base, name)
+        raise AttributeError(name)
+
+    def __getitem__(self, key: str) -> Any:
+        if key in Question._fields:
+            return self.base[key]
+        if key in self._fields:
+            return getattr(self, key)
+        raise KeyError(key)
+
+
+class Category(_Record):
+    """리서치 자료가 연결된 카테고리 (template: 질문을 가져온 컴파일된 템플릿 카테고리, 직렬화하지 않음)"""
+
+    __slots__ = ('info', 'questions', 'template')
+    _fields = ('info', 'questions', 'total_resources')
+
+    def __init__(
+        self,
+        info: CategoryInfo,
+        questions: Iterable[EnrichedQuestion],
+        template: Optional[Any] = None
+    ):
+        object.__setattr__(self, 'info', info)
+        object.__setattr__(self, 'questions', tuple(questions))
+        object.__setattr__(self, 'template', template)
+
+    @property
+    def total_resources(self) -> int:
+        return sum(question.resource_count for question in self.questions)
+
+
+def json_default(obj: Any) -> Any:
+    """json.dump(default=...)용 변환 (모델 객체 → dict, 튜플은 json이 리스트로 처리)"""
+    to_dict = getattr(obj, 'to_dict', None)
+    if to_dict is not None:
+        return to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
@@ -0,0 +1,129 @@
+"""
+관련성 점수 모듈: 질문 × 리서치 자료 BM25 점수를 행렬곱 한 번으로 계산
+"""
+from typing import List
+
+try:
+    import numpy as np
+except ImportError:  # numpy 미설치 시 신뢰도 순 정렬 사용
+    np = None
+
+try:
+    from scipy import sparse
+except ImportError:  # scipy가 없으면 numpy 밀집 행렬 사용
+    sparse = None
+
+from checklist.models import Resource
+from checklist.research_index import MAX_RELATED_RESOURCES, ResearchIndex
+
+
+def is_available() -> bool:
+    """numpy 설치 여부"""
+    return np is not None
+
+
+class BM25Ranker:
+    """BM25 기반 관련 자료 순위 계산기
+
+    자료 × 키워드 출현 횟수 행렬을 BM25 가중치로 바꾸고, 질문 × 키워드
+    행렬과 곱해 모든 질문의 점수를 한 번에 구한 뒤 argpartition으로 상위 k개를 고릅니다.
+    후보는 기존과 같이 메인 키워드나 질문 키워드를 포함하는 자료이므로,
+    모든 질문 키워드가 색인 매처에 포함되어 있어야 합니다.
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        if np is None:
+            raise RuntimeError("numpy가 설치되어 있지 않습니다: pip install numpy")
+
+        self.k1 = float(k1)
+        self.b = float(b)
+
+    def _weights(self, index: ResearchIndex):
+        """자료 × 키워드 BM25 가중치 행렬 (scipy가 있으면 CSR 희소 행렬)"""
+        n_items = len(index)
+        n_terms = len(index.vocabulary)
+
+        rows, cols, counts = (np.asarray(values) for values in index.term_counts)
+        rows = rows.astype(np.int64)
+        cols = cols.astype(np.int64)
+        tf = counts.astype(np.float64)
+
+        doc_lengths = np.asarray(index.doc_lengths, dtype=np.float64)
+        avg_length = doc_lengths.mean() if n_items else 0.0
+        if avg_length <= 0:
+            avg_length = 1.0
+
+        # 키워드별 문서 빈도와 IDF (음수가 되지 않는 BM25+ 형태)
+        df = np.bincount(cols, minlength=n_terms).astype(np.float64)
+        idf = np.log((n_items - df + 0.5) / (df + 0.5) + 1.0)
+
+        norm = self.k1 * (1.0 - self.b + self.b * doc_lengths[rows] / avg_length)
+        data = idf[cols] * tf * (self.k1 + 1.0) / (tf + norm)
+
+        if sparse is not None:
+            return sparse.csr_matrix((data, (rows, cols)), shape=(n_items, n_terms))
+
+        weights = np.zeros((n_items, n_terms))
+        weights[rows, cols] = data
+        return weights
+
+    def _queries(self, index: ResearchIndex, queries: List[List[str]], main_keyword: str):
+        """키워드 × 질문 행렬 (질문 키워드와 메인 키워드는 1)"""
+        matrix = np.zeros((len(index.vocabulary), len(queries)))
+
+        main_column = index.vocabulary.get(main_keyword.lower())
+        if main_column is not None:
+            matrix[main_column, :] = 1.0
+
+        for query_id, keywords in enumerate(queries):
+            for keyword in keywords:
+                column = index.vocabulary.get(keyword.lower())
+                if column is not None:
+                    matrix[column, query_id] = 1.0
+
+        return matrix
+
+    def rank(
+        self,
+        index: ResearchIndex,
+        queries: List[List[str]],
+        main_keyword: str,
+        limit: int = MAX_RELATED_RESOURCES
+    ) -> List[List[Resource]]:
+        """
+        질문별 관련 자료 순위
+
+        Args:
+            index: 매처로 만든 리서치 색인
+            queries: 질문별 research_keywords
+            main_keyword: 메인 키워드
+            limit: 질문당 최대 자료 수
+
+        Returns:
+            queries 순서대로 점수 순 상위 자료 (선택된 자료끼리 동점이면 수집 순서)
+        """
+        if not queries:
+            return []
+        if len(index) == 0 or not index.vocabulary:
+            return [index.find(keywords, limit) for keywords in queries]
+
+        # 자료 × 질문 점수 (IDF가 항상 양수이므로 키워드를 하나도 포함하지 않은 자료만 0)
+        scores = np.asarray(self._weights(index) @ self._queries(index, queries, main_keyword))
+        scores[scores <= 0] = -np.inf
+
+        k = min(limit, len(index))
+        if k < len(index):
+            top = np.argpartition(-scores, k - 1, axis=0)[:k]
+        else:
+            top = np.broadcast_to(np.arange(len(index))[:, None], scores.shape)
+
+        ranked = []
+        for query_id in range(len(queries)):
+            ordinals = [
+                int(i) for i in top[:, query_id]
+                if np.isfinite(scores[i, query_id])
+            ]
+            ordinals.sort(key=lambda i: (-scores[i, query_id], i))
+            ranked.append([index.resources[i] for i in ordinals])
+
+        return ranked
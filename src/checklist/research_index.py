@@ -0,0 +1,190 @@
+"""
+리서치 색인 모듈: 수집된 자료를 한 번만 정규화하고 키워드 → 자료 역색인으로 질문별 관련 자료 조회
+"""
+from typing import Any, Callable, Dict, FrozenSet, List, Set, Tuple
+
+from checklist.matcher import KeywordMatcher
+from checklist.models import Resource
+
+
+def _web_resource(item: Dict[str, Any]) -> Resource:
+    return Resource(
+        type='web',
+        title=item.get('title', ''),
+        url=item.get('url', ''),
+        source=item.get('source', ''),
+        summary=item.get('summary', ''),
+        credibility=item.get('credibility_score', 0.5)
+    )
+
+
+def _paper_resource(item: Dict[str, Any]) -> Resource:
+    return Resource(
+        type='paper',
+        title=item.get('title', ''),
+        url=item.get('url', ''),
+        authors=item.get('authors', []),
+        year=item.get('year'),
+        citations=item.get('citations', 0),
+        source=item.get('source', '')
+    )
+
+
+def _tech_resource(item: Dict[str, Any]) -> Resource:
+    return Resource(
+        type='tech',
+        name=item.get('name', ''),
+        url=item.get('url', ''),
+        description=item.get('description', ''),
+        stars=item.get('stars', 0),
+        language=item.get('language', ''),
+        source=item.get('source', '')
+    )
+
+
+def _api_resource(item: Dict[str, Any]) -> Resource:
+    return Resource(
+        type='api',
+        name=item.get('name', ''),
+        url=item.get('url', ''),
+        description=item.get('description', ''),
+        provider=item.get('provider', ''),
+        usage_policy=item.get('usage_policy', '')
+    )
+
+
+# 리서치 데이터 키 → 관련 자료 형식 (이 순서가 동점일 때의 출력 순서)
+RESOURCE_BUILDERS: Dict[str, Callable[[Dict[str, Any]], Resource]] = {
+    'web': _web_resource,
+    'papers': _paper_resource,
+    'tech': _tech_resource,
+    'apis': _api_resource
+}
+
+# 질문당 연결하는 최대 자료 수
+MAX_RELATED_RESOURCES = 5
+
+
+def _item_text(item: Dict[str, Any]) -> str:
+    """검색 대상 텍스트 (제목, 설명, 요약, 이름)"""
+    return ' '.join(
+        item.get(field) or ''
+        for field in ('title', 'description', 'summary', 'name')
+    ).lower()
+
+
+class ResearchIndex:
+    """체크리스트 생성 1회 동안 쓰는 리서치 자료 색인
+
+    자료마다 검색 텍스트를 한 번만 만들고, matcher가 주어지면 자료당 한 번의
+    순회로 모든 키워드의 일치 자료 번호를 미리 계산합니다. matcher에 없는 키워드는
+    처음 조회할 때 한 번 계산해 저장합니다. 질문별 조회는 키워드 집합의 합집합입니다.
+    관련 자료(Resource)도 한 번만 만들어 여러 질문이 공유합니다.
+    """
+
+    def __init__(
+        self,
+        research_data: Dict[str, Any],
+        main_keyword: str,
+        matcher: KeywordMatcher = None
+    ):
+        self.resources: List[Resource] = []
+        self._texts: List[str] = []
+
+        for data_key, build in RESOURCE_BUILDERS.items():
+            for item in research_data.get(data_key, []):
+                self.resources.append(build(item))
+                self._texts.append(_item_text(item))
+
+        self._postings: Dict[str, FrozenSet[int]] = {}
+
+        # 매처 키워드와 메인 키워드의 출현 횟수 (관련성 점수 계산용, 희소 행렬 좌표 형식)
+        self.vocabulary: Dict[str, int] = {}
+        self.term_counts: Tuple[List[int], List[int], List[int]] = ([], [], [])
+        self.doc_lengths: List[int] = [len(text.split()) for text in self._texts]
+
+        if matcher is not None:
+            self._index_with(matcher)
+            self._index_keyword(main_keyword)
+
+        self._main_matches = self._matches(main_keyword)
+
+    def _index_with(self, matcher: KeywordMatcher) -> None:
+        """자료 텍스트를 한 번씩 훑어 매처의 모든 키워드 역색인과 출현 횟수 생성"""
+        postings: List[List[int]] = [[] for _ in matcher.keywords]
+        rows, cols, counts = self.term_counts
+
+        for ordinal, text in enumerate(self._texts):
+            for keyword_id, count in matcher.count(text).items():
+                postings[keyword_id].append(ordinal)
+                rows.append(ordinal)
+                cols.append(keyword_id)
+                counts.append(count)
+
+        for keyword_id, (keyword, ordinals) in enumerate(zip(matcher.keywords, postings)):
+            self._postings[keyword] = frozenset(ordinals)
+            self.vocabulary[keyword] = keyword_id
+
+    def _index_keyword(self, keyword: str) -> None:
+        """매처에 없는 키워드(메인 키워드) 하나의 역색인과 출현 횟수를 마지막 열로 추가"""
+        key = keyword.lower()
+        if not key or key in self.vocabulary:
+            return
+
+        keyword_id = len(self.vocabulary)
+        rows, cols, counts = self.term_counts
+        ordinals = []
+
+        for ordinal, text in enumerate(self._texts):
+            # 매처와 같이 겹치는 출현도 셈
+            count = 0
+            start = text.find(key)
+            while start != -1:
+                count += 1
+                start = text.find(key, start + 1)
+
+            if count:
+                ordinals.append(ordinal)
+                rows.append(ordinal)
+                cols.append(keyword_id)
+                counts.append(count)
+
+        self._postings[key] = frozenset(ordinals)
+        self.vocabulary[key] = keyword_id
+
+    def __len__(self) -> int:
+        return len(self.resources)
+
+    def _matches(self, keyword: str) -> FrozenSet[int]:
+        """키워드를 포함하는 자료 번호 (키워드별로 한 번만 계산)"""
+        key = keyword.lower()
+        postings = self._postings.get(key)
+        if postings is None:
+            postings = frozenset(i for i, text in enumerate(self._texts) if key in text)
+            self._postings[key] = postings
+        return postings
+
+    def candidates(self, keywords: List[str]) -> Set[int]:
+        """메인 키워드 또는 질문 키워드를 포함하는 자료 번호"""
+        matched: Set[int] = set(self._main_matches)
+        for keyword in keywords:
+            matched |= self._matches(keyword)
+        return matched
+
+    def find(self, keywords: List[str], limit: int = MAX_RELATED_RESOURCES) -> List[Resource]:
+        """
+        메인 키워드 또는 질문 키워드와 관련된 자료
+
+        Args:
+            keywords: 질문의 research_keywords
+            limit: 최대 자료 수
+
+        Returns:
+            신뢰도 순 상위 자료 (동점이면 web, papers, tech, apis 순서와 수집 순서 유지)
+        """
+        resources = [self.resources[i] for i in sorted(self.candidates(keywords))]
+
+        # 관련성 점수로 정렬
+        resources.sort(key=lambda x: x.get('credibility', 0.5), reverse=True)
+
+        return resources[:limit]
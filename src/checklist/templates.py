@@ -1,9 +1,14 @@
 """
 체크리스트 템플릿 정의
 """
-from typing import Dict, List, Any
+import threading
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional, Tuple
 from enum import Enum
 
+from checklist.matcher import KeywordMatcher, get_matcher, template_keywords
+from checklist.models import CategoryInfo, Question
+
 
 class FacilityType(str, Enum):
     """시설 유형"""
@@ -35,6 +40,13 @@ class FocusArea(str, Enum):
     RESPONSE = "대응 중심"
 
 
+# 컴파일 캐시에 넣는 점검 단계·관심 영역 (그 밖의 입력값은 캐시하지 않음)
+_CHECK_PHASES = frozenset(phase.value for phase in CheckPhase)
+_FOCUS_AREAS = frozenset(area.value for area in FocusArea)
+
+TemplateKey = Tuple[str, Optional[str]]
+
+
 class ChecklistTemplates:
     """체크리스트 템플릿 관리"""
 
@@ -42,6 +54,23 @@ class ChecklistTemplates:
         self.categories = self._define_categories()
         self.templates = self._define_templates()
 
+        # 읽기 전용 모델 (컴파일된 템플릿들이 공유)
+        self._category_infos = {
+            category_id: CategoryInfo(**info)
+            for category_id, info in self.categories.items()
+        }
+        self._questions = {
+            category_id: tuple(Question.from_dict(q) for q in questions)
+            for category_id, questions in self.templates.items()
+        }
+
+        # (점검 단계, 관심 영역) → 컴파일된 읽기 전용 템플릿
+        self._compiled: Dict[TemplateKey, Mapping[str, Any]] = {}
+        self._compiled_lock = threading.Lock()
+
+        # (점검 단계, 관심 영역) → 템플릿 질문 키워드 매처
+        self._matchers: Dict[TemplateKey, KeywordMatcher] = {}
+
     def _define_categories(self) -> Dict[str, Dict[str, Any]]:
         """체크리스트 카테고리 정의"""
         return {
@@ -366,28 +395,92 @@ class ChecklistTemplates:
             ]
         }
 
+    @staticmethod
+    def template_key(check_phase: str, focus_area: str = None) -> Optional[TemplateKey]:
+        """
+        컴파일 캐시 키
+
+        템플릿은 점검 단계와 관심 영역으로만 정해지므로 시설 유형은 넣지 않습니다.
+        대시보드·API의 임의 입력값으로 캐시가 늘지 않도록 알려진 값이 아니면 None입니다.
+        """
+        if check_phase not in _CHECK_PHASES:
+            return None
+        if focus_area and focus_area not in _FOCUS_AREAS:
+            return None
+        return check_phase, focus_area or None
+
     def get_template_by_type_and_stage(
         self,
         facility_type: str,
         check_phase: str,
         focus_area: str = None
-    ) -> Dict[str, Any]:
+    ) -> Mapping[str, Any]:
         """
         시설 유형과 점검 단계에 맞는 템플릿 반환
 
+        알려진 (점검 단계, 관심 영역) 조합별로 한 번만 만들어 캐시하며(그 밖의 값은
+        매번 새로 구성), 여러 요청·스레드가 같은 객체를 공유하므로
+        읽기 전용(MappingProxyType, 튜플, Question/CategoryInfo)입니다.
+        요청별 필드는 EnrichedQuestion처럼 질문을 참조하는 별도 객체에 담아야 합니다.
+
         Args:
             facility_type: 시설 유형
             check_phase: 점검 단계
             focus_area: 관심 영역 (선택)
 
         Returns:
-            맞춤형 체크리스트 템플릿
+            맞춤형 체크리스트 템플릿 (category_id → {info, questions})
+        """
+        key = self.template_key(check_phase, focus_area)
+        if key is None:
+            return self._compile(check_phase, focus_area)
+
+        compiled = self._compiled.get(key)
+        if compiled is None:
+            with self._compiled_lock:
+                compiled = self._compiled.get(key)
+                if compiled is None:
+                    compiled = self._compile(check_phase, focus_area)
+                    self._compiled[key] = compiled
+
+        return compiled
+
+    def get_keyword_matcher(self, check_phase: str, focus_area: str = None) -> KeywordMatcher:
         """
+        템플릿 질문 키워드(research_keywords) 매처
+
+        컴파일된 템플릿마다 한 번만 만듭니다. 검색 키워드는 요청마다 다르므로 넣지
+        않으며, 리서치 색인이 따로 계산합니다.
+        """
+        key = self.template_key(check_phase, focus_area)
+        if key is None:
+            template = self.get_template_by_type_and_stage(None, check_phase, focus_area)
+            return get_matcher(template_keywords(template))
+
+        matcher = self._matchers.get(key)
+        if matcher is None:
+            template = self.get_template_by_type_and_stage(None, check_phase, focus_area)
+            with self._compiled_lock:
+                matcher = self._matchers.get(key)
+                if matcher is None:
+                    matcher = self._matchers[key] = KeywordMatcher(template_keywords(template))
+
+        return matcher
+
+    def _compile(self, check_phase: str, focus_area: str = None) -> Mapping[str, Any]:
+        """읽기 전용 템플릿 구성"""
+        return MappingProxyType({
+            category_id: MappingProxyType(category)
+            for category_id, category in self._build_template(check_phase, focus_area).items()
+        })
+
+    def _build_template(self, check_phase: str, focus_area: str = None) -> Dict[str, Any]:
+        """점검 단계와 관심 영역을 반영한 템플릿 구성"""
         # 모든 카테고리의 질문을 기본으로 포함
         checklist = {}
 
-        for category_id, questions in self.templates.items():
-            category_info = self.categories[category_id]
+        for category_id, questions in self._questions.items():
+            category_info = self._category_infos[category_id]
 
             # 점검 단계에 따른 필터링
             filtered_questions = self._filter_by_phase(questions, check_phase)
@@ -402,21 +495,21 @@ class ChecklistTemplates:
 
             checklist[category_id] = {
                 "info": category_info,
-                "questions": filtered_questions
+                "questions": tuple(filtered_questions)
             }
 
         return checklist
 
     def _filter_by_phase(
         self,
-        questions: List[Dict[str, Any]],
+        questions: Tuple[Question, ...],
         phase: str
-    ) -> List[Dict[str, Any]]:
+    ) -> Tuple[Question, ...]:
         """점검 단계에 따른 질문 필터링"""
         # 점검 단계별로 특정 질문 제외
         if phase == CheckPhase.INITIAL.value:
             # 초기 평가 단계에서는 중요도 높은 질문 위주
-            return [q for q in questions if q.get('importance') != 'low']
+            return tuple(q for q in questions if q.importance != 'low')
         elif phase == CheckPhase.ANNUAL.value:
             # 연간 종합 단계에서는 모든 질문 포함
             return questions
@@ -425,10 +518,10 @@ class ChecklistTemplates:
 
     def _adjust_priority_by_focus(
         self,
-        questions: List[Dict[str, Any]],
+        questions: Tuple[Question, ...],
         category_id: str,
         focus_area: str
-    ) -> List[Dict[str, Any]]:
+    ) -> Tuple[Question, ...]:
         """관심 영역에 따른 우선순위 조정"""
         # 관심 영역과 카테고리 매칭
         focus_category_map = {
@@ -438,12 +531,12 @@ class ChecklistTemplates:
             FocusArea.RESPONSE.value: ["emergency_response", "cooperation"]
         }
 
-        # 해당 관심 영역의 카테고리라면 우선순위 상향
-        for focus, categories in focus_category_map.items():
-            if focus == focus_area and category_id in categories:
-                for question in questions:
-                    if question.get('importance') == 'medium':
-                        question['importance'] = 'high'
+        # 해당 관심 영역의 카테고리라면 우선순위 상향 (원본 질문은 수정하지 않음)
+        if category_id in focus_category_map.get(focus_area, []):
+            return tuple(
+                question.with_importance('high') if question.importance == 'medium' else question
+                for question in questions
+            )
 
         return questions
 
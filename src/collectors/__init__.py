@@ -1,14 +1,18 @@
 """
 Data collectors for KCL Checklist System
 """
+from collectors.base import BaseResearcher
 from collectors.web_researcher import WebResearcher
 from collectors.paper_researcher import PaperResearcher
 from collectors.tech_researcher import TechResearcher
 from collectors.api_researcher import APIResearcher
+from collectors.parallel import ParallelCollector
 
 __all__ = [
+    'BaseResearcher',
     'WebResearcher',
     'PaperResearcher',
     'TechResearcher',
-    'APIResearcher'
+    'APIResearcher',
+    'ParallelCollector'
 ]
@@ -5,14 +5,30 @@ import requests
 from typing import List, Dict, Any
 from datetime import datetime
 
+from collectors.base import BaseResearcher
 
-class APIResearcher:
+
+class APIResearcher(BaseResearcher):
     """공공/오픈 API 정보 수집기"""
 
+    # 내장 API 카탈로그에서 검색
+    local_sources = frozenset({'korean_public', 'international', 'popular_free'})
+
     def __init__(self, public_data_api_key: str = None):
         self.public_data_api_key = public_data_api_key
         self.public_data_portal = "https://www.data.go.kr/data/15000001/openapi.do"
 
+    def _get_sources(self):
+        """API 정보 소스"""
+        return {
+            # 한국 공공데이터포털
+            'korean_public': self._get_korean_public_apis,
+            # 국제 오픈데이터
+            'international': self._get_international_apis,
+            # 기타 유용한 무료 API
+            'popular_free': self._get_popular_free_apis
+        }
+
     def search(self, keyword: str, category: str = None) -> List[Dict[str, Any]]:
         """
         키워드 기반 공공/오픈 API 검색
@@ -24,18 +40,20 @@ class APIResearcher:
         Returns:
             API 정보 리스트
         """
-        results = []
-
-        # 한국 공공데이터포털
-        results.extend(self._get_korean_public_apis(keyword, category))
+        return self._run_sequential(self.source_tasks(keyword, category=category))
 
-        # 국제 오픈데이터
-        results.extend(self._get_international_apis(keyword, category))
+    async def asearch(self, keyword: str, category: str = None) -> List[Dict[str, Any]]:
+        """
+        키워드 기반 공공/오픈 API 검색 (비동기)
 
-        # 기타 유용한 무료 API
-        results.extend(self._get_popular_free_apis(keyword, category))
+        Args:
+            keyword: 검색 키워드
+            category: API 카테고리 (문화, 관광, 지역, 인구 등)
 
-        return results
+        Returns:
+            API 정보 리스트
+        """
+        return await self._arun_all(self.asource_tasks(keyword, category=category))
 
     def _get_korean_public_apis(self, keyword: str, category: str = None) -> List[Dict[str, Any]]:
         """한국 공공데이터포털 API 목록"""
@@ -0,0 +1,123 @@
+"""
+비동기 HTTP 클라이언트: 모든 수집기가 공유하는 httpx.AsyncClient 관리
+"""
+import asyncio
+import threading
+from typing import Any, AsyncIterator, Dict, Tuple
+
+try:
+    import httpx
+except ImportError:  # httpx 미설치 시 asearch는 스레드에서 동기 검색으로 대체
+    httpx = None
+
+
+# 기본 연결 풀 설정
+DEFAULT_LIMITS = {
+    'max_connections': 50,
+    'max_keepalive_connections': 20,
+    'keepalive_expiry': 30.0
+}
+
+# 이벤트 루프별 (클라이언트, 루프 종료 시 클라이언트를 닫는 비동기 제너레이터)
+_clients: Dict[asyncio.AbstractEventLoop, Tuple['httpx.AsyncClient', AsyncIterator[None]]] = {}
+_clients_lock = threading.Lock()
+_limits = dict(DEFAULT_LIMITS)
+
+
+def is_available() -> bool:
+    """httpx 설치 여부"""
+    return httpx is not None
+
+
+def configure(limits: Dict[str, Any] = None) -> None:
+    """연결 풀 설정 변경 (다음에 생성되는 클라이언트부터 적용)"""
+    _limits.update({k: v for k, v in (limits or {}).items() if k in DEFAULT_LIMITS})
+
+
+def get_async_client() -> 'httpx.AsyncClient':
+    """
+    현재 이벤트 루프에서 공유할 AsyncClient 반환
+
+    연결은 이벤트 루프에 묶이므로 루프마다 클라이언트를 따로 만들고, 루프가
+    끝날 때(asyncio.run의 shutdown_asyncgens) 그 루프에서 함께 닫습니다.
+    """
+    if httpx is None:
+        raise RuntimeError("httpx가 설치되어 있지 않습니다: pip install httpx")
+
+    loop = asyncio.get_running_loop()
+
+    with _clients_lock:
+        entry = _clients.get(loop)
+        if entry is not None and not entry[0].is_closed:
+            return entry[0]
+
+        # 종료 처리 없이 닫힌 루프의 클라이언트는 닫을 수 없으므로 목록에서만 제거
+        for closed_loop in [other for other in _clients if other.is_closed()]:
+            del _clients[closed_loop]
+
+        client = httpx.AsyncClient(
+            limits=httpx.Limits(**_limits),
+            follow_redirects=True,
+            event_hooks={'request': [_record_request]}
+        )
+        _clients[loop] = (client, _start_lifetime(loop, client))
+
+    return client
+
+
+async def _client_lifetime(loop: asyncio.AbstractEventLoop, client: 'httpx.AsyncClient') -> AsyncIterator[None]:
+    """루프가 이 제너레이터를 종료하면(aclose) 클라이언트를 닫고 목록에서 제거"""
+    try:
+        yield
+    finally:
+        _forget(loop, client)
+        if not client.is_closed:
+            await client.aclose()
+
+
+def _start_lifetime(loop: asyncio.AbstractEventLoop, client: 'httpx.AsyncClient') -> AsyncIterator[None]:
+    """
+    클라이언트 수명 제너레이터를 첫 yield까지 진행
+
+    실행 중인 루프가 처음 진행된 비동기 제너레이터를 등록해 두었다가 종료 시
+    aclose()하므로 별도 작업 없이 클라이언트가 닫힙니다. 첫 단계는 기다리는 것 없이
+    바로 멈추므로 동기 코드에서 진행할 수 있습니다. 루프가 종료 처리 없이 닫히면
+    제너레이터는 실행되지 않고 버려집니다.
+    """
+    lifetime = _client_lifetime(loop, client)
+    try:
+        lifetime.asend(None).send(None)
+    except StopIteration:
+        pass
+    return lifetime
+
+
+def _forget(loop: asyncio.AbstractEventLoop, client: 'httpx.AsyncClient') -> None:
+    with _clients_lock:
+        entry = _clients.get(loop)
+        if entry is not None and entry[0] is client:
+            del _clients[loop]
+
+
+async def _record_request(request: 'httpx.Request') -> None:
+    """요청 수와 새 연결 수를 동기 세션과 같은 통계에 기록"""
+    from collectors.http_session import stats
+
+    host = request.url.host
+    stats.record_request(host)
+
+    async def trace(event_name, info):
+        if event_name == 'connection.connect_tcp.complete':
+            stats.record_open(host)
+
+    request.extensions['trace'] = trace
+
+
+async def aclose_async_client() -> None:
+    """현재 이벤트 루프의 공유 클라이언트 종료 (앱 종료 시 호출)"""
+    loop = asyncio.get_running_loop()
+
+    with _clients_lock:
+        entry = _clients.get(loop)
+    if entry is not None:
+        await entry[1].aclose()
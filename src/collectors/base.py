@@ -0,0 +1,365 @@
+"""
+수집기 공통 기반: 소스 단위 검색 작업 구성과 결과 병합
+"""
+import asyncio
+from contextlib import asynccontextmanager
+from functools import partial
+from typing import Awaitable, Callable, Dict, List, Any
+
+import requests
+
+from collectors import async_http
+from collectors.cache import CacheMode, CachedSourceError, ResearchCache
+from collectors.ratelimit import research_rate_limiter
+from collectors.singleflight import research_flights
+from utils.events import event_bus
+
+
+# 실패로 캐시하는 업스트림 오류 (연결·시간 초과·HTTP 오류 상태)
+# 속도 제한 대기 초과(RateLimitExceeded) 같은 로컬 오류는 캐시하지 않고 그대로 전달
+UPSTREAM_ERRORS = (requests.RequestException,)
+if async_http.httpx is not None:
+    UPSTREAM_ERRORS += (async_http.httpx.HTTPError,)
+
+class BaseResearcher:
+    """소스별 검색 메서드를 묶는 수집기 기반 클래스
+
+    하위 클래스는 `_get_sources`에서 소스 이름과 검색 메서드를 등록하고,
+    필요하면 `combine_results`에서 정렬·절단 규칙을 정의합니다.
+    네트워크를 쓰는 소스는 `_get_async_sources`에 비동기 구현을 함께 등록합니다.
+    """
+
+    # 네트워크 I/O 없이 바로 결과를 만드는 소스 (비동기 검색에서 이벤트 루프에서 직접 실행)
+    local_sources = frozenset()
+
+    # 소스별 수집 결과 캐시 (ResearchCache, ChecklistGenerator가 설정)
+    cache = None
+
+    # 동시에 들어온 같은 수집 요청 병합 (프로세스 전체 공유)
+    singleflight = research_flights
+
+    # 소스별 요청 속도 제한 (프로세스 전체 공유)
+    rate_limiter = research_rate_limiter
+
+    def _get_sources(self) -> Dict[str, Callable[..., List[Dict[str, Any]]]]:
+        """소스 이름 → 검색 메서드 (등록 순서가 실행 순서)"""
+        raise NotImplementedError
+
+    def _get_async_sources(self) -> Dict[str, Callable[..., Awaitable[List[Dict[str, Any]]]]]:
+        """소스 이름 → 비동기 검색 메서드 (없는 소스는 스레드에서 동기 메서드 실행)"""
+        return {}
+
+    def _http_get(self, source: str, url: str, **kwargs):
+        """속도 제한을 지키며 공유 세션으로 GET 요청 (HTTP 오류는 예외)"""
+        self.rate_limiter.acquire(source)
+
+        response = self.session.get(url, **kwargs)
+        self.rate_limiter.observe(source, response.status_code, response.headers)
+        if not response.ok:
+            response.close()  # stream=True면 연결을 풀로 돌려보냄
+            response.raise_for_status()
+
+        return response
+
+    async def _ahttp_get(self, source: str, url: str, **kwargs):
+        """_http_get의 비동기 버전 (공유 AsyncClient 사용)"""
+        await self.rate_limiter.aacquire(source)
+
+        response = await async_http.get_async_client().get(url, **kwargs)
+        self.rate_limiter.observe(source, response.status_code, response.headers)
+        response.raise_for_status()
+
+        return response
+
+    @asynccontextmanager
+    async def _ahttp_stream(self, source: str, url: str, **kwargs):
+        """_ahttp_get의 스트리밍 버전 (본문은 블록 안에서 aiter_bytes로 읽음)"""
+        await self.rate_limiter.aacquire(source)
+
+        async with async_http.get_async_client().stream('GET', url, **kwargs) as response:
+            self.rate_limiter.observe(source, response.status_code, response.headers)
+            response.raise_for_status()
+            yield response
+
+    def _cache_params(self) -> Dict[str, Any]:
+        """캐시 키에 포함할 요청 파라미터"""
+        return {}
+
+    def _wrap_source_task(
+        self,
+        name: str,
+        keyword: str,
+        kwargs: Dict[str, Any],
+        task: Callable,
+        cache_mode: str,
+        is_async: bool
+    ) -> Callable:
+        """
+        네트워크 소스 작업에 요청 병합과 캐시 적용
+
+        캐시 조회 → (같은 요청 병합) → 실제 수집 → 캐시 기록 순서로 감쌉니다.
+        I/O 없는 소스는 그대로 반환합니다.
+        """
+        if name in self.local_sources:
+            return task
+
+        params = {**self._cache_params(), **kwargs}
+        use_cache = self.cache is not None and cache_mode != CacheMode.OFF
+
+        if use_cache:
+            store = self._astore_call if is_async else self._store_call
+            task = partial(store, name, keyword, params, task)
+
+        flight = self._aflight_call if is_async else self._flight_call
+        task = partial(flight, name, keyword, params, task)
+
+        if use_cache and cache_mode == CacheMode.USE:
+            lookup = self._acached_call if is_async else self._cached_call
+            task = partial(lookup, name, keyword, params, task)
+
+        return task
+
+    def source_tasks(
+        self,
+        keyword: str,
+        sources: List[str] = None,
+        cache_mode: str = CacheMode.USE,
+        **kwargs
+    ) -> Dict[str, Callable[[], List[Dict[str, Any]]]]:
+        """
+        소스별 검색 작업 생성 (병렬 실행용)
+
+        각 작업은 인자 없이 호출되며, 실패 시 예외를 그대로 전달합니다.
+
+        Args:
+            keyword: 검색 키워드
+            sources: 실행할 소스 리스트 (None이면 모든 소스)
+            cache_mode: 캐시 사용 방식 (CacheMode)
+
+        Returns:
+            소스 이름 → 호출 가능한 작업
+        """
+        tasks = {}
+
+        for name, method in self._get_sources().items():
+            if sources is not None and name not in sources:
+                continue
+
+            tasks[name] = self._wrap_source_task(
+                name, keyword, kwargs,
+                partial(method, keyword, **kwargs),
+                cache_mode,
+                is_async=False
+            )
+
+        return tasks
+
+    def _cached_call(
+        self,
+        name: str,
+        keyword: str,
+        params: Dict[str, Any],
+        task: Callable[[], List[Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        """캐시를 먼저 조회하고, 없으면 작업 실행"""
+        entry = self.cache.get(name, keyword, params)
+        if entry is not None:
+            if entry.is_failure:
+                raise CachedSourceError(f"cached failure: {entry.error}")
+            return entry.results
+
+        return task()
+
+    def _store_call(
+        self,
+        name: str,
+        keyword: str,
+        params: Dict[str, Any],
+        task: Callable[[], List[Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        """작업 결과(업스트림 실패 포함)를 캐시에 기록"""
+        try:
+            results = task()
+        except UPSTREAM_ERRORS as e:
+            self.cache.set_failure(name, keyword, params, str(e))
+            raise
+
+        self.cache.set(name, keyword, params, results)
+        return results
+
+    def _flight_call(
+        self,
+        name: str,
+        keyword: str,
+        params: Dict[str, Any],
+        task: Callable[[], List[Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        """같은 (소스, 키워드, 파라미터)의 동시 수집을 하나로 병합"""
+        key = ResearchCache.make_key(name, keyword, params)
+        return list(self.singleflight.do(key, task))
+
+    def asource_tasks(
+        self,
+        keyword: str,
+        sources: List[str] = None,
+        cache_mode: str = CacheMode.USE,
+        **kwargs
+    ) -> Dict[str, Callable[[], Awaitable[List[Dict[str, Any]]]]]:
+        """
+        소스별 비동기 검색 작업 생성
+
+        Args:
+            keyword: 검색 키워드
+            sources: 실행할 소스 리스트 (None이면 모든 소스)
+            cache_mode: 캐시 사용 방식 (CacheMode)
+
+        Returns:
+            소스 이름 → 코루틴을 반환하는 작업
+        """
+        async_sources = self._get_async_sources()
+        tasks = {}
+
+        for name, method in self._get_sources().items():
+            if sources is not None and name not in sources:
+                continue
+
+            if name in async_sources:
+                task = partial(async_sources[name], keyword, **kwargs)
+            elif name in self.local_sources:
+                task = partial(self._run_inline, method, keyword, **kwargs)
+            else:
+                task = partial(asyncio.to_thread, method, keyword, **kwargs)
+
+            tasks[name] = self._wrap_source_task(
+                name, keyword, kwargs, task, cache_mode, is_async=True
+            )
+
+        return tasks
+
+    async def _acached_call(
+        self,
+        name: str,
+        keyword: str,
+        params: Dict[str, Any],
+        task: Callable[[], Awaitable[List[Dict[str, Any]]]]
+    ) -> List[Dict[str, Any]]:
+        """_cached_call의 비동기 버전 (SQLite 접근은 스레드에서 실행)"""
+        entry = await asyncio.to_thread(self.cache.get, name, keyword, params)
+        if entry is not None:
+            if entry.is_failure:
+                raise CachedSourceError(f"cached failure: {entry.error}")
+            return entry.results
+
+        return await task()
+
+    async def _astore_call(
+        self,
+        name: str,
+        keyword: str,
+        params: Dict[str, Any],
+        task: Callable[[], Awaitable[List[Dict[str, Any]]]]
+    ) -> List[Dict[str, Any]]:
+        """_store_call의 비동기 버전"""
+        try:
+            results = await task()
+        except UPSTREAM_ERRORS as e:
+            await asyncio.to_thread(self.cache.set_failure, name, keyword, params, str(e))
+            raise
+
+        await asyncio.to_thread(self.cache.set, name, keyword, params, results)
+        return results
+
+    async def _aflight_call(
+        self,
+        name: str,
+        keyword: str,
+        params: Dict[str, Any],
+        task: Callable[[], Awaitable[List[Dict[str, Any]]]]
+    ) -> List[Dict[str, Any]]:
+        """_flight_call의 비동기 버전"""
+        key = ResearchCache.make_key(name, keyword, params)
+        return list(await self.singleflight.ado(key, task))
+
+    @staticmethod
+    async def _run_inline(method, *args, **kwargs) -> List[Dict[str, Any]]:
+        """I/O 없는 동기 메서드를 코루틴으로 감싸기"""
+        return method(*args, **kwargs)
+
+    def combine_results(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """소스별 결과를 합친 뒤 최종 결과 생성"""
+        return results
+
+    def search(
+        self,
+        keyword: str,
+        sources: List[str] = None,
+        cache_mode: str = CacheMode.USE
+    ) -> List[Dict[str, Any]]:
+        """
+        키워드 기반 순차 검색
+
+        Args:
+            keyword: 검색 키워드
+            sources: 검색할 소스 리스트 (None이면 모든 소스)
+            cache_mode: 캐시 사용 방식 (CacheMode)
+
+        Returns:
+            검색 결과 리스트
+        """
+        return self._run_sequential(self.source_tasks(keyword, sources, cache_mode))
+
+    def _run_sequential(self, tasks: Dict[str, Callable[[], List[Dict[str, Any]]]]) -> List[Dict[str, Any]]:
+        """소스 작업을 차례로 실행 (실패한 소스는 건너뜀)"""
+        results = []
+
+        for name, task in tasks.items():
+            try:
+                results.extend(task())
+            except Exception as e:
+                event_bus.warning(f"Error searching {name}: {e}", source=name)
+
+        return self.combine_results(results)
+
+    async def asearch(
+        self,
+        keyword: str,
+        sources: List[str] = None,
+        cache_mode: str = CacheMode.USE
+    ) -> List[Dict[str, Any]]:
+        """
+        키워드 기반 비동기 검색 (공유 AsyncClient 사용)
+
+        httpx가 없으면 동기 검색을 스레드에서 실행합니다.
+
+        Args:
+            keyword: 검색 키워드
+            sources: 검색할 소스 리스트 (None이면 모든 소스)
+            cache_mode: 캐시 사용 방식 (CacheMode)
+
+        Returns:
+            검색 결과 리스트
+        """
+        if not async_http.is_available():
+            return await asyncio.to_thread(self.search, keyword, sources, cache_mode)
+
+        return await self._arun_all(self.asource_tasks(keyword, sources, cache_mode))
+
+    async def _arun_all(
+        self,
+        tasks: Dict[str, Callable[[], Awaitable[List[Dict[str, Any]]]]]
+    ) -> List[Dict[str, Any]]:
+        """비동기 소스 작업을 동시에 실행 (실패한 소스는 건너뜀)"""
+        names = list(tasks)
+        outcomes = await asyncio.gather(
+            *(tasks[name]() for name in names),
+            return_exceptions=True
+        )
+
+        results = []
+        for name, outcome in zip(names, outcomes):
+            if isinstance(outcome, Exception):
+                event_bus.warning(f"Error searching {name}: {outcome}", source=name)
+                continue
+            results.extend(outcome)
+
+        return self.combine_results(results)
@@ -0,0 +1,254 @@
+"""
+리서치 캐시 모듈: 소스별 수집 결과를 SQLite에 저장 (TTL, 용량 기반 LRU, 실패 캐시)
+"""
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import unicodedata
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from utils import serialization
+
+
+class CacheMode(str, Enum):
+    """캐시 사용 방식"""
+    USE = "use"          # 캐시 조회 후 없으면 수집
+    REFRESH = "refresh"  # 캐시를 무시하고 다시 수집해 갱신
+    OFF = "off"          # 캐시를 읽지도 쓰지도 않음
+
+
+class CachedSourceError(Exception):
+    """최근 실패가 캐시되어 수집을 건너뛴 소스"""
+
+
+class CacheEntry:
+    """캐시 조회 결과"""
+
+    __slots__ = ('results', 'error')
+
+    def __init__(self, results: List[Dict[str, Any]] = None, error: str = None):
+        self.results = results
+        self.error = error
+
+    @property
+    def is_failure(self) -> bool:
+        return self.error is not None
+
+
+def normalize_keyword(keyword: str) -> str:
+    """캐시 키용 키워드 정규화 (유니코드 정규화, 소문자, 공백 정리)"""
+    return ' '.join(unicodedata.normalize('NFKC', keyword).lower().split())
+
+
+class ResearchCache:
+    """소스별 리서치 결과 디스크 캐시
+
+    키는 (소스, 정규화된 키워드, 요청 파라미터)로 구성됩니다.
+    성공 결과는 cache_duration_hours 동안, 실패는 negative_ttl_minutes 동안 유지하고,
+    전체 크기가 max_size_mb를 넘으면 가장 오래 사용하지 않은 항목부터 삭제합니다.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        ttl_hours: float = 24,
+        negative_ttl_minutes: float = 10,
+        max_size_mb: float = 50
+    ):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self.ttl = float(ttl_hours) * 3600
+        self.negative_ttl = float(negative_ttl_minutes) * 60
+        self.max_size = int(float(max_size_mb) * 1024 * 1024)
+
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'negative_hits': 0, 'stores': 0, 'evictions': 0}
+
+        self._init_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=10)
+
+    def _init_db(self):
+        """캐시 테이블 초기화"""
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS research_cache (
+                    cache_key TEXT PRIMARY KEY,
+                    source TEXT NOT NULL,
+                    keyword TEXT NOT NULL,
+                    params TEXT,
+                    payload TEXT,
+                    error TEXT,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    expires_at REAL NOT NULL,
+                    last_access REAL NOT NULL
+                )
+            """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_research_cache_access "
+                "ON research_cache (last_access)"
+            )
+            conn.commit()
+
+    @staticmethod
+    def make_key(source: str, keyword: str, params: Dict[str, Any] = None) -> str:
+        """(소스, 정규화 키워드, 파라미터) 캐시 키
+
+        키는 설치된 직렬화 백엔드와 관계없이 같아야 하므로 표준 json으로 만듭니다.
+        """
+        raw = json.dumps(
+            [source, normalize_keyword(keyword), params or {}],
+            sort_keys=True,
+            ensure_ascii=False
+        )
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._stats[name] += amount
+
+    def get(self, source: str, keyword: str, params: Dict[str, Any] = None) -> Optional[CacheEntry]:
+        """
+        캐시 조회
+
+        Returns:
+            유효한 항목이 있으면 CacheEntry (실패 캐시 포함), 없으면 None
+        """
+        key = self.make_key(source, keyword, params)
+        now = time.time()
+
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT payload, error, expires_at FROM research_cache WHERE cache_key = ?",
+                (key,)
+            ).fetchone()
+
+            if row is None or row[2] <= now:
+                self._count('misses')
+                return None
+
+            conn.execute(
+                "UPDATE research_cache SET last_access = ? WHERE cache_key = ?",
+                (now, key)
+            )
+            conn.commit()
+
+        payload, error, _ = row
+        if error is not None:
+            self._count('negative_hits')
+            return CacheEntry(error=error)
+
+        self._count('hits')
+        return CacheEntry(results=serialization.loads(payload))
+
+    def set(
+        self,
+        source: str,
+        keyword: str,
+        params: Dict[str, Any],
+        results: List[Dict[str, Any]]
+    ) -> None:
+        """성공 결과 저장"""
+        payload = serialization.dumps(results)
+        self._store(source, keyword, params, payload, None, self.ttl)
+
+    def set_failure(
+        self,
+        source: str,
+        keyword: str,
+        params: Dict[str, Any],
+        error: str
+    ) -> None:
+        """실패 결과 저장 (짧은 TTL로 같은 요청의 반복 실패 방지)"""
+        if self.negative_ttl <= 0:
+            return
+        self._store(source, keyword, params, None, error, self.negative_ttl)
+
+    def _store(
+        self,
+        source: str,
+        keyword: str,
+        params: Dict[str, Any],
+        payload: Optional[str],
+        error: Optional[str],
+        ttl: float
+    ) -> None:
+        key = self.make_key(source, keyword, params)
+        now = time.time()
+        size = len(payload or error or '')
+
+        with self._connect() as conn:
+            conn.execute("""
+                INSERT OR REPLACE INTO research_cache (
+                    cache_key, source, keyword, params, payload, error,
+                    size, created_at, expires_at, last_access
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                key,
+                source,
+                normalize_keyword(keyword),
+                json.dumps(params or {}, sort_keys=True, ensure_ascii=False),
+                payload,
+                error,
+                size,
+                now,
+                now + ttl,
+                now
+            ))
+            self._evict(conn, now)
+            conn.commit()
+
+        self._count('stores')
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        """만료 항목 삭제 후 용량 초과분을 LRU 순으로 삭제"""
+        conn.execute("DELETE FROM research_cache WHERE expires_at <= ?", (now,))
+
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM research_cache").fetchone()[0]
+        if total <= self.max_size:
+            return
+
+        excess = total - self.max_size
+        victims = []
+        for key, size in conn.execute(
+            "SELECT cache_key, size FROM research_cache ORDER BY last_access ASC"
+        ):
+            victims.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+
+        conn.executemany("DELETE FROM research_cache WHERE cache_key = ?", victims)
+        self._count('evictions', len(victims))
+
+    def clear(self) -> None:
+        """캐시 전체 삭제"""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM research_cache")
+            conn.commit()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 적중 통계"""
+        with self._lock:
+            stats = dict(self._stats)
+
+        with self._connect() as conn:
+            entries, size = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM research_cache"
+            ).fetchone()
+
+        lookups = stats['hits'] + stats['negative_hits'] + stats['misses']
+        stats.update({
+            'entries': entries,
+            'size_bytes': size,
+            'hit_rate': round((stats['hits'] + stats['negative_hits']) / lookups, 3) if lookups else 0.0
+        })
+        return stats
@@ -0,0 +1,192 @@
+"""
+HTML 본문 추출 모듈: <title>과 <p>만 점진적으로 파싱하고 충분히 모이면 중단
+"""
+import codecs
+import re
+from html.parser import HTMLParser
+from typing import List, Optional
+
+try:
+    from lxml import etree as lxml_etree
+except ImportError:  # lxml 미설치 시 표준 라이브러리 파서 사용
+    lxml_etree = None
+
+
+# fetch_content 결과 크기 (본문 단락 수, 본문 글자 수)
+MAX_PARAGRAPHS = 5
+MAX_CONTENT_CHARS = 500
+
+# 인코딩 판별을 위해 모아 두는 응답 앞부분 크기
+_SNIFF_BYTES = 2048
+
+_HEADER_CHARSET = re.compile(r'charset\s*=\s*["\']?([\w.:-]+)', re.I)
+_META_CHARSET = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?([\w.:-]+)', re.I)
+
+# 열린 <p>를 암묵적으로 닫는 종료 태그
+_P_CLOSING_END_TAGS = frozenset({
+    'div', 'section', 'article', 'main', 'aside', 'header', 'footer', 'nav',
+    'td', 'th', 'li', 'dd', 'blockquote', 'form', 'body', 'html'
+})
+
+
+def charset_from_content_type(content_type: Optional[str]) -> Optional[str]:
+    """Content-Type 헤더의 charset (없으면 None)"""
+    if not content_type:
+        return None
+    match = _HEADER_CHARSET.search(content_type)
+    return match.group(1) if match else None
+
+
+class ContentExtractor:
+    """제목과 앞쪽 단락만 모으는 점진 추출기 기반 클래스
+
+    feed()로 응답 바이트를 넘기고, done이 True가 되면 더 읽지 않아도 됩니다.
+    """
+
+    def __init__(self, max_paragraphs: int = MAX_PARAGRAPHS, max_chars: int = MAX_CONTENT_CHARS):
+        self.max_paragraphs = max_paragraphs
+        self.max_chars = max_chars
+        self.title: Optional[str] = None
+        self.paragraphs: List[str] = []
+        self._length = -1  # ' '.join(paragraphs) 길이
+
+    @property
+    def done(self) -> bool:
+        """필요한 본문을 모두 모았는지 여부"""
+        return len(self.paragraphs) >= self.max_paragraphs or self._length >= self.max_chars
+
+    @property
+    def content(self) -> str:
+        """앞쪽 단락을 이어 붙인 본문 (max_chars까지)"""
+        return ' '.join(self.paragraphs[:self.max_paragraphs])[:self.max_chars]
+
+    def _add_paragraph(self, text: str) -> None:
+        if not self.done:
+            self.paragraphs.append(text)
+            self._length += len(text) + 1
+
+    def feed(self, data: bytes) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        raise NotImplementedError
+
+
+class _StdlibExtractor(ContentExtractor, HTMLParser):
+    """html.parser 기반 추출기 (트리를 만들지 않고 이벤트만 처리)"""
+
+    def __init__(self, encoding: Optional[str] = None, **kwargs):
+        ContentExtractor.__init__(self, **kwargs)
+        HTMLParser.__init__(self, convert_charrefs=True)
+        self._encoding = encoding
+        self._decoder = None
+        self._pending = b''
+        self._in_title = False
+        self._title_parts: List[str] = []
+        self._paragraph: Optional[List[str]] = None
+
+    def feed(self, data: bytes) -> None:
+        if self._decoder is None:
+            self._pending += data
+            if len(self._pending) < _SNIFF_BYTES:
+                return
+            data, self._pending = self._pending, b''
+            self._start_decoder(data)
+
+        HTMLParser.feed(self, self._decoder.decode(data))
+
+    def close(self) -> None:
+        if self._decoder is None:
+            data, self._pending = self._pending, b''
+            self._start_decoder(data)
+            HTMLParser.feed(self, self._decoder.decode(data))
+
+        HTMLParser.feed(self, self._decoder.decode(b'', final=True))
+        HTMLParser.close(self)
+        self._end_paragraph()
+
+    def _start_decoder(self, head: bytes) -> None:
+        encoding = self._encoding
+        if encoding is None:
+            match = _META_CHARSET.search(head)
+            encoding = match.group(1).decode('ascii') if match else 'utf-8'
+
+        try:
+            self._decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+        except LookupError:
+            self._decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'title' and self.title is None:
+            self._in_title = True
+        elif tag == 'p':
+            self._end_paragraph()
+            self._paragraph = []
+
+    def handle_endtag(self, tag):
+        if tag == 'title' and self._in_title:
+            self._in_title = False
+            self.title = ''.join(self._title_parts)
+        elif tag == 'p' or tag in _P_CLOSING_END_TAGS:
+            self._end_paragraph()
+
+    def handle_data(self, data):
+        if self._in_title:
+            self._title_parts.append(data)
+        if self._paragraph is not None:
+            self._paragraph.append(data)
+
+    def _end_paragraph(self) -> None:
+        if self._paragraph is not None:
+            self._add_paragraph(''.join(self._paragraph))
+            self._paragraph = None
+
+
+class _LxmlExtractor(ContentExtractor):
+    """lxml(libxml2) 기반 추출기 (<title>, <p> 종료 이벤트만 받음)"""
+
+    def __init__(self, encoding: Optional[str] = None, **kwargs):
+        super().__init__(**kwargs)
+        self._parser = lxml_etree.HTMLPullParser(
+            events=('end',),
+            tag=('title', 'p'),
+            encoding=encoding,
+            recover=True
+        )
+
+    def feed(self, data: bytes) -> None:
+        self._parser.feed(data)
+        self._drain()
+
+    def close(self) -> None:
+        try:
+            self._parser.close()
+        except lxml_etree.XMLSyntaxError:
+            pass  # 빈 문서 또는 중간에 끊긴 응답
+        self._drain()
+
+    def _drain(self) -> None:
+        for _, elem in self._parser.read_events():
+            text = ''.join(elem.itertext())
+            if elem.tag == 'title':
+                if self.title is None:
+                    self.title = text
+            else:
+                self._add_paragraph(text)
+            elem.clear(keep_tail=True)
+
+
+def create_extractor(encoding: Optional[str] = None, **kwargs) -> ContentExtractor:
+    """
+    사용 가능한 가장 빠른 추출기 생성
+
+    Args:
+        encoding: 응답 헤더에서 알아낸 인코딩 (None이면 문서에서 판별)
+        **kwargs: max_paragraphs, max_chars
+
+    Returns:
+        lxml이 있으면 lxml 추출기, 없으면 html.parser 추출기
+    """
+    if lxml_etree is not None:
+        return _LxmlExtractor(encoding, **kwargs)
+    return _StdlibExtractor(encoding, **kwargs)
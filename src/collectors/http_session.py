@@ -0,0 +1,158 @@
+"""
+HTTP 세션 모듈: 모든 수집기가 공유하는 연결 풀(keep-alive) 세션과 연결 통계
+"""
+import threading
+from typing import Any, Dict
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from collectors import async_http
+
+
+# 기본 연결 풀 설정 (config/settings.json의 "http" 항목으로 변경)
+DEFAULT_HTTP_SETTINGS = {
+    'pool_connections': 10,                 # 호스트별 연결 풀을 유지할 호스트 수
+    'pool_maxsize': 20,                     # 호스트당 유지할 최대 연결 수
+    'max_retries': 0,
+    'async_max_connections': 50,
+    'async_max_keepalive_connections': 20,
+    'keepalive_expiry': 30.0
+}
+
+
+class ConnectionStats:
+    """호스트별 요청 수와 새로 연 연결 수 집계"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._hosts = {}
+
+    def _host(self, host: str) -> Dict[str, int]:
+        return self._hosts.setdefault(host, {'requests': 0, 'opened': 0})
+
+    def record_request(self, host: str) -> None:
+        with self._lock:
+            self._host(host)['requests'] += 1
+
+    def record_open(self, host: str) -> None:
+        with self._lock:
+            self._host(host)['opened'] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        통계 스냅샷
+
+        Returns:
+            hosts(호스트별 requests/opened/reused)와 전체 합계
+        """
+        with self._lock:
+            hosts = {
+                host: {
+                    'requests': counts['requests'],
+                    'opened': counts['opened'],
+                    'reused': max(counts['requests'] - counts['opened'], 0)
+                }
+                for host, counts in self._hosts.items()
+            }
+
+        totals = {
+            key: sum(h[key] for h in hosts.values())
+            for key in ('requests', 'opened', 'reused')
+        }
+
+        return {'hosts': hosts, **totals}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._hosts.clear()
+
+
+stats = ConnectionStats()
+
+
+class _CountingHTTPConnectionPool(HTTPConnectionPool):
+    """새 연결을 열 때 통계에 기록하는 HTTP 연결 풀"""
+
+    def _new_conn(self):
+        stats.record_open(self.host)
+        return super()._new_conn()
+
+
+class _CountingHTTPSConnectionPool(HTTPSConnectionPool):
+    """새 연결을 열 때 통계에 기록하는 HTTPS 연결 풀"""
+
+    def _new_conn(self):
+        stats.record_open(self.host)
+        return super()._new_conn()
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """호스트별 연결 풀을 재사용하고 요청/연결 수를 집계하는 어댑터"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': _CountingHTTPConnectionPool,
+            'https': _CountingHTTPSConnectionPool
+        }
+
+    def send(self, request, **kwargs):
+        stats.record_request(urlparse(request.url).hostname or '')
+        return super().send(request, **kwargs)
+
+
+_lock = threading.Lock()
+_session = None
+_settings = dict(DEFAULT_HTTP_SETTINGS)
+
+
+def _mount_adapters(session: requests.Session) -> None:
+    """현재 설정으로 어댑터 장착"""
+    for prefix in ('http://', 'https://'):
+        session.mount(prefix, PooledHTTPAdapter(
+            pool_connections=int(_settings['pool_connections']),
+            pool_maxsize=int(_settings['pool_maxsize']),
+            max_retries=int(_settings['max_retries'])
+        ))
+
+
+def configure(settings: Dict[str, Any] = None) -> None:
+    """
+    연결 풀 설정 적용 (동기 세션과 비동기 클라이언트 모두)
+
+    Args:
+        settings: config의 "http" 항목
+    """
+    with _lock:
+        _settings.update({
+            k: v for k, v in (settings or {}).items() if k in DEFAULT_HTTP_SETTINGS
+        })
+
+        if _session is not None:
+            _mount_adapters(_session)
+
+    async_http.configure({
+        'max_connections': int(_settings['async_max_connections']),
+        'max_keepalive_connections': int(_settings['async_max_keepalive_connections']),
+        'keepalive_expiry': float(_settings['keepalive_expiry'])
+    })
+
+
+def get_session() -> requests.Session:
+    """프로세스 전체에서 공유하는 세션 반환"""
+    global _session
+
+    with _lock:
+        if _session is None:
+            _session = requests.Session()
+            _mount_adapters(_session)
+
+        return _session
+
+
+def get_connection_stats() -> Dict[str, Any]:
+    """연결 재사용 통계"""
+    return stats.snapshot()
@@ -0,0 +1,86 @@
+"""
+페이지 저장소 모듈: URL별 ETag/Last-Modified와 추출한 본문을 SQLite에 저장 (조건부 GET 재검증용)
+"""
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+class PageStore:
+    """fetch_content 결과와 검증자(ETag, Last-Modified) 저장소
+
+    다음 요청에서 If-None-Match/If-Modified-Since를 보내고, 서버가 304로
+    응답하면 저장해 둔 본문을 그대로 사용합니다.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._init_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=10)
+
+    def _init_db(self):
+        """페이지 테이블 초기화"""
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS page_store (
+                    url TEXT PRIMARY KEY,
+                    etag TEXT,
+                    last_modified TEXT,
+                    title TEXT,
+                    content TEXT,
+                    fetched_at TEXT NOT NULL
+                )
+            """)
+            conn.commit()
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        저장된 페이지 조회
+
+        Returns:
+            url, etag, last_modified, title, content, fetched_at (없으면 None)
+        """
+        with self._connect() as conn:
+            conn.row_factory = sqlite3.Row
+            row = conn.execute(
+                "SELECT * FROM page_store WHERE url = ?", (url,)
+            ).fetchone()
+
+        return dict(row) if row else None
+
+    def set(
+        self,
+        url: str,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        page: Dict[str, Any]
+    ) -> None:
+        """페이지 저장 (검증자가 없으면 재검증할 수 없으므로 저장하지 않음)"""
+        if not etag and not last_modified:
+            return
+
+        with self._connect() as conn:
+            conn.execute("""
+                INSERT OR REPLACE INTO page_store (
+                    url, etag, last_modified, title, content, fetched_at
+                ) VALUES (?, ?, ?, ?, ?, ?)
+            """, (
+                url,
+                etag,
+                last_modified,
+                page.get('title', ''),
+                page.get('content', ''),
+                page['fetched_at']
+            ))
+            conn.commit()
+
+    def clear(self) -> None:
+        """저장소 전체 삭제"""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM page_store")
+            conn.commit()
@@ -2,203 +2,228 @@
 논문 리서치 모듈: Semantic Scholar, CrossRef, arXiv API를 통한 논문 검색
 """
 import requests
-from typing import List, Dict, Any
+import re
+import unicodedata
+import xml.etree.ElementTree as ET
+from typing import List, Dict, Any, Tuple
 from datetime import datetime
-import time
 from urllib.parse import quote_plus
 
+from collectors.base import BaseResearcher
+from collectors.http_session import get_session
 
-class PaperResearcher:
+
+# arXiv는 Atom XML 응답을 반환
+_ATOM_NS = {'atom': 'http://www.w3.org/2005/Atom', 'arxiv': 'http://arxiv.org/schemas/atom'}
+_ATOM_ENTRY = '{http://www.w3.org/2005/Atom}entry'
+
+# 스트리밍 응답을 읽는 단위 (bytes)
+ARXIV_CHUNK_SIZE = 16 * 1024
+
+_ARXIV_ABS_URL = re.compile(r'arxiv\.org/abs/(.+?)(?:v\d+)?$', re.I)
+_ARXIV_DOI = re.compile(r'^10\.48550/arxiv\.(.+)$', re.I)
+_ARXIV_VERSION = re.compile(r'v\d+$')
+_NON_WORD = re.compile(r'[\W_]+')
+
+# 제목만으로 같은 논문이라고 판단할 최소 단어 수
+MIN_TITLE_KEY_WORDS = 3
+
+
+class PaperResearcher(BaseResearcher):
     """학술 논문 검색 및 수집기"""
 
-    def __init__(self, max_results: int = 10):
+    def __init__(self, max_results: int = 10, session: requests.Session = None):
         self.max_results = max_results
+        self.session = session or get_session()
         self.semantic_scholar_api = "https://api.semanticscholar.org/graph/v1"
         self.crossref_api = "https://api.crossref.org/works"
         self.arxiv_api = "http://export.arxiv.org/api/query"
 
-    def search(self, keyword: str, sources: List[str] = None) -> List[Dict[str, Any]]:
-        """
-        키워드 기반 논문 검색
-
-        Args:
-            keyword: 검색 키워드
-            sources: 검색할 소스 리스트 (None이면 모든 소스)
-
-        Returns:
-            논문 결과 리스트
-        """
-        results = []
-
-        if sources is None or 'semantic_scholar' in sources:
-            results.extend(self._search_semantic_scholar(keyword))
-
-        if sources is None or 'crossref' in sources:
-            results.extend(self._search_crossref(keyword))
+    def _get_sources(self):
+        """논문 검색 소스"""
+        return {
+            'semantic_scholar': self._search_semantic_scholar,
+            'crossref': self._search_crossref,
+            'arxiv': self._search_arxiv
+        }
 
-        if sources is None or 'arxiv' in sources:
-            results.extend(self._search_arxiv(keyword))
+    def _cache_params(self) -> Dict[str, Any]:
+        """캐시 키에 포함할 요청 파라미터"""
+        return {'max_results': self.max_results}
 
-        # 연도 기준 정렬 (최신순)
-        results.sort(key=lambda x: x.get('year', 0), reverse=True)
+    def combine_results(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """소스 간 중복 논문을 합치고 연도 기준 정렬 (최신순) 후 상위 결과 반환"""
+        results = dedupe_papers(results)
+        results.sort(key=lambda x: x.get('year') or 0, reverse=True)
 
         return results[:self.max_results]
 
+    def _get_async_sources(self):
+        """논문 검색 소스 (비동기)"""
+        return {
+            'semantic_scholar': self._asearch_semantic_scholar,
+            'crossref': self._asearch_crossref,
+            'arxiv': self._asearch_arxiv
+        }
+
     def _search_semantic_scholar(self, keyword: str) -> List[Dict[str, Any]]:
         """Semantic Scholar API를 통한 논문 검색"""
-        results = []
+        url, params = self._semantic_scholar_request(keyword)
 
-        try:
-            url = f"{self.semantic_scholar_api}/paper/search"
-            params = {
-                'query': keyword,
-                'limit': min(self.max_results, 10),
-                'fields': 'title,authors,year,abstract,citationCount,venue,url'
-            }
+        response = self._http_get('semantic_scholar', url, params=params, timeout=10)
+
+        return self._parse_semantic_scholar(response.json(), keyword)
 
-            response = requests.get(url, params=params, timeout=10)
+    async def _asearch_semantic_scholar(self, keyword: str) -> List[Dict[str, Any]]:
+        """Semantic Scholar API를 통한 논문 검색 (비동기)"""
+        url, params = self._semantic_scholar_request(keyword)
 
-            if response.status_code == 200:
-                data = response.json()
+        response = await self._ahttp_get('semantic_scholar', url, params=params, timeout=10)
 
-                for paper in data.get('data', []):
-                    authors = [author.get('name', '') for author in paper.get('authors', [])]
+        return self._parse_semantic_scholar(response.json(), keyword)
 
-                    results.append({
-                        'title': paper.get('title', ''),
-                        'authors': authors,
-                        'year': paper.get('year'),
-                        'abstract': paper.get('abstract', '')[:500],  # 처음 500자
-                        'citations': paper.get('citationCount', 0),
-                        'venue': paper.get('venue', ''),
-                        'url': paper.get('url', ''),
-                        'source': 'Semantic Scholar',
-                        'relevance_score': self._calculate_relevance(paper, keyword)
-                    })
+    def _semantic_scholar_request(self, keyword: str) -> Tuple[str, Dict[str, Any]]:
+        """Semantic Scholar 검색 요청 URL과 파라미터"""
+        url = f"{self.semantic_scholar_api}/paper/search"
+        params = {
+            'query': keyword,
+            'limit': min(self.max_results, 10),
+            'fields': 'title,authors,year,abstract,citationCount,venue,url,externalIds'
+        }
 
-            time.sleep(0.5)  # API Rate limit 고려
+        return url, params
 
-        except Exception as e:
-            print(f"Error searching Semantic Scholar: {e}")
+    def _parse_semantic_scholar(self, data: Dict[str, Any], keyword: str) -> List[Dict[str, Any]]:
+        """Semantic Scholar 응답 파싱"""
+        results = []
+
+        for paper in data.get('data', []):
+            authors = [author.get('name', '') for author in paper.get('authors', [])]
+            external_ids = paper.get('externalIds') or {}
+
+            results.append({
+                'title': paper.get('title', ''),
+                'authors': authors,
+                'year': paper.get('year'),
+                'abstract': (paper.get('abstract') or '')[:500],  # 처음 500자
+                'citations': paper.get('citationCount', 0),
+                'venue': paper.get('venue', ''),
+                'url': paper.get('url', ''),
+                'doi': external_ids.get('DOI') or '',
+                'arxiv_id': external_ids.get('ArXiv') or '',
+                'source': 'Semantic Scholar',
+                'relevance_score': self._calculate_relevance(paper, keyword)
+            })
 
         return results
 
     def _search_crossref(self, keyword: str) -> List[Dict[str, Any]]:
         """CrossRef API를 통한 논문 검색"""
-        results = []
+        url, params = self._crossref_request(keyword)
 
-        try:
-            params = {
-                'query': keyword,
-                'rows': min(self.max_results, 10),
-                'sort': 'relevance',
-                'order': 'desc'
-            }
+        response = self._http_get('crossref', url, params=params, timeout=10)
+
+        return self._parse_crossref(response.json())
+
+    async def _asearch_crossref(self, keyword: str) -> List[Dict[str, Any]]:
+        """CrossRef API를 통한 논문 검색 (비동기)"""
+        url, params = self._crossref_request(keyword)
+
+        response = await self._ahttp_get('crossref', url, params=params, timeout=10)
+
+        return self._parse_crossref(response.json())
 
-            response = requests.get(self.crossref_api, params=params, timeout=10)
-
-            if response.status_code == 200:
-                data = response.json()
-
-                for item in data.get('message', {}).get('items', []):
-                    # 저자 정보 추출
-                    authors = []
-                    for author in item.get('author', []):
-                        name = f"{author.get('given', '')} {author.get('family', '')}".strip()
-                        if name:
-                            authors.append(name)
-
-                    # 발행 연도 추출
-                    year = None
-                    pub_date = item.get('published-print') or item.get('published-online')
-                    if pub_date and 'date-parts' in pub_date:
-                        date_parts = pub_date['date-parts'][0]
-                        if date_parts:
-                            year = date_parts[0]
-
-                    results.append({
-                        'title': item.get('title', [''])[0],
-                        'authors': authors,
-                        'year': year,
-                        'abstract': item.get('abstract', '')[:500],
-                        'citations': item.get('is-referenced-by-count', 0),
-                        'venue': item.get('container-title', [''])[0],
-                        'url': item.get('URL', ''),
-                        'doi': item.get('DOI', ''),
-                        'source': 'CrossRef',
-                        'relevance_score': 0.8
-                    })
-
-            time.sleep(0.5)
-
-        except Exception as e:
-            print(f"Error searching CrossRef: {e}")
+    def _crossref_request(self, keyword: str) -> Tuple[str, Dict[str, Any]]:
+        """CrossRef 검색 요청 URL과 파라미터"""
+        params = {
+            'query': keyword,
+            'rows': min(self.max_results, 10),
+            'sort': 'relevance',
+            'order': 'desc'
+        }
+
+        return self.crossref_api, params
+
+    def _parse_crossref(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """CrossRef 응답 파싱"""
+        results = []
+
+        for item in data.get('message', {}).get('items', []):
+            # 저자 정보 추출
+            authors = []
+            for author in item.get('author', []):
+                name = f"{author.get('given', '')} {author.get('family', '')}".strip()
+                if name:
+                    authors.append(name)
+
+            # 발행 연도 추출
+            year = None
+            pub_date = item.get('published-print') or item.get('published-online')
+            if pub_date and 'date-parts' in pub_date:
+                date_parts = pub_date['date-parts'][0]
+                if date_parts:
+                    year = date_parts[0]
+
+            results.append({
+                'title': item.get('title', [''])[0],
+                'authors': authors,
+                'year': year,
+                'abstract': (item.get('abstract') or '')[:500],
+                'citations': item.get('is-referenced-by-count', 0),
+                'venue': item.get('container-title', [''])[0],
+                'url': item.get('URL', ''),
+                'doi': item.get('DOI', ''),
+                'source': 'CrossRef',
+                'relevance_score': 0.8
+            })
 
         return results
 
     def _search_arxiv(self, keyword: str) -> List[Dict[str, Any]]:
-        """arXiv API를 통한 논문 검색"""
+        """arXiv API를 통한 논문 검색 (응답을 받는 대로 항목 단위 파싱)"""
+        url, params = self._arxiv_request(keyword)
+
+        response = self._http_get('arxiv', url, params=params, timeout=10, stream=True)
+
+        parser = ArxivFeedParser()
         results = []
+        with response:
+            for chunk in response.iter_content(chunk_size=ARXIV_CHUNK_SIZE):
+                results.extend(parser.feed(chunk))
+        results.extend(parser.close())
 
-        try:
-            params = {
-                'search_query': f'all:{keyword}',
-                'start': 0,
-                'max_results': min(self.max_results, 10),
-                'sortBy': 'relevance',
-                'sortOrder': 'descending'
-            }
+        return results
+
+    async def _asearch_arxiv(self, keyword: str) -> List[Dict[str, Any]]:
+        """arXiv API를 통한 논문 검색 (비동기, 응답을 받는 대로 항목 단위 파싱)"""
+        url, params = self._arxiv_request(keyword)
 
-            response = requests.get(self.arxiv_api, params=params, timeout=10)
-
-            if response.status_code == 200:
-                # arXiv는 XML 응답을 반환
-                import xml.etree.ElementTree as ET
-
-                root = ET.fromstring(response.content)
-                ns = {'atom': 'http://www.w3.org/2005/Atom'}
-
-                for entry in root.findall('atom:entry', ns):
-                    title = entry.find('atom:title', ns)
-                    title_text = title.text.strip() if title is not None else ''
-
-                    # 저자 추출
-                    authors = []
-                    for author in entry.findall('atom:author', ns):
-                        name = author.find('atom:name', ns)
-                        if name is not None:
-                            authors.append(name.text)
-
-                    # 발행 날짜
-                    published = entry.find('atom:published', ns)
-                    year = None
-                    if published is not None:
-                        year = int(published.text[:4])
-
-                    # 초록
-                    summary = entry.find('atom:summary', ns)
-                    abstract = summary.text[:500] if summary is not None else ''
-
-                    # URL
-                    link = entry.find('atom:id', ns)
-                    url = link.text if link is not None else ''
-
-                    results.append({
-                        'title': title_text,
-                        'authors': authors,
-                        'year': year,
-                        'abstract': abstract,
-                        'citations': 0,  # arXiv는 citation 정보 제공 안함
-                        'venue': 'arXiv',
-                        'url': url,
-                        'source': 'arXiv',
-                        'relevance_score': 0.75
-                    })
-
-            time.sleep(0.5)
-
-        except Exception as e:
-            print(f"Error searching arXiv: {e}")
+        parser = ArxivFeedParser()
+        results = []
+        async with self._ahttp_stream('arxiv', url, params=params, timeout=10) as response:
+            async for chunk in response.aiter_bytes(ARXIV_CHUNK_SIZE):
+                results.extend(parser.feed(chunk))
+        results.extend(parser.close())
+
+        return results
+
+    def _arxiv_request(self, keyword: str) -> Tuple[str, Dict[str, Any]]:
+        """arXiv 검색 요청 URL과 파라미터"""
+        params = {
+            'search_query': f'all:{keyword}',
+            'start': 0,
+            'max_results': min(self.max_results, 10),
+            'sortBy': 'relevance',
+            'sortOrder': 'descending'
+        }
+
+        return self.arxiv_api, params
+
+    def _parse_arxiv(self, content: bytes) -> List[Dict[str, Any]]:
+        """arXiv Atom 응답 파싱 (이미 받은 전체 응답)"""
+        parser = ArxivFeedParser()
+        results = parser.feed(content)
+        results.extend(parser.close())
 
         return results
 
@@ -207,17 +232,17 @@ class PaperResearcher:
         score = 0.0
 
         # 제목에 키워드 포함
-        title = paper.get('title', '').lower()
+        title = (paper.get('title') or '').lower()
         if keyword.lower() in title:
             score += 0.5
 
         # 초록에 키워드 포함
-        abstract = paper.get('abstract', '').lower()
+        abstract = (paper.get('abstract') or '').lower()
         if keyword.lower() in abstract:
             score += 0.3
 
         # 인용 수 반영 (정규화)
-        citations = paper.get('citationCount', 0)
+        citations = paper.get('citationCount') or 0
         if citations > 100:
             score += 0.2
         elif citations > 10:
@@ -274,3 +299,191 @@ class PaperResearcher:
                 distribution[year] = distribution.get(year, 0) + 1
 
         return dict(sorted(distribution.items(), reverse=True))
+
+
+class ArxivFeedParser:
+    """arXiv Atom 응답 점진 파서
+
+    받은 바이트를 feed()로 넘기면 그 사이에 완성된 <entry>만 논문 정보로
+    변환해 돌려주고, 변환한 항목은 트리에서 제거해 응답 크기와 관계없이
+    메모리 사용량을 일정하게 유지합니다.
+    """
+
+    def __init__(self):
+        self._parser = ET.XMLPullParser(events=('start', 'end'))
+        self._root = None
+
+    def feed(self, data: bytes) -> List[Dict[str, Any]]:
+        """응답 일부를 파싱하고 완성된 항목 반환"""
+        self._parser.feed(data)
+        return self._drain()
+
+    def close(self) -> List[Dict[str, Any]]:
+        """응답 끝 처리 (잘린 XML이면 ET.ParseError)"""
+        self._parser.close()
+        return self._drain()
+
+    def _drain(self) -> List[Dict[str, Any]]:
+        results = []
+
+        for event, elem in self._parser.read_events():
+            if event == 'start':
+                if self._root is None:
+                    self._root = elem
+                continue
+
+            if elem.tag == _ATOM_ENTRY:
+                results.append(_parse_arxiv_entry(elem))
+                self._root.remove(elem)
+
+        return results
+
+
+def _parse_arxiv_entry(entry: ET.Element) -> Dict[str, Any]:
+    """<entry> 요소 → 논문 정보"""
+    title = entry.find('atom:title', _ATOM_NS)
+    title_text = title.text.strip() if title is not None else ''
+
+    # 저자 추출
+    authors = []
+    for author in entry.findall('atom:author', _ATOM_NS):
+        name = author.find('atom:name', _ATOM_NS)
+        if name is not None:
+            authors.append(name.text)
+
+    # 발행 날짜
+    published = entry.find('atom:published', _ATOM_NS)
+    year = None
+    if published is not None:
+        year = int(published.text[:4])
+
+    # 초록
+    summary = entry.find('atom:summary', _ATOM_NS)
+    abstract = summary.text[:500] if summary is not None else ''
+
+    # URL
+    link = entry.find('atom:id', _ATOM_NS)
+    url = link.text if link is not None else ''
+
+    # 학술지에 게재된 경우 DOI
+    doi = entry.find('arxiv:doi', _ATOM_NS)
+
+    return {
+        'title': title_text,
+        'authors': authors,
+        'year': year,
+        'abstract': abstract,
+        'citations': 0,  # arXiv는 citation 정보 제공 안함
+        'venue': 'arXiv',
+        'url': url,
+        'doi': doi.text.strip() if doi is not None and doi.text else '',
+        'arxiv_id': _arxiv_id_from_url(url),
+        'source': 'arXiv',
+        'relevance_score': 0.75
+    }
+
+
+def _arxiv_id_from_url(url: str) -> str:
+    """arXiv abs URL → 버전 없는 arXiv id"""
+    match = _ARXIV_ABS_URL.search(url or '')
+    return match.group(1) if match else ''
+
+
+def _normalize_title(title: str) -> str:
+    """제목 비교용 정규화 (유니코드 정규화, 대소문자, 구두점·공백 제거)"""
+    return _NON_WORD.sub(' ', unicodedata.normalize('NFKC', title or '').casefold()).strip()
+
+
+def _paper_keys(paper: Dict[str, Any]) -> List[Tuple[str, str]]:
+    """같은 논문 판별 키 (DOI, arXiv id, 정규화 제목)"""
+    keys = []
+
+    doi = (paper.get('doi') or '').strip().lower()
+    arxiv_id = (paper.get('arxiv_id') or '').strip().lower()
+    if doi:
+        keys.append(('doi', doi))
+        # arXiv가 발급한 DOI (10.48550/arXiv.<id>)
+        match = _ARXIV_DOI.match(doi)
+        if match and not arxiv_id:
+            arxiv_id = match.group(1)
+    if arxiv_id:
+        keys.append(('arxiv', _ARXIV_VERSION.sub('', arxiv_id)))
+
+    # 짧은 제목(예: 'Editorial')은 서로 다른 논문이 겹치기 쉬워 키로 쓰지 않음
+    title = _normalize_title(paper.get('title', ''))
+    if len(title.split()) >= MIN_TITLE_KEY_WORDS:
+        keys.append(('title', title))
+
+    return keys
+
+
+def _richness(paper: Dict[str, Any]) -> Tuple[int, int]:
+    """레코드 정보량 (채워진 필드 수, 인용 수)"""
+    filled = sum(1 for value in paper.values() if value not in (None, '', [], 0))
+    return filled, paper.get('citations') or 0
+
+
+def _merge_papers(group: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    같은 논문 레코드 병합
+
+    정보가 가장 많은 레코드를 기준으로 비어 있는 필드를 다른 레코드에서 채우고,
+    인용 수와 관련성 점수는 최댓값을 사용합니다. 원본 dict는 수정하지 않습니다.
+    """
+    richest = max(group, key=_richness)
+    merged = dict(richest)
+    merged['authors'] = list(richest.get('authors') or [])
+
+    for paper in group:
+        if paper is richest:
+            continue
+        for field, value in paper.items():
+            if merged.get(field) in (None, '', []) and value not in (None, '', []):
+                merged[field] = list(value) if isinstance(value, list) else value
+
+    merged['citations'] = max((paper.get('citations') or 0) for paper in group)
+    merged['relevance_score'] = max((paper.get('relevance_score') or 0) for paper in group)
+    merged['sources'] = list(dict.fromkeys(paper.get('source', '') for paper in group))
+
+    return merged
+
+
+def dedupe_papers(papers: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    DOI, arXiv id, 정규화 제목 중 하나라도 같은 논문을 하나로 병합
+
+    키 → 레코드 매핑과 union-find로 한 번만 순회하므로 결과 수에 선형입니다.
+    A·B가 DOI로, B·C가 제목으로 같으면 A·B·C 모두 합쳐집니다.
+
+    Args:
+        papers: 소스별 논문 결과를 이어 붙인 리스트
+
+    Returns:
+        처음 등장한 순서를 유지한 중복 제거 결과 (병합된 레코드에는 sources 추가)
+    """
+    parent = list(range(len(papers)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    owners: Dict[Tuple[str, str], int] = {}
+    for index, paper in enumerate(papers):
+        for key in _paper_keys(paper):
+            owner = owners.setdefault(key, index)
+            if owner != index:
+                root, other = find(owner), find(index)
+                if root != other:
+                    # 먼저 등장한 레코드를 대표로 유지
+                    parent[max(root, other)] = min(root, other)
+
+    groups: Dict[int, List[Dict[str, Any]]] = {}
+    for index, paper in enumerate(papers):
+        groups.setdefault(find(index), []).append(paper)
+
+    return [
+        group[0] if len(group) == 1 else _merge_papers(group)
+        for group in groups.values()
+    ]
@@ -0,0 +1,210 @@
+"""
+병렬 수집 모듈: 제한된 워커 풀에서 소스별 검색 작업 실행
+"""
+import asyncio
+import contextvars
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Awaitable, Callable, Dict, Any, Tuple
+
+
+# 소스 완료 알림 (소스 이름, 상태)
+SourceCallback = Callable[[str, Dict[str, Any]], None]
+
+
+class ParallelCollector:
+    """소스 단위 병렬 수집기
+
+    실행마다 제한된 스레드 풀을 새로 만들어 작업을 동시에 실행하고,
+    소스별 제한 시간을 넘긴 작업은 결과를 기다리지 않고 timeout으로 기록합니다.
+    제한 시간을 넘긴 스레드는 그 실행의 풀에만 남아 있다가 스스로 끝나므로
+    다음 실행의 워커 자리를 차지하지 않습니다.
+    """
+
+    # 대기 중인 작업이 있을 때 시작 여부를 다시 확인하는 간격(초)
+    POLL_INTERVAL = 0.05
+
+    def __init__(
+        self,
+        max_workers: int = 8,
+        source_timeout: float = 15.0,
+        source_timeouts: Dict[str, float] = None
+    ):
+        self.max_workers = max(1, int(max_workers))
+        self.source_timeout = float(source_timeout)
+        self.source_timeouts = source_timeouts or {}
+
+    def _timeout_for(self, name: str) -> float:
+        """소스별 제한 시간 ('papers.arxiv' 또는 'arxiv' 키 모두 허용)"""
+        if name in self.source_timeouts:
+            return float(self.source_timeouts[name])
+
+        short_name = name.split('.', 1)[-1]
+        return float(self.source_timeouts.get(short_name, self.source_timeout))
+
+    def run(
+        self,
+        tasks: Dict[str, Callable[[], Any]],
+        on_source_done: SourceCallback = None
+    ) -> Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]:
+        """
+        작업 병렬 실행
+
+        Args:
+            tasks: 소스 이름 → 인자 없는 작업
+            on_source_done: 소스가 끝날 때마다 (이름, 상태)로 호출할 함수
+
+        Returns:
+            (완료된 소스의 결과, 소스별 상태)
+            상태는 status('completed' | 'error' | 'timeout'), elapsed, count/error를 포함
+        """
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, min(self.max_workers, len(tasks))),
+            thread_name_prefix='research'
+        )
+        try:
+            return self._collect(executor, tasks, on_source_done)
+        finally:
+            # 제한 시간을 넘겨 아직 실행 중인 작업은 기다리지 않음
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _collect(
+        self,
+        executor: ThreadPoolExecutor,
+        tasks: Dict[str, Callable[[], Any]],
+        on_source_done: SourceCallback = None
+    ) -> Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]:
+        """주어진 풀에서 작업을 실행하고 완료·오류·제한 시간 초과를 기록"""
+        results = {}
+        status = {}
+        started = {}
+        lock = threading.Lock()
+
+        def _run(name, task):
+            with lock:
+                started[name] = time.monotonic()
+            return task()
+
+        # 이벤트 문맥(job_id 등)을 워커 스레드에서도 유지
+        futures = {
+            executor.submit(contextvars.copy_context().run, _run, name, task): name
+            for name, task in tasks.items()
+        }
+        pending = set(futures)
+
+        while pending:
+            now = time.monotonic()
+
+            # 제한 시간 초과 작업 정리
+            with lock:
+                start_times = dict(started)
+
+            for future in list(pending):
+                name = futures[future]
+                start = start_times.get(name)
+                if start is not None and now - start >= self._timeout_for(name):
+                    future.cancel()
+                    pending.discard(future)
+                    status[name] = {
+                        'status': 'timeout',
+                        'elapsed': round(now - start, 3)
+                    }
+                    if on_source_done is not None:
+                        on_source_done(name, status[name])
+
+            if not pending:
+                break
+
+            # 다음 마감 시각까지 대기 (시작 전 작업이 있으면 짧게 폴링)
+            deadlines = [
+                start_times[futures[f]] + self._timeout_for(futures[f])
+                for f in pending if futures[f] in start_times
+            ]
+            wait_time = max(min(deadlines) - now, 0) if deadlines else self.POLL_INTERVAL
+            if len(deadlines) < len(pending):
+                wait_time = min(wait_time, self.POLL_INTERVAL)
+
+            done, _ = wait(pending, timeout=wait_time, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                pending.discard(future)
+                name = futures[future]
+                elapsed = round(time.monotonic() - started.get(name, now), 3)
+
+                try:
+                    items = future.result()
+                except Exception as e:
+                    status[name] = {'status': 'error', 'error': str(e), 'elapsed': elapsed}
+                else:
+                    results[name] = items
+                    status[name] = {
+                        'status': 'completed',
+                        'count': len(items),
+                        'elapsed': elapsed
+                    }
+
+                if on_source_done is not None:
+                    on_source_done(name, status[name])
+
+        # 소스 등록 순서대로 상태 정렬
+        ordered_status = {name: status[name] for name in tasks if name in status}
+        return results, ordered_status
+
+    async def arun(
+        self,
+        tasks: Dict[str, Callable[[], Awaitable[Any]]],
+        on_source_done: SourceCallback = None
+    ) -> Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]:
+        """
+        비동기 작업 동시 실행 (이벤트 루프에서 max_workers개까지)
+
+        Args:
+            tasks: 소스 이름 → 코루틴을 반환하는 작업
+            on_source_done: 소스가 끝날 때마다 (이름, 상태)로 호출할 함수
+
+        Returns:
+            run()과 같은 형식의 (결과, 소스별 상태)
+        """
+        semaphore = asyncio.Semaphore(self.max_workers)
+
+        async def _run(name, task):
+            outcome = await _execute(name, task)
+            if on_source_done is not None:
+                on_source_done(name, outcome[1])
+            return outcome
+
+        async def _execute(name, task):
+            async with semaphore:
+                start = time.monotonic()
+                try:
+                    items = await asyncio.wait_for(task(), timeout=self._timeout_for(name))
+                except asyncio.TimeoutError:
+                    return None, {
+                        'status': 'timeout',
+                        'elapsed': round(time.monotonic() - start, 3)
+                    }
+                except Exception as e:
+                    return None, {
+                        'status': 'error',
+                        'error': str(e),
+                        'elapsed': round(time.monotonic() - start, 3)
+                    }
+
+                return items, {
+                    'status': 'completed',
+                    'count': len(items),
+                    'elapsed': round(time.monotonic() - start, 3)
+                }
+
+        names = list(tasks)
+        outcomes = await asyncio.gather(*(_run(name, tasks[name]) for name in names))
+
+        results = {}
+        status = {}
+        for name, (items, source_status) in zip(names, outcomes):
+            status[name] = source_status
+            if source_status['status'] == 'completed':
+                results[name] = items
+
+        return results, status
@@ -0,0 +1,206 @@
+"""
+요청 속도 제한 모듈: 소스별 토큰 버킷과 응답 헤더 기반 조정
+"""
+import asyncio
+import os
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Mapping, Optional
+
+
+# 소스별 기본 제한 (rate: 초당 요청 수, burst: 연속 허용 요청 수)
+DEFAULT_RATE_LIMITS = {
+    'default': {'rate': 5.0, 'burst': 5},
+    'semantic_scholar': {'rate': 1.0, 'burst': 1},
+    'crossref': {'rate': 5.0, 'burst': 5},
+    'arxiv': {'rate': 0.34, 'burst': 1},
+    'github': {'rate': 0.5, 'burst': 5},
+    'npm': {'rate': 5.0, 'burst': 5}
+}
+
+# 이 시간(초)보다 오래 기다려야 하면 대기하지 않고 실패 처리
+DEFAULT_MAX_WAIT = 30.0
+
+# 같은 설정으로 동시에 수집하는 프로세스 수 (대시보드 serve()가 설정)
+RATE_LIMIT_PROCESSES_ENV = 'CHECKLIST_RATE_LIMIT_PROCESSES'
+
+
+def rate_limit_processes() -> int:
+    """설정된 속도 제한을 나눠 쓸 프로세스 수 (환경변수가 없으면 1)"""
+    try:
+        return max(1, int(os.environ.get(RATE_LIMIT_PROCESSES_ENV, 1)))
+    except ValueError:
+        return 1
+
+
+class RateLimitExceeded(Exception):
+    """허용 대기 시간 안에 요청할 수 없는 소스"""
+
+
+class TokenBucket:
+    """토큰 버킷 (동시 호출자는 예약 순서대로 대기)"""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = max(float(rate), 1e-6)
+        self.burst = max(int(burst), 1)
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0       # 서버가 알려준 재시도 가능 시각 (monotonic)
+        self.server_rate = None        # 남은 허용량 기반으로 낮춘 속도
+        self._lock = threading.Lock()
+
+    def _effective_rate(self) -> float:
+        if self.server_rate is None:
+            return self.rate
+        return min(self.rate, self.server_rate)
+
+    def reserve(self, max_wait: float) -> float:
+        """
+        토큰 하나를 예약하고 기다려야 할 시간 반환
+
+        Raises:
+            RateLimitExceeded: 대기 시간이 max_wait를 넘는 경우 (토큰은 소비하지 않음)
+        """
+        with self._lock:
+            now = time.monotonic()
+            rate = self._effective_rate()
+
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * rate)
+            self.updated = now
+
+            wait = 0.0 if self.tokens >= 1 else (1 - self.tokens) / rate
+            wait = max(wait, self.blocked_until - now)
+
+            if wait > max_wait:
+                raise RateLimitExceeded(f"rate limited for {wait:.1f}s")
+
+            self.tokens -= 1
+            return wait
+
+    def block_for(self, seconds: float) -> None:
+        """서버 지시에 따라 일정 시간 요청 중단"""
+        with self._lock:
+            self.blocked_until = max(self.blocked_until, time.monotonic() + max(seconds, 0))
+
+    def set_server_rate(self, rate: Optional[float]) -> None:
+        with self._lock:
+            self.server_rate = rate
+
+
+class RateLimiter:
+    """소스별 요청 속도 제한기
+
+    수집기는 요청 전에 acquire()를 호출하고, 응답을 받으면 observe()로
+    Retry-After, X-RateLimit-Remaining/Reset 헤더를 반영합니다.
+    버킷은 프로세스 안에서만 공유되므로, 여러 프로세스가 같은 소스에 요청하면
+    configure(processes=N)로 설정값을 N등분해 합계가 설정을 넘지 않게 합니다.
+    서버 헤더(Retry-After 등)로 낮춘 제한은 그 응답을 받은 프로세스에만 반영됩니다.
+    """
+
+    def __init__(self, limits: Dict[str, Dict[str, Any]] = None, max_wait: float = DEFAULT_MAX_WAIT):
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, TokenBucket] = {}
+        self.limits = {}
+        self.max_wait = DEFAULT_MAX_WAIT
+        self.processes = 1
+        self.configure(limits, max_wait)
+
+    def configure(
+        self,
+        limits: Dict[str, Dict[str, Any]] = None,
+        max_wait: float = None,
+        processes: int = 1
+    ) -> None:
+        """
+        소스별 제한 설정 (기본값 위에 덮어씀, 기존 버킷은 새 설정으로 다시 생성)
+
+        Args:
+            limits: 소스별 {'rate', 'burst'} (전체 프로세스 합계 기준)
+            max_wait: 최대 대기 시간(초)
+            processes: 같은 설정으로 동시에 수집하는 프로세스 수
+        """
+        with self._lock:
+            self.limits = {k: dict(v) for k, v in DEFAULT_RATE_LIMITS.items()}
+            for source, limit in (limits or {}).items():
+                self.limits.setdefault(source, {}).update(limit)
+            if max_wait is not None:
+                self.max_wait = float(max_wait)
+            self.processes = max(1, int(processes))
+            self._buckets.clear()
+
+    def _bucket(self, source: str) -> TokenBucket:
+        with self._lock:
+            bucket = self._buckets.get(source)
+            if bucket is None:
+                limit = self.limits.get(source, self.limits['default'])
+                rate = limit.get('rate', self.limits['default']['rate'])
+                burst = limit.get('burst', self.limits['default']['burst'])
+
+                # 프로세스별 몫 (연속 허용 수는 최소 1)
+                bucket = TokenBucket(
+                    float(rate) / self.processes,
+                    max(1, int(burst) // self.processes)
+                )
+                self._buckets[source] = bucket
+            return bucket
+
+    def acquire(self, source: str) -> None:
+        """요청 허용까지 대기"""
+        wait = self._bucket(source).reserve(self.max_wait)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def aacquire(self, source: str) -> None:
+        """요청 허용까지 대기 (비동기)"""
+        wait = self._bucket(source).reserve(self.max_wait)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def observe(self, source: str, status_code: int, headers: Mapping[str, str]) -> None:
+        """응답 헤더로 제한 조정"""
+        bucket = self._bucket(source)
+
+        retry_after = _parse_retry_after(headers.get('Retry-After'))
+        if retry_after is not None and status_code in (403, 429, 503):
+            bucket.block_for(retry_after)
+
+        remaining = headers.get('X-RateLimit-Remaining')
+        reset = headers.get('X-RateLimit-Reset')
+        if remaining is None or reset is None:
+            return
+
+        try:
+            remaining = int(remaining)
+            seconds_to_reset = max(float(reset) - time.time(), 0.0)
+        except ValueError:
+            return
+
+        if remaining <= 0:
+            bucket.block_for(seconds_to_reset)
+            bucket.set_server_rate(None)
+        elif seconds_to_reset > 0:
+            # 남은 허용량을 리셋 시각까지 고르게 분배
+            bucket.set_server_rate(remaining / seconds_to_reset)
+        else:
+            bucket.set_server_rate(None)
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After 헤더 (초 또는 HTTP 날짜) → 대기 초"""
+    if not value:
+        return None
+
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+# 프로세스 안에서 공유하는 리서치 속도 제한기
+research_rate_limiter = RateLimiter()
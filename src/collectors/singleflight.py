@@ -0,0 +1,110 @@
+"""
+요청 병합 모듈: 같은 (소스, 키워드) 수집이 동시에 들어오면 하나의 실행 결과를 공유
+"""
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class _Call:
+    """진행 중인 동기 호출"""
+
+    __slots__ = ('event', 'result', 'error')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """동일 키의 동시 호출을 하나로 합치는 실행기
+
+    먼저 들어온 호출(leader)만 실제로 실행하고, 실행 중에 들어온 같은 키의
+    호출은 그 결과(또는 예외)를 함께 받습니다. 완료 후에는 키가 해제되어
+    다음 호출은 다시 실행됩니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._tasks: Dict[Hashable, asyncio.Task] = {}
+        self._stats = {'calls': 0, 'executed': 0, 'coalesced': 0}
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        키 단위로 병합된 동기 실행
+
+        Args:
+            key: 병합 키
+            fn: 실제 실행할 함수
+
+        Returns:
+            fn의 결과 (병합된 호출은 leader의 결과)
+        """
+        with self._lock:
+            self._stats['calls'] += 1
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+                self._stats['executed'] += 1
+            else:
+                self._stats['coalesced'] += 1
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.event.set()
+
+    async def ado(self, key: Hashable, coro_fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        키 단위로 병합된 비동기 실행
+
+        공유 작업은 shield로 감싸므로 한 호출자가 취소되거나 시간 초과되어도
+        나머지 호출자는 계속 결과를 기다릴 수 있습니다.
+        """
+        loop = asyncio.get_running_loop()
+        task_key = (id(loop), key)
+
+        with self._lock:
+            self._stats['calls'] += 1
+            task = self._tasks.get(task_key)
+            if task is None:
+                task = loop.create_task(coro_fn())
+                self._tasks[task_key] = task
+                self._stats['executed'] += 1
+                task.add_done_callback(lambda _: self._release(task_key))
+            else:
+                self._stats['coalesced'] += 1
+
+        return await asyncio.shield(task)
+
+    def _release(self, task_key: Hashable) -> None:
+        with self._lock:
+            self._tasks.pop(task_key, None)
+
+    def get_stats(self) -> Dict[str, int]:
+        """병합 통계 (calls = executed + coalesced)"""
+        with self._lock:
+            return {
+                **self._stats,
+                'in_flight': len(self._calls) + len(self._tasks)
+            }
+
+
+# 프로세스 안에서 공유하는 리서치 요청 병합기 (다른 프로세스의 같은 수집과는 합치지 않음)
+research_flights = SingleFlight()
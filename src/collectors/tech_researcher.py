@@ -2,16 +2,29 @@
 기술 트렌드 모듈: GitHub API, 패키지 레지스트리, Product Hunt 등
 """
 import requests
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 from datetime import datetime, timedelta
-import time
 
+from collectors.base import BaseResearcher
+from collectors.http_session import get_session
+from utils.events import event_bus
 
-class TechResearcher:
+
+class TechResearcher(BaseResearcher):
     """기술 트렌드 및 오픈소스 수집기"""
 
-    def __init__(self, github_token: str = None, max_results: int = 10, min_stars: int = 10):
+    # PyPI는 예시 메타데이터만 생성
+    local_sources = frozenset({'pypi'})
+
+    def __init__(
+        self,
+        github_token: str = None,
+        max_results: int = 10,
+        min_stars: int = 10,
+        session: requests.Session = None
+    ):
         self.github_token = github_token
+        self.session = session or get_session()
         self.max_results = max_results
         self.min_stars = min_stars
         self.github_api = "https://api.github.com"
@@ -22,143 +35,166 @@ class TechResearcher:
         if github_token:
             self.headers['Authorization'] = f'token {github_token}'
 
-    def search(self, keyword: str, sources: List[str] = None) -> List[Dict[str, Any]]:
-        """
-        키워드 기반 기술 트렌드 검색
-
-        Args:
-            keyword: 검색 키워드
-            sources: 검색할 소스 리스트
-
-        Returns:
-            기술 정보 리스트
-        """
-        results = []
-
-        if sources is None or 'github' in sources:
-            results.extend(self._search_github(keyword))
-
-        if sources is None or 'npm' in sources:
-            results.extend(self._search_npm(keyword))
+    def _get_sources(self):
+        """기술 트렌드 검색 소스"""
+        return {
+            'github': self._search_github,
+            'npm': self._search_npm,
+            'pypi': self._search_pypi
+        }
 
-        if sources is None or 'pypi' in sources:
-            results.extend(self._search_pypi(keyword))
+    def _cache_params(self) -> Dict[str, Any]:
+        """캐시 키에 포함할 요청 파라미터"""
+        return {'max_results': self.max_results, 'min_stars': self.min_stars}
 
-        # 인기도 기준 정렬
+    def combine_results(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """인기도 기준 정렬 후 상위 결과 반환"""
         results.sort(key=lambda x: x.get('popularity_score', 0), reverse=True)
 
         return results[:self.max_results]
 
+    def _get_async_sources(self):
+        """기술 트렌드 검색 소스 (비동기)"""
+        return {
+            'github': self._asearch_github,
+            'npm': self._asearch_npm
+        }
+
     def _search_github(self, keyword: str) -> List[Dict[str, Any]]:
         """GitHub 레포지토리 검색"""
-        results = []
+        url, params = self._github_request(keyword)
 
-        try:
-            url = f"{self.github_api}/search/repositories"
-            params = {
-                'q': f'{keyword} stars:>={self.min_stars}',
-                'sort': 'stars',
-                'order': 'desc',
-                'per_page': min(self.max_results, 30)
-            }
+        response = self._http_get('github', url, headers=self.headers, params=params, timeout=10)
+
+        results = self._parse_github(response.json())
+        self._check_github_rate_limit(response.headers)
+
+        return results
 
-            response = requests.get(url, headers=self.headers, params=params, timeout=10)
-
-            if response.status_code == 200:
-                data = response.json()
-
-                for repo in data.get('items', []):
-                    # 최근 업데이트 날짜
-                    updated_at = datetime.strptime(
-                        repo['updated_at'], '%Y-%m-%dT%H:%M:%SZ'
-                    )
-
-                    # 활성도 계산
-                    days_since_update = (datetime.now() - updated_at).days
-                    is_active = days_since_update < 180  # 6개월 이내 업데이트
-
-                    # 인기도 점수 계산
-                    popularity_score = self._calculate_github_popularity(repo)
-
-                    # 주요 언어
-                    language = repo.get('language', 'Unknown')
-
-                    # 토픽/태그
-                    topics = repo.get('topics', [])
-
-                    results.append({
-                        'name': repo['name'],
-                        'full_name': repo['full_name'],
-                        'description': repo.get('description', ''),
-                        'url': repo['html_url'],
-                        'stars': repo['stargazers_count'],
-                        'forks': repo['forks_count'],
-                        'watchers': repo['watchers_count'],
-                        'open_issues': repo['open_issues_count'],
-                        'language': language,
-                        'topics': topics,
-                        'created_at': repo['created_at'],
-                        'updated_at': repo['updated_at'],
-                        'is_active': is_active,
-                        'license': repo.get('license', {}).get('name', 'No License'),
-                        'popularity_score': popularity_score,
-                        'source': 'GitHub',
-                        'type': 'repository'
-                    })
-
-            # GitHub API Rate limit 확인
-            if 'X-RateLimit-Remaining' in response.headers:
-                remaining = int(response.headers['X-RateLimit-Remaining'])
-                if remaining < 10:
-                    print(f"Warning: GitHub API rate limit low ({remaining} remaining)")
-
-            time.sleep(1)  # Rate limit 고려
-
-        except Exception as e:
-            print(f"Error searching GitHub: {e}")
+    async def _asearch_github(self, keyword: str) -> List[Dict[str, Any]]:
+        """GitHub 레포지토리 검색 (비동기)"""
+        url, params = self._github_request(keyword)
+
+        response = await self._ahttp_get('github', url, headers=self.headers, params=params, timeout=10)
+
+        results = self._parse_github(response.json())
+        self._check_github_rate_limit(response.headers)
+
+        return results
+
+    def _github_request(self, keyword: str) -> Tuple[str, Dict[str, Any]]:
+        """GitHub 검색 요청 URL과 파라미터"""
+        url = f"{self.github_api}/search/repositories"
+        params = {
+            'q': f'{keyword} stars:>={self.min_stars}',
+            'sort': 'stars',
+            'order': 'desc',
+            'per_page': min(self.max_results, 30)
+        }
+
+        return url, params
+
+    def _parse_github(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """GitHub 검색 응답 파싱"""
+        results = []
+
+        for repo in data.get('items', []):
+            # 최근 업데이트 날짜
+            updated_at = datetime.strptime(
+                repo['updated_at'], '%Y-%m-%dT%H:%M:%SZ'
+            )
+
+            # 활성도 계산
+            days_since_update = (datetime.now() - updated_at).days
+            is_active = days_since_update < 180  # 6개월 이내 업데이트
+
+            # 인기도 점수 계산
+            popularity_score = self._calculate_github_popularity(repo)
+
+            # 주요 언어
+            language = repo.get('language', 'Unknown')
+
+            # 토픽/태그
+            topics = repo.get('topics', [])
+
+            results.append({
+                'name': repo['name'],
+                'full_name': repo['full_name'],
+                'description': repo.get('description', ''),
+                'url': repo['html_url'],
+                'stars': repo['stargazers_count'],
+                'forks': repo['forks_count'],
+                'watchers': repo['watchers_count'],
+                'open_issues': repo['open_issues_count'],
+                'language': language,
+                'topics': topics,
+                'created_at': repo['created_at'],
+                'updated_at': repo['updated_at'],
+                'is_active': is_active,
+                'license': (repo.get('license') or {}).get('name', 'No License'),
+                'popularity_score': popularity_score,
+                'source': 'GitHub',
+                'type': 'repository'
+            })
 
         return results
 
+    def _check_github_rate_limit(self, headers) -> None:
+        """GitHub API Rate limit 확인"""
+        if 'X-RateLimit-Remaining' in headers:
+            remaining = int(headers['X-RateLimit-Remaining'])
+            if remaining < 10:
+                event_bus.warning(f"GitHub API rate limit low ({remaining} remaining)", source='github')
+
     def _search_npm(self, keyword: str) -> List[Dict[str, Any]]:
         """npm 패키지 검색"""
-        results = []
+        url, params = self._npm_request(keyword)
 
-        try:
-            url = "https://registry.npmjs.org/-/v1/search"
-            params = {
-                'text': keyword,
-                'size': min(self.max_results, 20)
-            }
+        response = self._http_get('npm', url, params=params, timeout=10)
+
+        return self._parse_npm(response.json())
 
-            response = requests.get(url, params=params, timeout=10)
+    async def _asearch_npm(self, keyword: str) -> List[Dict[str, Any]]:
+        """npm 패키지 검색 (비동기)"""
+        url, params = self._npm_request(keyword)
 
-            if response.status_code == 200:
-                data = response.json()
+        response = await self._ahttp_get('npm', url, params=params, timeout=10)
 
-                for pkg in data.get('objects', []):
-                    package = pkg.get('package', {})
+        return self._parse_npm(response.json())
 
-                    # 인기도 점수
-                    score = pkg.get('score', {})
-                    popularity = score.get('detail', {}).get('popularity', 0)
+    def _npm_request(self, keyword: str) -> Tuple[str, Dict[str, Any]]:
+        """npm 검색 요청 URL과 파라미터"""
+        url = "https://registry.npmjs.org/-/v1/search"
+        params = {
+            'text': keyword,
+            'size': min(self.max_results, 20)
+        }
 
-                    results.append({
-                        'name': package.get('name', ''),
-                        'description': package.get('description', ''),
-                        'version': package.get('version', ''),
-                        'url': package.get('links', {}).get('npm', ''),
-                        'repository': package.get('links', {}).get('repository', ''),
-                        'author': package.get('author', {}).get('name', ''),
-                        'keywords': package.get('keywords', []),
-                        'popularity_score': popularity,
-                        'source': 'npm',
-                        'type': 'package'
-                    })
+        return url, params
 
-            time.sleep(0.5)
+    def _parse_npm(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """npm 검색 응답 파싱"""
+        results = []
 
-        except Exception as e:
-            print(f"Error searching npm: {e}")
+        for pkg in data.get('objects', []):
+            package = pkg.get('package', {})
+
+            # 인기도 점수
+            score = pkg.get('score', {})
+            popularity = score.get('detail', {}).get('popularity', 0)
+
+            results.append({
+                'name': package.get('name', ''),
+                'description': package.get('description', ''),
+                'version': package.get('version', ''),
+                'url': package.get('links', {}).get('npm', ''),
+                'repository': package.get('links', {}).get('repository', ''),
+                'author': package.get('author', {}).get('name', ''),
+                'keywords': package.get('keywords', []),
+                'popularity_score': popularity,
+                'source': 'npm',
+                'type': 'package'
+            })
 
         return results
 
@@ -166,32 +202,28 @@ class TechResearcher:
         """PyPI 패키지 검색"""
         results = []
 
-        try:
-            url = "https://pypi.org/pypi"
+        url = "https://pypi.org/pypi"
 
-            # PyPI 검색 (간단한 예시, 실제로는 더 복잡한 검색 필요)
-            search_url = f"https://pypi.org/search/?q={keyword}"
+        # PyPI 검색 (간단한 예시, 실제로는 더 복잡한 검색 필요)
+        search_url = f"https://pypi.org/search/?q={keyword}"
 
-            # 직접 API 대신 주요 패키지만 메타데이터로 제공
-            # 실제 구현에서는 BeautifulSoup으로 크롤링하거나 다른 방법 사용
+        # 직접 API 대신 주요 패키지만 메타데이터로 제공
+        # 실제 구현에서는 BeautifulSoup으로 크롤링하거나 다른 방법 사용
 
-            # 예시 데이터
-            popular_packages = [
-                {'name': f'{keyword}-related-package', 'description': f'{keyword} 관련 Python 패키지'}
-            ]
+        # 예시 데이터
+        popular_packages = [
+            {'name': f'{keyword}-related-package', 'description': f'{keyword} 관련 Python 패키지'}
+        ]
 
-            for pkg in popular_packages:
-                results.append({
-                    'name': pkg['name'],
-                    'description': pkg['description'],
-                    'url': f"https://pypi.org/project/{pkg['name']}/",
-                    'popularity_score': 0.5,
-                    'source': 'PyPI',
-                    'type': 'package'
-                })
-
-        except Exception as e:
-            print(f"Error searching PyPI: {e}")
+        for pkg in popular_packages:
+            results.append({
+                'name': pkg['name'],
+                'description': pkg['description'],
+                'url': f"https://pypi.org/project/{pkg['name']}/",
+                'popularity_score': 0.5,
+                'source': 'PyPI',
+                'type': 'package'
+            })
 
         return results
 
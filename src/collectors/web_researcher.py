@@ -2,49 +2,75 @@
 웹 리서치 모듈: 뉴스, 블로그, 공공기관 자료 수집
 """
 import requests
+import threading
 from bs4 import BeautifulSoup
-from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from itertools import zip_longest
+from typing import List, Dict, Any, Tuple
 from datetime import datetime
 import time
-from urllib.parse import quote_plus
+from urllib.parse import quote_plus, urlparse
 
+from collectors.base import BaseResearcher
+from collectors.html_extract import (
+    MAX_CONTENT_CHARS, MAX_PARAGRAPHS, charset_from_content_type, create_extractor
+)
+from collectors.http_session import get_session
+from utils.events import event_bus
 
-class WebResearcher:
+
+# fetch_content가 읽는 최대 응답 크기 기본값 (bytes)
+DEFAULT_MAX_CONTENT_BYTES = 1024 * 1024
+
+# 스트리밍 응답을 읽는 단위 (bytes)
+CONTENT_CHUNK_SIZE = 16 * 1024
+
+# fetch_many 동시 요청 수 기본값 (전체, 도메인별)
+DEFAULT_FETCH_WORKERS = 16
+DEFAULT_FETCH_PER_DOMAIN = 4
+
+
+class WebResearcher(BaseResearcher):
     """웹 기반 리서치 수집기"""
 
-    def __init__(self, max_results: int = 10, timeout: int = 10):
+    # 사이트 메타데이터만 생성 (실제 크롤링은 fetch_content)
+    local_sources = frozenset({'government', 'industry', 'community'})
+
+    # 조건부 GET 재검증용 페이지 저장소 (PageStore, ChecklistGenerator가 설정)
+    page_store = None
+
+    def __init__(
+        self,
+        max_results: int = 10,
+        timeout: int = 10,
+        session: requests.Session = None,
+        max_content_bytes: int = DEFAULT_MAX_CONTENT_BYTES,
+        fetch_workers: int = DEFAULT_FETCH_WORKERS,
+        fetch_per_domain: int = DEFAULT_FETCH_PER_DOMAIN
+    ):
         self.max_results = max_results
+        self.session = session or get_session()
         self.timeout = timeout
+        self.max_content_bytes = max_content_bytes
+        self.fetch_workers = fetch_workers
+        self.fetch_per_domain = fetch_per_domain
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
 
-    def search(self, keyword: str, sources: List[str] = None) -> List[Dict[str, Any]]:
-        """
-        키워드 기반 웹 검색
-
-        Args:
-            keyword: 검색 키워드
-            sources: 특정 출처 리스트 (None이면 모든 출처)
-
-        Returns:
-            검색 결과 리스트
-        """
-        results = []
-
-        # 한국 정부/공공기관 사이트
-        if sources is None or 'government' in sources:
-            results.extend(self._search_government_sites(keyword))
-
-        # 산업/시장 리포트
-        if sources is None or 'industry' in sources:
-            results.extend(self._search_industry_reports(keyword))
-
-        # 기술 블로그 및 커뮤니티
-        if sources is None or 'community' in sources:
-            results.extend(self._search_tech_blogs(keyword))
+    def _get_sources(self):
+        """웹 검색 소스"""
+        return {
+            # 한국 정부/공공기관 사이트
+            'government': self._search_government_sites,
+            # 산업/시장 리포트
+            'industry': self._search_industry_reports,
+            # 기술 블로그 및 커뮤니티
+            'community': self._search_tech_blogs
+        }
 
-        # 결과 정렬 (최신순)
+    def combine_results(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """결과 정렬 (최신순) 후 상위 결과 반환"""
         results.sort(key=lambda x: x.get('published_date', ''), reverse=True)
 
         return results[:self.max_results]
@@ -86,7 +112,7 @@ class WebResearcher:
                     'credibility_score': 0.95  # 정부 사이트는 높은 신뢰도
                 })
             except Exception as e:
-                print(f"Error searching {site['name']}: {e}")
+                event_bus.warning(f"Error searching {site['name']}: {e}", source=site['name'])
                 continue
 
         return results
@@ -121,7 +147,7 @@ class WebResearcher:
                     'credibility_score': 0.85
                 })
             except Exception as e:
-                print(f"Error searching {site['name']}: {e}")
+                event_bus.warning(f"Error searching {site['name']}: {e}", source=site['name'])
                 continue
 
         return results
@@ -149,36 +175,149 @@ class WebResearcher:
                     'credibility_score': 0.70
                 })
             except Exception as e:
-                print(f"Error searching {platform['name']}: {e}")
+                event_bus.warning(f"Error searching {platform['name']}: {e}", source=platform['name'])
                 continue
 
         return results
 
-    def fetch_content(self, url: str) -> Dict[str, Any]:
-        """URL에서 실제 콘텐츠 가져오기"""
+    def fetch_content(self, url: str, streaming: bool = True) -> Dict[str, Any]:
+        """
+        URL에서 실제 콘텐츠 가져오기
+
+        page_store가 설정되어 있으면 저장된 ETag/Last-Modified로 조건부 요청을 보내고,
+        304 응답이면 파싱 없이 저장된 본문을 반환합니다.
+
+        Args:
+            url: 가져올 페이지
+            streaming: True면 max_content_bytes까지만 받으면서 <title>과 <p>만 파싱하고,
+                본문이 충분히 모이면 다운로드를 중단. False면 전체를 받아 BeautifulSoup으로 파싱
+
+        Returns:
+            title, content(앞쪽 단락 500자), url, fetched_at
+            (재검증된 경우 not_modified=True, 실패 시 error, url)
+        """
         try:
-            response = requests.get(url, headers=self.headers, timeout=self.timeout)
-            response.raise_for_status()
+            stored = self.page_store.get(url) if self.page_store is not None else None
+            headers = dict(self.headers)
+            if stored is not None:
+                if stored['etag']:
+                    headers['If-None-Match'] = stored['etag']
+                if stored['last_modified']:
+                    headers['If-Modified-Since'] = stored['last_modified']
 
-            soup = BeautifulSoup(response.content, 'html.parser')
+            response = self.session.get(url, headers=headers, timeout=self.timeout, stream=True)
+            with response:
+                if response.status_code == 304 and stored is not None:
+                    return {
+                        'title': stored['title'],
+                        'content': stored['content'],
+                        'url': url,
+                        'fetched_at': stored['fetched_at'],
+                        'not_modified': True
+                    }
 
-            # 제목 추출
-            title = soup.find('title')
-            title_text = title.get_text() if title else ''
+                response.raise_for_status()
 
-            # 본문 추출 (간단한 예시)
-            paragraphs = soup.find_all('p')
-            content = ' '.join([p.get_text() for p in paragraphs[:5]])
+                if streaming:
+                    title, content = self._extract_streaming(response)
+                else:
+                    title, content = self._extract_full(response.content)
 
-            return {
-                'title': title_text,
-                'content': content[:500],  # 처음 500자
+            page = {
+                'title': title,
+                'content': content,
                 'url': url,
                 'fetched_at': datetime.now().isoformat()
             }
 
+            if self.page_store is not None:
+                self.page_store.set(
+                    url,
+                    response.headers.get('ETag'),
+                    response.headers.get('Last-Modified'),
+                    page
+                )
+
+            return page
+
         except Exception as e:
             return {
                 'error': str(e),
                 'url': url
             }
+
+    def _extract_streaming(self, response: requests.Response) -> Tuple[str, str]:
+        """max_content_bytes까지 받으면서 제목과 앞쪽 단락 추출"""
+        extractor = create_extractor(
+            charset_from_content_type(response.headers.get('Content-Type'))
+        )
+        remaining = self.max_content_bytes
+
+        for chunk in response.iter_content(chunk_size=CONTENT_CHUNK_SIZE):
+            extractor.feed(chunk[:remaining])
+            remaining -= len(chunk)
+            if extractor.done or remaining <= 0:
+                break
+
+        extractor.close()
+
+        return extractor.title or '', extractor.content
+
+    def _extract_full(self, content: bytes) -> Tuple[str, str]:
+        """전체 페이지를 BeautifulSoup으로 파싱해 제목과 앞쪽 단락 추출 (기존 방식)"""
+        soup = BeautifulSoup(content, 'html.parser')
+
+        # 제목 추출
+        title = soup.find('title')
+        title_text = title.get_text() if title else ''
+
+        # 본문 추출 (간단한 예시)
+        paragraphs = soup.find_all('p')
+        text = ' '.join([p.get_text() for p in paragraphs[:MAX_PARAGRAPHS]])
+
+        return title_text, text[:MAX_CONTENT_CHARS]  # 처음 500자
+
+    def fetch_many(self, urls: List[str], streaming: bool = True) -> List[Dict[str, Any]]:
+        """
+        여러 URL을 동시에 가져오기
+
+        전체 동시 요청은 fetch_workers개, 같은 도메인은 fetch_per_domain개로 제한합니다.
+        중복 URL은 한 번만 요청합니다.
+
+        Args:
+            urls: 가져올 페이지 리스트
+            streaming: fetch_content와 동일
+
+        Returns:
+            urls 순서대로 fetch_content 결과
+        """
+        unique_urls = list(dict.fromkeys(urls))
+        if not unique_urls:
+            return []
+
+        by_domain: Dict[str, List[str]] = {}
+        for url in unique_urls:
+            by_domain.setdefault(urlparse(url).netloc.lower(), []).append(url)
+
+        domain_limits = {
+            domain: threading.BoundedSemaphore(self.fetch_per_domain)
+            for domain in by_domain
+        }
+
+        def fetch(url: str) -> Dict[str, Any]:
+            with domain_limits[urlparse(url).netloc.lower()]:
+                return self.fetch_content(url, streaming)
+
+        # 도메인을 번갈아 제출해 한 도메인 대기로 작업 스레드가 묶이지 않도록 함
+        order = [
+            url
+            for group in zip_longest(*by_domain.values())
+            for url in group
+            if url is not None
+        ]
+
+        workers = min(self.fetch_workers, len(order))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='fetch') as executor:
+            pages = dict(zip(order, executor.map(fetch, order)))
+
+        return [pages[url] for url in urls]
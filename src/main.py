@@ -11,6 +11,8 @@ sys.path.insert(0, str(Path(__file__).parent))
 from utils.config import config
 from checklist.templates import ChecklistTemplates, FacilityType, CheckPhase, FocusArea
 from checklist.generator import ChecklistGenerator
+from collectors.cache import CacheMode
+from utils.events import CliPrinter, event_bus
 
 
 def main():
@@ -26,6 +28,9 @@ def main():
   # 데이터 수집 포함
   python src/main.py generate "○○건설 현장" --type "건설현장" --stage "초기 평가" --collect
 
+  # 캐시를 무시하고 다시 수집
+  python src/main.py generate "○○건설 현장" --type "건설현장" --collect --refresh
+
   # JSON 형식으로 출력
   python src/main.py generate "△△제조공장" --type "제조사업장" --stage "연간 종합" --format json
 
@@ -61,6 +66,17 @@ def main():
         action='store_true',
         help='리서치 데이터 수집 실행'
     )
+    cache_group = generate_parser.add_mutually_exclusive_group()
+    cache_group.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='리서치 캐시를 사용하지 않음'
+    )
+    cache_group.add_argument(
+        '--refresh',
+        action='store_true',
+        help='캐시를 무시하고 다시 수집해 캐시 갱신'
+    )
     generate_parser.add_argument(
         '--format',
         choices=['markdown', 'json', 'both'],
@@ -111,27 +127,40 @@ def cmd_generate(args):
     print(f"  재난·안전 체크리스트 시스템")
     print(f"{'='*70}\n")
 
+    # 생성 진행 상황을 콘솔에 출력
+    event_bus.subscribe(CliPrinter())
+
     # 생성기 초기화
     generator = ChecklistGenerator(config.settings)
 
+    # 캐시 사용 방식
+    cache_mode = CacheMode.USE
+    if args.no_cache:
+        cache_mode = CacheMode.OFF
+    elif args.refresh:
+        cache_mode = CacheMode.REFRESH
+
     # 체크리스트 생성
     result = generator.generate(
         keyword=args.keyword,
         facility_type=args.type,
         check_phase=args.stage,
         focus_area=args.focus,
-        collect_data=args.collect
+        collect_data=args.collect,
+        cache_mode=cache_mode
     )
 
-    # 출력
+    # 출력 (두 형식 모두 저장하면 같은 이름을 사용)
+    output_stem = generator.new_output_stem(result)
+
     if args.format in ['markdown', 'both']:
         output_path = args.output if args.output else None
-        md_path = generator.export_to_markdown(result, output_path)
+        md_path = generator.export_to_markdown(result, output_path, output_stem=output_stem)
         print(f"\n✅ Markdown 파일: {md_path}")
 
     if args.format in ['json', 'both']:
         output_path = args.output if args.output and args.format == 'json' else None
-        json_path = generator.export_to_json(result, output_path)
+        json_path = generator.export_to_json(result, output_path, output_stem=output_stem)
         print(f"✅ JSON 파일: {json_path}")
 
     # 요약 출력
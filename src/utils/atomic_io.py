@@ -0,0 +1,79 @@
+"""
+원자적 파일 쓰기: 같은 디렉토리의 임시 파일에 쓴 뒤 rename으로 교체
+
+쓰는 도중 프로세스가 죽어도 대상 경로에는 이전 파일이 그대로 있거나 완성된
+새 파일만 보입니다. 남은 임시 파일은 점(.)으로 시작하고 .tmp로 끝납니다.
+"""
+import os
+import tempfile
+from enum import Enum
+from pathlib import Path
+from typing import Iterable, Union
+
+
+class FsyncPolicy(str, Enum):
+    """디스크 동기화 수준"""
+    NONE = "none"  # OS 버퍼에 맡김 (가장 빠름, 전원 장애 시 빈 파일 가능)
+    FILE = "file"  # 파일 내용을 fsync한 뒤 교체
+    FULL = "full"  # 파일과 디렉토리 항목까지 fsync (교체 자체도 영속)
+
+
+def _fsync_directory(directory: Path) -> None:
+    """디렉토리 항목(rename 결과) 동기화 (지원하지 않는 플랫폼은 무시)"""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def atomic_write(
+    path: Union[str, Path],
+    chunks: Iterable[Union[str, bytes]],
+    fsync: Union[FsyncPolicy, str] = FsyncPolicy.FILE,
+    encoding: str = 'utf-8'
+) -> str:
+    """
+    조각들을 임시 파일에 쓴 뒤 대상 경로로 원자적으로 교체
+
+    Args:
+        path: 대상 파일 경로
+        chunks: 쓸 내용 (str은 encoding으로 인코딩)
+        fsync: 디스크 동기화 수준
+        encoding: str 조각 인코딩
+
+    Returns:
+        대상 파일 경로
+    """
+    path = Path(path)
+    policy = FsyncPolicy(fsync)
+
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            for chunk in chunks:
+                f.write(chunk.encode(encoding) if isinstance(chunk, str) else chunk)
+
+            if policy is not FsyncPolicy.NONE:
+                f.flush()
+                os.fsync(f.fileno())
+
+        # mkstemp는 소유자 전용(0600)으로 만들므로 일반 파일 권한으로 맞춤
+        os.chmod(tmp_name, 0o644)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+    if policy is FsyncPolicy.FULL:
+        _fsync_directory(path.parent)
+
+    return str(path)
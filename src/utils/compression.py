@@ -0,0 +1,138 @@
+"""
+압축 유틸리티: 내보내기 파일의 미리 압축한 사본(.gz, .br)과 Accept-Encoding 협상
+
+gzip은 표준 라이브러리(zlib)로 만들고, brotli 패키지가 설치되어 있으면 .br도 만듭니다.
+다운로드 응답은 요청마다 압축하지 않고 이 사본을 그대로 보냅니다.
+"""
+import zlib
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성
+    brotli = None
+
+
+# 지원 인코딩과 사본 확장자 (선호 순서)
+ENCODINGS = ('br', 'gzip')
+SUFFIXES = {'br': '.br', 'gzip': '.gz'}
+
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+
+
+def available_encodings() -> List[str]:
+    """이 환경에서 만들 수 있는 인코딩 (선호 순서)"""
+    return [encoding for encoding in ENCODINGS if encoding != 'br' or brotli is not None]
+
+
+def normalize_encodings(encodings: Iterable[str]) -> List[str]:
+    """설정된 인코딩 중 만들 수 있는 것만 선호 순서로 (알 수 없거나 설치되지 않은 것은 제외)"""
+    requested = {str(encoding).lower() for encoding in encodings or ()}
+    return [encoding for encoding in available_encodings() if encoding in requested]
+
+
+def sibling_path(path: Union[str, Path], encoding: str) -> Path:
+    """압축 사본 경로 (예: checklist.json → checklist.json.gz)"""
+    path = Path(path)
+    return path.with_name(path.name + SUFFIXES[encoding])
+
+
+def accepted_encodings(accept_encoding: str) -> Dict[str, float]:
+    """Accept-Encoding 헤더 파싱 ({인코딩: q값}, q=0은 거부)"""
+    accepted: Dict[str, float] = {}
+
+    for part in (accept_encoding or '').split(','):
+        name, _, params = part.strip().partition(';')
+        name = name.strip().lower()
+        if not name:
+            continue
+
+        quality = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name] = quality
+
+    return accepted
+
+
+def choose_encoding(accept_encoding: str, candidates: Sequence[str]) -> Optional[str]:
+    """
+    후보 중 클라이언트가 받는 인코딩 선택
+
+    Args:
+        accept_encoding: 요청의 Accept-Encoding 헤더
+        candidates: 보낼 수 있는 인코딩 (선호 순서)
+
+    Returns:
+        선택한 인코딩 (없으면 None, 원본 전송)
+    """
+    accepted = accepted_encodings(accept_encoding)
+    wildcard = accepted.get('*', 0.0)
+
+    best, best_quality = None, 0.0
+    for encoding in candidates:
+        quality = accepted.get(encoding, wildcard)
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+
+    return best
+
+
+class _GzipCompressor:
+    """gzip 형식 스트리밍 압축 (헤더 시각 0 → 같은 입력이면 같은 출력)"""
+
+    def __init__(self):
+        self._compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+
+    def process(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+def _compressor(encoding: str):
+    if encoding == 'gzip':
+        return _GzipCompressor()
+    return brotli.Compressor(quality=BROTLI_QUALITY)
+
+
+class Precompressor:
+    """원본 파일을 쓰는 동안 같은 내용을 함께 압축
+
+    wrap()으로 감싼 조각을 원본 쓰기에 넘기고, 다 쓴 뒤 finish()로 인코딩별
+    압축 결과를 받습니다. 원본을 한 번만 만들고 메모리에 통째로 올리지 않습니다.
+    """
+
+    def __init__(self, encodings: Iterable[str], text_encoding: str = 'utf-8'):
+        self.encodings = normalize_encodings(encodings)
+        self.text_encoding = text_encoding
+
+        self._compressors = {encoding: _compressor(encoding) for encoding in self.encodings}
+        self._outputs: Dict[str, List[bytes]] = {encoding: [] for encoding in self.encodings}
+
+    def wrap(self, chunks: Iterable[Union[str, bytes]]) -> Iterator[bytes]:
+        """조각을 그대로 넘기면서 압축기에도 전달"""
+        for chunk in chunks:
+            data = chunk.encode(self.text_encoding) if isinstance(chunk, str) else chunk
+
+            for encoding, compressor in self._compressors.items():
+                output = compressor.process(data)
+                if output:
+                    self._outputs[encoding].append(output)
+
+            yield data
+
+    def finish(self) -> Dict[str, bytes]:
+        """인코딩별 압축 결과"""
+        results = {}
+        for encoding, compressor in self._compressors.items():
+            self._outputs[encoding].append(compressor.finish())
+            results[encoding] = b''.join(self._outputs[encoding])
+        return results
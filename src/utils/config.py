@@ -35,10 +35,16 @@ class Config:
                 "output_dir": "output",
                 "max_results_per_source": 10,
                 "cache_duration_hours": 24,
+                "cache_enabled": True,
+                "cache_negative_ttl_minutes": 10,
+                "cache_max_size_mb": 50,
                 "web_search": {
                     "enabled": True,
                     "max_pages": 5,
-                    "timeout": 10
+                    "timeout": 10,
+                    "max_content_bytes": 1048576,
+                    "fetch_workers": 16,
+                    "fetch_per_domain": 4
                 },
                 "paper_search": {
                     "enabled": True,
@@ -50,6 +56,53 @@ class Config:
                 },
                 "api_search": {
                     "enabled": True
+                },
+                "parallel_collection": {
+                    "enabled": True,
+                    "max_workers": 8,
+                    "source_timeout": 15,
+                    "source_timeouts": {}
+                },
+                "http": {
+                    "pool_connections": 10,
+                    "pool_maxsize": 20,
+                    "max_retries": 0,
+                    "async_max_connections": 50,
+                    "async_max_keepalive_connections": 20,
+                    "keepalive_expiry": 30
+                },
+                "rate_limits": {
+                    "semantic_scholar": {"rate": 1.0, "burst": 1},
+                    "crossref": {"rate": 5.0, "burst": 5},
+                    "arxiv": {"rate": 0.34, "burst": 1},
+                    "github": {"rate": 0.5, "burst": 5},
+                    "npm": {"rate": 5.0, "burst": 5}
+                },
+                "rate_limit_max_wait": 30,
+                "relevance_ranking": {
+                    "method": "bm25",
+                    "k1": 1.5,
+                    "b": 0.75
+                },
+                "export": {
+                    "fsync": "file",
+                    "background": True,
+                    "precompress": ["gzip", "br"]
+                },
+                "generation": {
+                    "max_concurrent": 4,
+                    "max_queue": 16,
+                    "retry_after": 10
+                },
+                "jobs": {
+                    "workers": 2,
+                    "poll_interval": 1.0,
+                    "lease_seconds": 300,
+                    "max_attempts": 3
+                },
+                "dashboard": {
+                    "workers": 1,
+                    "gzip_minimum_size": 1000
                 }
             }
 
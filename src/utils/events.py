@@ -0,0 +1,267 @@
+"""
+진행 이벤트 모듈: 생성 과정의 단계·소스·파일 이벤트를 구독자에게 전달
+
+생성기와 수집기는 print 대신 event_bus로 구조화된 이벤트를 보내고, 출력 방식은
+구독자가 정합니다.
+- CLI: CliPrinter (기존 콘솔 출력 형식)
+- 서버: LogSubscriber + setup_queued_logging (QueueHandler로 요청 스레드에서 I/O 분리)
+- 작업 워커: 작업별 이벤트를 DB에 기록해 대시보드 SSE로 전달
+
+bind()로 묶은 문맥(job_id 등)은 contextvars로 전달되어 이벤트마다 함께 기록됩니다.
+"""
+import contextvars
+import logging
+import logging.handlers
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from enum import Enum
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+
+class EventType(str, Enum):
+    """이벤트 종류"""
+    STAGE_STARTED = "stage_started"      # 단계 시작 (generate, collecting, building, ...)
+    STAGE_FINISHED = "stage_finished"    # 단계 종료 (elapsed, status, 단계별 결과)
+    SOURCE_FINISHED = "source_finished"  # 리서치 소스 하나 완료 (count, elapsed, error)
+    ARTIFACT_WRITTEN = "artifact_written"  # 내보내기 파일 기록
+    WARNING = "warning"                  # 진행은 계속되는 오류·경고
+
+
+class Event:
+    """진행 이벤트"""
+
+    __slots__ = ('type', 'stage', 'data', 'context', 'timestamp')
+
+    def __init__(
+        self,
+        type: EventType,
+        stage: Optional[str] = None,
+        data: Dict[str, Any] = None,
+        context: Dict[str, Any] = None
+    ):
+        self.type = EventType(type)
+        self.stage = stage
+        self.data = data or {}
+        self.context = context or {}
+        self.timestamp = time.time()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'type': self.type.value,
+            'stage': self.stage,
+            'timestamp': self.timestamp,
+            **self.data
+        }
+
+    def __repr__(self) -> str:
+        return f"Event({self.type.value}, stage={self.stage!r}, data={self.data!r})"
+
+
+Subscriber = Callable[[Event], None]
+
+_context: contextvars.ContextVar = contextvars.ContextVar('event_context', default={})
+
+
+class EventBus:
+    """프로세스 단위 이벤트 버스
+
+    emit은 등록된 구독자를 호출한 스레드에서 바로 호출하므로, 구독자는 가볍게
+    유지하고 느린 I/O는 큐(setup_queued_logging)나 별도 저장소로 넘겨야 합니다.
+    구독자 예외는 생성 작업을 멈추지 않도록 무시합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers: List[Subscriber] = []
+
+    def subscribe(self, subscriber: Subscriber) -> Callable[[], None]:
+        """
+        구독자 등록
+
+        Returns:
+            등록 해제 함수
+        """
+        with self._lock:
+            self._subscribers = self._subscribers + [subscriber]
+
+        def unsubscribe() -> None:
+            with self._lock:
+                self._subscribers = [s for s in self._subscribers if s is not subscriber]
+
+        return unsubscribe
+
+    def emit(self, type: EventType, stage: str = None, **data) -> None:
+        """이벤트 전달 (구독자가 없으면 아무것도 하지 않음)"""
+        subscribers = self._subscribers
+        if not subscribers:
+            return
+
+        event = Event(type, stage, data, _context.get())
+        for subscriber in subscribers:
+            try:
+                subscriber(event)
+            except Exception:
+                logging.getLogger(__name__).exception("이벤트 구독자 오류")
+
+    def warning(self, message: str, stage: str = None, **data) -> None:
+        """경고 이벤트"""
+        self.emit(EventType.WARNING, stage, message=message, **data)
+
+    @contextmanager
+    def stage(self, name: str, **data) -> Iterator[Dict[str, Any]]:
+        """
+        단계 시작·종료 이벤트 (소요 시간, 성공 여부 포함)
+
+        with 블록 안에서 돌려받은 dict에 넣은 값은 종료 이벤트에 함께 기록됩니다.
+        """
+        self.emit(EventType.STAGE_STARTED, name, **data)
+
+        result: Dict[str, Any] = {}
+        started = time.monotonic()
+        try:
+            yield result
+        except Exception as e:
+            self.emit(
+                EventType.STAGE_FINISHED, name,
+                status='error', error=str(e),
+                elapsed=round(time.monotonic() - started, 3), **result
+            )
+            raise
+
+        self.emit(
+            EventType.STAGE_FINISHED, name,
+            status='completed', elapsed=round(time.monotonic() - started, 3), **result
+        )
+
+
+@contextmanager
+def bind(**context) -> Iterator[None]:
+    """이 블록(과 여기서 만든 asyncio 작업)에서 보내는 이벤트에 문맥 추가"""
+    token = _context.set({**_context.get(), **context})
+    try:
+        yield
+    finally:
+        _context.reset(token)
+
+
+def format_event(event: Event) -> Optional[str]:
+    """사람이 읽는 한 줄 (출력하지 않는 이벤트는 None)"""
+    data = event.data
+
+    if event.type is EventType.STAGE_STARTED:
+        if event.stage == 'generate':
+            return (
+                f"\n{'='*60}\n"
+                f"체크리스트 생성 시작: {data.get('keyword')}\n"
+                f"시설 유형: {data.get('facility_type')}, 점검 단계: {data.get('check_phase')}\n"
+                f"{'='*60}\n"
+            )
+        if event.stage == 'collecting':
+            mode = {'parallel': '병렬', 'async': '비동기'}.get(data.get('mode'))
+            if mode:
+                return f"📚 리서치 데이터 수집 중...\n\n  ⚡ {data.get('total')}개 소스 {mode} 수집..."
+            return "📚 리서치 데이터 수집 중...\n"
+        return None
+
+    if event.type is EventType.STAGE_FINISHED:
+        if event.stage == 'generate' and data.get('status') == 'completed':
+            return "\n✅ 체크리스트 생성 완료!\n"
+        if event.stage == 'collecting' and data.get('counts'):
+            return '\n'.join(
+                f"     ✓ {data_key}: {count} 건 수집"
+                for data_key, count in data['counts'].items()
+            )
+        if data.get('status') == 'error':
+            return f"  ⚠️  {event.stage} 실패: {data.get('error')}"
+        return None
+
+    if event.type is EventType.SOURCE_FINISHED:
+        if data.get('status') != 'completed':
+            return f"  ⚠️  {data.get('source')}: {data.get('status')} {data.get('error', '')}".rstrip()
+        return None
+
+    if event.type is EventType.ARTIFACT_WRITTEN:
+        label = {'markdown': 'Markdown', 'json': 'JSON'}.get(data.get('format'), data.get('format'))
+        return f"📄 {label} 파일 생성: {data.get('path')}"
+
+    if event.type is EventType.WARNING:
+        return f"  ⚠️  {data.get('message')}"
+
+    return None
+
+
+class CliPrinter:
+    """CLI 구독자: 이벤트를 콘솔에 출력"""
+
+    def __call__(self, event: Event) -> None:
+        line = format_event(event)
+        if line is not None:
+            print(line)
+
+
+class LogSubscriber:
+    """로그 구독자: 이벤트를 logging으로 전달 (경고는 WARNING, 나머지는 INFO)"""
+
+    def __init__(self, logger: logging.Logger = None):
+        self.logger = logger or logging.getLogger('checklist.events')
+
+    def __call__(self, event: Event) -> None:
+        line = format_event(event)
+        if line is None:
+            return
+
+        failed = (
+            event.type is EventType.WARNING
+            or event.data.get('status') in ('error', 'timeout')
+        )
+        # 여러 줄 출력은 구분선을 빼고 한 줄로
+        message = ' | '.join(
+            part.strip() for part in line.splitlines() if part.strip().strip('=')
+        )
+        context = ' '.join(f"{key}={value}" for key, value in event.context.items())
+        self.logger.log(
+            logging.WARNING if failed else logging.INFO,
+            f"[{context}] {message}" if context else message
+        )
+
+
+def setup_queued_logging(
+    logger_name: str = 'checklist',
+    level: int = logging.INFO,
+    handler: logging.Handler = None
+) -> logging.handlers.QueueListener:
+    """
+    로거 출력을 큐로 넘기고 별도 스레드에서 기록 (호출 스레드는 큐에 넣기만 함)
+
+    Args:
+        logger_name: 대상 로거 이름
+        level: 로그 수준
+        handler: 실제 출력 핸들러 (기본: stderr)
+
+    Returns:
+        시작된 QueueListener (종료 시 stop() 호출)
+    """
+    if handler is None:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(message)s'))
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+
+    logger = logging.getLogger(logger_name)
+    logger.setLevel(level)
+    # 다시 설정하면 이전 큐 핸들러를 교체 (앱 재시작, 테스트)
+    for existing in list(logger.handlers):
+        if isinstance(existing, logging.handlers.QueueHandler):
+            logger.removeHandler(existing)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.propagate = False
+
+    listener = logging.handlers.QueueListener(log_queue, handler, respect_handler_level=True)
+    listener.start()
+    return listener
+
+
+# 전역 이벤트 버스
+event_bus = EventBus()
@@ -0,0 +1,86 @@
+"""
+JSON 직렬화 모듈: orjson이 설치되어 있으면 사용하고, 없으면 표준 json으로 대체
+
+- 저장용(compact): DB 컬럼, 캐시 페이로드처럼 사람이 읽지 않는 곳 (공백 없는 구분자)
+- 출력용(pretty): 내보내기 파일처럼 사람이 읽는 곳 (2칸 들여쓰기)
+
+두 백엔드 모두 한글을 이스케이프하지 않고(ensure_ascii=False와 같음), to_dict()를
+제공하는 모델 객체는 dict로 바꿔 저장합니다. 읽기(loads)는 str과 bytes를 모두 받으며
+어느 백엔드로 쓴 데이터든 같은 결과를 돌려줍니다.
+"""
+import json
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 시 표준 json 사용
+    orjson = None
+
+
+# 사용 중인 백엔드 이름
+BACKEND = 'orjson' if orjson is not None else 'json'
+
+_COMPACT_SEPARATORS = (',', ':')
+
+
+def is_fast_backend() -> bool:
+    """orjson 사용 여부"""
+    return orjson is not None
+
+
+def to_serializable(obj: Any) -> Any:
+    """기본 직렬화 대상이 아닌 객체 변환 (to_dict 제공 객체 → dict)"""
+    to_dict = getattr(obj, 'to_dict', None)
+    if to_dict is not None:
+        return to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps_bytes(
+    obj: Any,
+    pretty: bool = False,
+    default: Optional[Callable[[Any], Any]] = to_serializable
+) -> bytes:
+    """
+    UTF-8 JSON 바이트로 직렬화 (파일에 그대로 쓸 때 사용)
+
+    Args:
+        obj: 직렬화할 객체
+        pretty: True면 2칸 들여쓰기, False면 공백 없는 저장용 형식
+        default: 기본 지원하지 않는 객체 변환 함수
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=default, option=option)
+
+    return _stdlib_dumps(obj, pretty, default).encode('utf-8')
+
+
+def dumps(
+    obj: Any,
+    pretty: bool = False,
+    default: Optional[Callable[[Any], Any]] = to_serializable
+) -> str:
+    """JSON 문자열로 직렬화 (SQLite TEXT 컬럼 등 문자열이 필요한 곳에서 사용)"""
+    if orjson is not None:
+        return dumps_bytes(obj, pretty, default).decode('utf-8')
+
+    return _stdlib_dumps(obj, pretty, default)
+
+
+def loads(data: Union[str, bytes, bytearray, memoryview]) -> Any:
+    """JSON 문자열 또는 바이트 역직렬화"""
+    if orjson is not None:
+        return orjson.loads(data)
+
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def _stdlib_dumps(obj: Any, pretty: bool, default: Optional[Callable[[Any], Any]]) -> str:
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False, default=default)
+    return json.dumps(obj, separators=_COMPACT_SEPARATORS, ensure_ascii=False, default=default)